@@ -6,13 +6,11 @@ Clean rebuild with simplified architecture:
 - Active meter filtering
 """
 
-import asyncio
 import logging
 import secrets
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
-import aiohttp
 import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.components.recorder.models import (
@@ -23,33 +21,75 @@ from homeassistant.components.recorder.statistics import async_import_statistics
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from .api import (
     EnergaAPI,
-    EnergaAuthError,
-    EnergaConnectionError,
-    EnergaTokenExpiredError,
+    EnergaCircuitOpenError,
+    EnergaQuotaExceededError,
+    request_priority,
 )
+from .budget import RequestBudget
+from .chart_cache import STORAGE_VERSION as CHART_CACHE_STORAGE_VERSION
+from .chart_cache import EnergaChartCache
 from .const import (
+    CONF_DAILY_REQUEST_QUOTA,
     CONF_DEVICE_TOKEN,
+    CONF_FETCH_CONCURRENCY,
+    CONF_LOOP_BLOCK_THRESHOLD,
     CONF_PASSWORD,
+    CONF_REQUEST_BURST,
+    CONF_REQUEST_RATE,
     CONF_USERNAME,
+    DEFAULT_DAILY_REQUEST_QUOTA,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_LOOP_BLOCK_THRESHOLD,
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUEST_RATE,
     DOMAIN,
     MAX_HOURLY_KWH,
+    PRIORITY_BACKFILL,
     get_price_for_key,
 )
+from .loop_monitor import LoopBlockMonitor
+from .profiling import ProfilerBusyError, async_profile_jobs
+from .snapshot import STORAGE_VERSION as SNAPSHOT_STORAGE_VERSION
+from .snapshot import EnergaSnapshot
+from .telemetry import HttpTelemetry
+from .transport import TransportProfile, create_client_session
+from .watermarks import STORAGE_VERSION as WATERMARKS_STORAGE_VERSION
+from .watermarks import StatisticsWatermarks
 
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS = ["sensor"]
+API_STATE_STORAGE_VERSION = 1
 TIMEZONE = ZoneInfo("Europe/Warsaw")
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Energa My Meter from config entry."""
-    # Use dedicated session to avoid clearing cookies on the shared HA session
-    session = aiohttp.ClientSession()
+    # Use dedicated session to avoid clearing cookies on the shared HA session;
+    # every session the API (re)creates uses the same transport profile and
+    # reports to the same per-endpoint telemetry
+    transport = TransportProfile.from_options(entry.options)
+    telemetry = HttpTelemetry()
+
+    def _new_session():
+        return create_client_session(
+            transport, trace_configs=[telemetry.trace_config()]
+        )
+
+    session = _new_session()
+
+    # Closed-day chart responses survive restarts (re-imports are nearly free)
+    chart_cache = EnergaChartCache(
+        Store(hass, CHART_CACHE_STORAGE_VERSION, _chart_cache_key(entry))
+    )
+    await chart_cache.async_load()
+
+    # Session cookies/token survive restarts (skips login when still valid)
+    state_store = Store(hass, API_STATE_STORAGE_VERSION, _api_state_key(entry))
 
     # Get device token from config (may not exist in old installations)
     device_token = entry.data.get(CONF_DEVICE_TOKEN) or secrets.token_hex(32)
@@ -58,39 +98,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data[CONF_PASSWORD],
         device_token,
         session,
-        create_session_fn=lambda: aiohttp.ClientSession(),
+        create_session_fn=_new_session,
+        fetch_concurrency=entry.options.get(
+            CONF_FETCH_CONCURRENCY, DEFAULT_FETCH_CONCURRENCY
+        ),
+        chart_cache=chart_cache,
+        state_store=state_store,
+        request_rate=entry.options.get(CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE),
+        request_burst=entry.options.get(CONF_REQUEST_BURST, DEFAULT_REQUEST_BURST),
+        request_timeout=transport.request_timeout,
+        telemetry=telemetry,
+        loop_monitor=LoopBlockMonitor(
+            entry.options.get(
+                CONF_LOOP_BLOCK_THRESHOLD, DEFAULT_LOOP_BLOCK_THRESHOLD
+            )
+        ),
+        request_budget=RequestBudget(
+            entry.options.get(CONF_DAILY_REQUEST_QUOTA, DEFAULT_DAILY_REQUEST_QUOTA)
+        ),
     )
 
-    # Login to API (with timeout to prevent blocking HA startup)
-    try:
-        await asyncio.wait_for(api.async_login(), timeout=30)
-    except asyncio.TimeoutError:
-        _LOGGER.warning("Login timed out after 30s — Energa API may be down")
-        await session.close()
-        raise ConfigEntryNotReady("Login timeout — API nie odpowiada") from None
-    except EnergaAuthError as err:
-        await session.close()
-        raise ConfigEntryAuthFailed(err) from err
-    except EnergaTokenExpiredError:
-        _LOGGER.debug("Token expired during setup, retrying login")
+    hass.data.setdefault(DOMAIN, {})
+
+    # Set hass reference for statistics queries
+    api.set_hass(hass)
+
+    # Login happens in the coordinator's first update, not here
+    from .sensor import EnergaCoordinator
+
+    # Where each statistic ends survives restarts (no recorder reads)
+    watermarks = StatisticsWatermarks(
+        Store(hass, WATERMARKS_STORAGE_VERSION, _watermarks_key(entry))
+    )
+    await watermarks.async_load()
+
+    coordinator = EnergaCoordinator(
+        hass,
+        api,
+        entry,
+        snapshot=EnergaSnapshot(
+            Store(hass, SNAPSHOT_STORAGE_VERSION, _snapshot_key(entry))
+        ),
+        watermarks=watermarks,
+    )
+
+    # Entities are created from the last snapshot so HA startup doesn't wait
+    # on Energa; without one (first setup) the meter list must be fetched now
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
         try:
-            await asyncio.wait_for(api.async_login(), timeout=30)
-        except asyncio.TimeoutError:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
             await session.close()
-            raise ConfigEntryNotReady("Login retry timeout") from None
-        except EnergaAuthError as err:
-            await session.close()
-            raise ConfigEntryAuthFailed(err) from err
-        except EnergaConnectionError as err:
-            await session.close()
-            raise ConfigEntryNotReady(err) from err
-    except EnergaConnectionError as err:
-        await session.close()
-        raise ConfigEntryNotReady(err) from err
+            raise
 
     # Store API instance
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {"api": api, "session": session}
+    hass.data[DOMAIN][entry.entry_id] = {
+        "api": api,
+        "session": session,
+        "coordinator": coordinator,
+    }
 
     # Close session when HA shuts down
     async def _close_session(_event):
@@ -100,12 +167,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _close_session)
     )
 
-    # Set hass reference for statistics queries
-    api.set_hass(hass)
-
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if restored:
+        # Login + first refresh run after entities exist (they import stats)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_first_refresh"
+        )
+
     # Register fetch_history service
     async def fetch_history_service(call: ServiceCall) -> None:
         """Service to manually fetch historical data."""
@@ -126,9 +196,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
             return
 
-        # Get fresh meter data
+        # Get fresh meter data (part of the import: backfill priority)
         try:
-            meters = await api.async_get_data(force_refresh=True)
+            with request_priority(PRIORITY_BACKFILL):
+                meters = await api.async_get_data(force_refresh=True)
         except Exception as err:
             _LOGGER.error("Failed to fetch meter data: %s", err)
             persistent_notification.async_create(
@@ -172,6 +243,55 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         ),
     )
 
+    # Register profile_cycle service: a refresh of every entry (and optionally
+    # a history import) under cProfile
+    async def profile_cycle_service(call: ServiceCall) -> None:
+        """Service to profile a coordinator refresh and its statistics imports."""
+        jobs = [
+            data["coordinator"].async_refresh
+            for data in hass.data[DOMAIN].values()
+            if isinstance(data, dict) and "coordinator" in data
+        ]
+        if "start_date" in call.data:
+            history = {
+                "start_date": call.data["start_date"],
+                "days": call.data.get("days", 30),
+            }
+            jobs.append(
+                lambda: hass.services.async_call(
+                    DOMAIN, "fetch_history", history, blocking=True
+                )
+            )
+        try:
+            base, elapsed = await async_profile_jobs(hass, jobs)
+        except ProfilerBusyError:
+            persistent_notification.async_create(
+                hass,
+                "Profilowanie już trwa — poczekaj na jego zakończenie.",
+                title="Energa: Profilowanie",
+                notification_id="energa_profile",
+            )
+            return
+        persistent_notification.async_create(
+            hass,
+            f"Profilowanie trwało {elapsed:.1f} s. Profil zapisano w "
+            f"`{base}.prof` (podsumowanie: `{base}.txt`).",
+            title="Energa: Profilowanie",
+            notification_id="energa_profile",
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        "profile_cycle",
+        profile_cycle_service,
+        schema=vol.Schema(
+            {
+                vol.Optional("start_date"): str,
+                vol.Optional("days", default=30): int,
+            }
+        ),
+    )
+
     # Reload integration when options change (e.g. prices updated)
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
@@ -183,15 +303,52 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         entry_data = hass.data[DOMAIN].pop(entry.entry_id)
-        # Close dedicated session
+        # Persist session for the next setup, then close dedicated session
+        if isinstance(entry_data, dict) and "api" in entry_data:
+            await entry_data["api"].async_save_state()
+        if isinstance(entry_data, dict) and "coordinator" in entry_data:
+            await entry_data["coordinator"].watermarks.async_save()
         if isinstance(entry_data, dict) and "session" in entry_data:
             await entry_data["session"].close()
         # Unregister service if no more entries remain
         if not hass.data[DOMAIN]:
             hass.services.async_remove(DOMAIN, "fetch_history")
+            hass.services.async_remove(DOMAIN, "profile_cycle")
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when the config entry is deleted."""
+    await Store(
+        hass, CHART_CACHE_STORAGE_VERSION, _chart_cache_key(entry)
+    ).async_remove()
+    await Store(hass, API_STATE_STORAGE_VERSION, _api_state_key(entry)).async_remove()
+    await Store(hass, SNAPSHOT_STORAGE_VERSION, _snapshot_key(entry)).async_remove()
+    await Store(
+        hass, WATERMARKS_STORAGE_VERSION, _watermarks_key(entry)
+    ).async_remove()
+
+
+def _chart_cache_key(entry: ConfigEntry) -> str:
+    """Storage key for the per-entry chart cache."""
+    return f"{DOMAIN}.{entry.entry_id}.chart_cache"
+
+
+def _api_state_key(entry: ConfigEntry) -> str:
+    """Storage key for the per-entry API session state."""
+    return f"{DOMAIN}.{entry.entry_id}.api_state"
+
+
+def _snapshot_key(entry: ConfigEntry) -> str:
+    """Storage key for the per-entry coordinator snapshot."""
+    return f"{DOMAIN}.{entry.entry_id}.snapshot"
+
+
+def _watermarks_key(entry: ConfigEntry) -> str:
+    """Storage key for the per-entry statistics watermarks."""
+    return f"{DOMAIN}.{entry.entry_id}.watermarks"
+
+
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload integration when options are updated."""
     _LOGGER.debug("Options updated, reloading: %s", list(entry.options.keys()))
@@ -214,6 +371,13 @@ async def _import_meter_history(
     meter_id = meter.get("meter_serial", meter_point_id)
     serial = meter_id
     has_zones = meter.get("zone_count", 1) > 1
+    # Rewritten series lose their watermark (re-read from the recorder)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    watermarks = (
+        entry_data["coordinator"].watermarks
+        if isinstance(entry_data, dict) and "coordinator" in entry_data
+        else None
+    )
 
     _LOGGER.info(
         "Starting history import for meter %s (%d days from %s, zones=%s)",
@@ -241,99 +405,21 @@ async def _import_meter_history(
         export_1_points = []
         export_2_points = []
 
+        target_days = []
         for day_offset in range(days):
             target_day = (start_date + timedelta(days=day_offset)).replace(
                 tzinfo=TIMEZONE
             )
             if target_day.date() > datetime.now(TIMEZONE).date():
                 break
-
-            # Rate limiting
-            await asyncio.sleep(0.5)
-
-            try:
-                day_data = await api.async_get_history_hourly(
-                    meter_point_id, target_day, include_timestamps=True
-                )
-            except Exception as err:
-                _LOGGER.warning("Failed to fetch day %s: %s", target_day.date(), err)
-                continue
-
-            # Process import data (total) — use API timestamps (#26)
-            for item in day_data.get("import", []):
-                if isinstance(item, (list, tuple)):
-                    hourly_value, tm_ms = item
-                else:
-                    continue
-                if hourly_value is not None and hourly_value >= 0:
-                    hour_dt = dt_util.as_utc(
-                        datetime.fromtimestamp(tm_ms / 1000, tz=TIMEZONE)
-                    )
-                    import_points.append({"dt": hour_dt, "value": hourly_value})
-
-            if has_zones:
-                for item in day_data.get("import_1", []):
-                    if isinstance(item, (list, tuple)):
-                        hourly_value, tm_ms = item
-                    else:
-                        continue
-                    if hourly_value is not None and hourly_value >= 0:
-                        hour_dt = dt_util.as_utc(
-                            datetime.fromtimestamp(tm_ms / 1000, tz=TIMEZONE)
-                        )
-                        import_1_points.append({"dt": hour_dt, "value": hourly_value})
-
-                for item in day_data.get("import_2", []):
-                    if isinstance(item, (list, tuple)):
-                        hourly_value, tm_ms = item
-                    else:
-                        continue
-                    if hourly_value is not None and hourly_value >= 0:
-                        hour_dt = dt_util.as_utc(
-                            datetime.fromtimestamp(tm_ms / 1000, tz=TIMEZONE)
-                        )
-                        import_2_points.append({"dt": hour_dt, "value": hourly_value})
-
-            # Process export data — use API timestamps (#26)
-            for item in day_data.get("export", []):
-                if isinstance(item, (list, tuple)):
-                    hourly_value, tm_ms = item
-                else:
-                    continue
-                if hourly_value is not None and hourly_value >= 0:
-                    hour_dt = dt_util.as_utc(
-                        datetime.fromtimestamp(tm_ms / 1000, tz=TIMEZONE)
-                    )
-                    export_points.append({"dt": hour_dt, "value": hourly_value})
-
-            # Process zone-specific export data
-            if has_zones:
-                for item in day_data.get("export_1", []):
-                    if isinstance(item, (list, tuple)):
-                        hourly_value, tm_ms = item
-                    else:
-                        continue
-                    if hourly_value is not None and hourly_value >= 0:
-                        hour_dt = dt_util.as_utc(
-                            datetime.fromtimestamp(tm_ms / 1000, tz=TIMEZONE)
-                        )
-                        export_1_points.append({"dt": hour_dt, "value": hourly_value})
-
-                for item in day_data.get("export_2", []):
-                    if isinstance(item, (list, tuple)):
-                        hourly_value, tm_ms = item
-                    else:
-                        continue
-                    if hourly_value is not None and hourly_value >= 0:
-                        hour_dt = dt_util.as_utc(
-                            datetime.fromtimestamp(tm_ms / 1000, tz=TIMEZONE)
-                        )
-                        export_2_points.append({"dt": hour_dt, "value": hourly_value})
+            target_days.append(target_day)
 
         # Extend import to today to prevent sum discontinuity with live stats.
         # Without this, partial imports (e.g., from March 1) create a gap:
         # import ends with sum=45, but coordinator already wrote today's stats
         # starting from sum=0, causing a spike in the Energy Panel.
+        # The extra days go through the same loop: backfill priority, quota,
+        # job accounting, and no days after a stop.
         last_imported = start_date + timedelta(days=days - 1)
         today = datetime.now(TIMEZONE)
         if last_imported.date() < today.date():
@@ -343,23 +429,70 @@ async def _import_meter_history(
                 "Extending import to today (+%d extra days) for sum continuity",
                 extra_days,
             )
-            for extra_offset in range(extra_days):
-                target_day = (extra_start + timedelta(days=extra_offset)).replace(
-                    tzinfo=TIMEZONE
-                )
-                if target_day.date() > today.date():
-                    break
-
-                await asyncio.sleep(0.5)
+            target_days.extend(
+                (extra_start + timedelta(days=extra_offset)).replace(tzinfo=TIMEZONE)
+                for extra_offset in range(extra_days)
+            )
 
+        # Days are fetched ahead concurrently, processed in order
+        prefetcher = api.history_prefetcher(meter_point_id, target_days)
+        # Requests of this import (prefetch tasks included) count as one job
+        budget = api.request_budget
+        job = budget.new_job("backfill", str(serial))
+        stopped = False
+        try:
+            for target_day in target_days:
                 try:
-                    day_data = await api.async_get_history_hourly(
-                        meter_point_id, target_day, include_timestamps=True
+                    # Backfill yields to the coordinator's live requests
+                    with request_priority(PRIORITY_BACKFILL), budget.track(job):
+                        day_data = await prefetcher.get(target_day)
+                except EnergaQuotaExceededError as err:
+                    # Daily quota spent: the whole import waits for tomorrow
+                    _LOGGER.warning(
+                        "Stopping history import of %s at %s, nothing imported: %s",
+                        serial,
+                        target_day.date(),
+                        err,
+                    )
+                    prefetcher.cancel()
+                    persistent_notification.async_create(
+                        hass,
+                        f"Dzienny limit zapytań API ({budget.daily_quota}) wyczerpany.\n"
+                        f"Import licznika {serial} przerwany na dniu "
+                        f"{target_day.date()}, statystyki nie zostały zmienione.\n"
+                        f"Uruchom go ponownie jutro od {start_date.date()} — "
+                        "pobrane już dni zostaną odczytane z pamięci podręcznej.",
+                        title="Energa: Limit zapytań",
+                        notification_id=f"energa_import_{meter_id}",
+                    )
+                    stopped = True
+                    break
+                except EnergaCircuitOpenError as err:
+                    # Backend is down: stop instead of failing every remaining day
+                    _LOGGER.warning(
+                        "Stopping history import of %s at %s, nothing imported: %s",
+                        serial,
+                        target_day.date(),
+                        err,
                     )
+                    prefetcher.cancel()
+                    persistent_notification.async_create(
+                        hass,
+                        f"API Energa jest niedostępne. Import licznika {serial} "
+                        f"przerwany na dniu {target_day.date()}, statystyki nie "
+                        "zostały zmienione.\n"
+                        f"Uruchom ponownie cały import od {start_date.date()} "
+                        "później.",
+                        title="Energa: Import przerwany",
+                        notification_id=f"energa_import_{meter_id}",
+                    )
+                    stopped = True
+                    break
                 except Exception as err:
-                    _LOGGER.warning("Failed to fetch extra day %s: %s", target_day.date(), err)
+                    _LOGGER.warning("Failed to fetch day %s: %s", target_day.date(), err)
                     continue
 
+                # Process import data (total) — use API timestamps (#26)
                 for item in day_data.get("import", []):
                     if isinstance(item, (list, tuple)):
                         hourly_value, tm_ms = item
@@ -394,6 +527,7 @@ async def _import_meter_history(
                             )
                             import_2_points.append({"dt": hour_dt, "value": hourly_value})
 
+                # Process export data — use API timestamps (#26)
                 for item in day_data.get("export", []):
                     if isinstance(item, (list, tuple)):
                         hourly_value, tm_ms = item
@@ -405,6 +539,7 @@ async def _import_meter_history(
                         )
                         export_points.append({"dt": hour_dt, "value": hourly_value})
 
+                # Process zone-specific export data
                 if has_zones:
                     for item in day_data.get("export_1", []):
                         if isinstance(item, (list, tuple)):
@@ -427,10 +562,20 @@ async def _import_meter_history(
                                 datetime.fromtimestamp(tm_ms / 1000, tz=TIMEZONE)
                             )
                             export_2_points.append({"dt": hour_dt, "value": hourly_value})
+        finally:
+            budget.finish_job(job)
+
+        if stopped:
+            # Imported sums restart from 0 at the first hour and must run
+            # up to today to meet the live rows; a truncated range would
+            # leave a jump where it ends, so nothing is written
+            return
 
         _LOGGER.info(
-            "Collected data for meter %s: %d import, %d export%s",
+            "Collected data for meter %s with %d API requests: "
+            "%d import, %d export%s",
             serial,
+            job.requests,
             len(import_points),
             len(export_points),
             (
@@ -443,6 +588,17 @@ async def _import_meter_history(
 
         def build_statistics(
             points: list, entity_suffix: str, entry: ConfigEntry
+        ) -> int:
+            with api.loop_monitor.measure(
+                "history_statistics",
+                meter=serial,
+                series=entity_suffix,
+                points=len(points),
+            ):
+                return _build_statistics(points, entity_suffix, entry)
+
+        def _build_statistics(
+            points: list, entity_suffix: str, entry: ConfigEntry
         ) -> int:
             if not points:
                 return 0
@@ -566,6 +722,8 @@ async def _import_meter_history(
                 cost_entity_id,
                 price,
             )
+            if watermarks is not None:
+                watermarks.invalidate([entity_id])
 
             return len(statistics)
 
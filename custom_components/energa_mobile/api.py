@@ -2,22 +2,67 @@
 
 import asyncio
 import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+from http.cookies import SimpleCookie
 from zoneinfo import ZoneInfo
 
 import aiohttp
+from yarl import URL
 
+from .budget import RequestBudget
 from .const import (
+    API_STATE_SAVE_DELAY,
     BASE_URL,
     CHART_ENDPOINT,
     DATA_ENDPOINT,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUEST_RATE,
+    DEFAULT_REQUEST_TIMEOUT,
+    ENDPOINT_TIMEOUTS,
     HEADERS,
+    HTTP_CONNECT_TIMEOUT,
     LOGIN_ENDPOINT,
+    PRIORITY_LIVE,
     SESSION_ENDPOINT,
 )
+from .loop_monitor import LoopBlockMonitor
+from .telemetry import HttpTelemetry
+from .throttle import (
+    RETRYABLE_STATUSES,
+    AdaptiveConcurrency,
+    CircuitBreaker,
+    RetryPolicy,
+    TokenBucket,
+)
+from .transport import create_client_session
 
 _LOGGER = logging.getLogger(__name__)
 
+# Scheduling priority of API requests made by the current task and the
+# tasks it spawns; set with request_priority()
+_REQUEST_PRIORITY: ContextVar[int] = ContextVar(
+    "energa_request_priority", default=PRIORITY_LIVE
+)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """Run the block's API requests at ``priority`` (e.g. PRIORITY_BACKFILL)."""
+    token = _REQUEST_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _REQUEST_PRIORITY.reset(token)
+
+
+def _published_sum(values: list) -> float:
+    """Sum of a chart series, skipping hours not published yet (None)."""
+    return sum(v for v in values if v is not None)
+
 
 class EnergaAuthError(Exception):
     pass
@@ -31,6 +76,18 @@ class EnergaTokenExpiredError(Exception):
     pass
 
 
+class EnergaDeadlineExceeded(EnergaConnectionError):
+    """The caller's deadline ran out before the request could complete."""
+
+
+class EnergaCircuitOpenError(EnergaConnectionError):
+    """Request refused without sending: the backend is considered down."""
+
+
+class EnergaQuotaExceededError(EnergaConnectionError):
+    """Backfill request refused: the daily request quota is spent."""
+
+
 class EnergaAPI:
     def __init__(
         self,
@@ -39,17 +96,75 @@ class EnergaAPI:
         device_token: str,
         session: aiohttp.ClientSession,
         create_session_fn=None,
+        fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        chart_cache=None,
+        state_store=None,
+        request_rate: float = DEFAULT_REQUEST_RATE,
+        request_burst: int = DEFAULT_REQUEST_BURST,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        telemetry: HttpTelemetry | None = None,
+        loop_monitor: LoopBlockMonitor | None = None,
+        request_budget: RequestBudget | None = None,
     ):
         self._username = username
         self._password = password
         self._device_token = device_token  # Unique per-installation token
         self._session = session
-        self._create_session_fn = create_session_fn or (lambda: aiohttp.ClientSession())
+        # Filled by the session's trace hooks; retries are added here
+        self._telemetry = telemetry or HttpTelemetry()
+        self._loop_monitor = loop_monitor or LoopBlockMonitor()  # Off by default
+        # Requests per day / cycle / backfill; optional daily quota
+        self._budget = request_budget or RequestBudget()
+        # Today's count must survive a restart or crash, not only an unload
+        self._budget.on_change = self._on_budget_change
+        self._create_session_fn = create_session_fn or (
+            lambda: create_client_session(
+                trace_configs=[self._telemetry.trace_config()]
+            )
+        )
         self._token = None  # Server-returned token (may be empty in newer API)
         self._meters_data = []
         self._hass = None  # Reference to HA instance for statistics queries
         self._api_warning = None  # Last non-null warning from API
         self._api_error = None  # Last non-null error from API
+        self._fetch_concurrency = max(1, int(fetch_concurrency))  # In-flight days
+        self._chart_cache = chart_cache  # EnergaChartCache (optional)
+        self._state_store = state_store  # HA Store for session persistence
+        self._state_save_due = 0.0  # Monotonic time the pending write runs
+        # One limiter for every HTTP request of this account (coordinator,
+        # fetch_history, options-flow import) instead of ad-hoc sleeps
+        self._rate_limiter = TokenBucket(request_rate, request_burst)
+        self._retry_policy = RetryPolicy()  # 429 / 5xx / dropped connections
+        self._circuit = CircuitBreaker()  # Fail fast while Energa is down
+        # In-flight chart requests, learned from latency/pushback (AIMD);
+        # fetch_concurrency is the ceiling
+        self._chart_limiter = AdaptiveConcurrency(self._fetch_concurrency)
+        self._saved_chart_limit = self._chart_limiter.limit
+        self._request_timeout = float(request_timeout)  # Ceiling per request
+        self._inflight: dict[tuple, asyncio.Future] = {}  # Single-flight requests
+        # One re-login per expiry event; generation bumps on every login
+        self._login_lock = asyncio.Lock()
+        self._login_generation = 0
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._circuit
+
+    @property
+    def chart_limiter(self) -> AdaptiveConcurrency:
+        return self._chart_limiter
+
+    @property
+    def telemetry(self) -> HttpTelemetry:
+        return self._telemetry
+
+    @property
+    def loop_monitor(self) -> LoopBlockMonitor:
+        return self._loop_monitor
+
+    @property
+    def request_budget(self) -> RequestBudget:
+        return self._budget
 
     def set_hass(self, hass):
         """Set Home Assistant instance reference for database queries."""
@@ -60,13 +175,42 @@ class EnergaAPI:
         return any(m.get("zone_count", 1) > 1 for m in self._meters_data)
 
     async def async_login(self) -> bool:
+        async with self._login_lock:
+            return await self._async_login_locked()
+
+    async def _async_relogin(self, seen_generation: int) -> None:
+        """Re-login once per session expiry event.
+
+        Concurrent requests that hit an expired (or closed) session all
+        land here with the login generation they used. Only the first one
+        logs in; the others wait on the lock, see that the generation has
+        moved on and simply retry with the fresh session.
+        """
+        async with self._login_lock:
+            if (
+                self._login_generation != seen_generation
+                and not self._session.closed
+            ):
+                _LOGGER.debug("Session already refreshed by a concurrent request")
+                return
+            await self._async_login_locked()
+
+    async def _async_login_locked(self) -> bool:
+        """Log in; caller must hold _login_lock."""
         try:
+            if self._session.closed:
+                self._session = self._create_session_fn()
+
             # Clear old cookies/session state before re-login
             self._session.cookie_jar.clear()
             self._token = None
             _LOGGER.debug("Cleared session cookies, attempting fresh login")
 
-            await self._api_get(SESSION_ENDPOINT)
+            # Not via _api_get: a 401 here must not re-enter the login lock.
+            # Login unblocks every waiting caller, so it always goes first.
+            await self._api_request(
+                SESSION_ENDPOINT, relogin=False, priority=PRIORITY_LIVE
+            )
             # Use persistent device token from config (generated during installation)
             params = {
                 "clientOS": "ios",
@@ -75,8 +219,13 @@ class EnergaAPI:
                 "password": self._password,
                 "token": self._device_token,
             }
+            await self._rate_limiter.acquire(PRIORITY_LIVE)
+            self._budget.record()
             async with self._session.get(
-                f"{BASE_URL}{LOGIN_ENDPOINT}", headers=HEADERS, params=params
+                f"{BASE_URL}{LOGIN_ENDPOINT}",
+                headers=HEADERS,
+                params=params,
+                timeout=self._request_timeout_for(LOGIN_ENDPOINT),
             ) as resp:
                 if resp.status != 200:
                     raise EnergaConnectionError(f"Login HTTP {resp.status}")
@@ -102,21 +251,121 @@ class EnergaAPI:
                 self._token = data.get("token") or (data.get("response") or {}).get(
                     "token"
                 )
+                self._login_generation += 1
                 _LOGGER.info(
                     "Login successful. Token received: %s, Cookies: %d",
                     bool(self._token),
                     len(self._session.cookie_jar),
                 )
+                self._schedule_state_save()
                 return True
         except aiohttp.ClientError as err:
             _LOGGER.error("Login network error: %s", err)
             raise EnergaConnectionError from err
+        except TimeoutError as err:
+            raise EnergaConnectionError("Login timeout") from err
+
+    async def async_resume_session(self) -> bool:
+        """Reuse the persisted session, logging in only if it is rejected.
+
+        Restores saved cookies/token and probes the data endpoint (the
+        meter list is needed right after setup anyway). A 401/403 there
+        triggers the normal re-login path inside _api_request.
+
+        Returns:
+            True if the saved session was accepted, False if a full
+            login was performed instead.
+        """
+        if not await self._async_restore_state():
+            await self.async_login()
+            return False
+        generation = self._login_generation
+        try:
+            self._meters_data = await self._fetch_all_meters()
+        except EnergaConnectionError as err:
+            # e.g. 200 with empty response for a dead session
+            _LOGGER.debug("Saved session rejected (%s), logging in", err)
+            await self.async_login()
+            return False
+        if self._login_generation != generation:
+            # 401/403 on user/data: _api_request already logged in again
+            _LOGGER.info("Saved Energa session rejected, logged in again")
+            return False
+        _LOGGER.info(
+            "Resumed saved Energa session (generation %d)", self._login_generation
+        )
+        return True
+
+    def export_state(self) -> dict:
+        """Return persistable API state: session, chart concurrency, request counts."""
+        return {
+            "session": {
+                "token": self._token,
+                "cookies": [
+                    {"name": m.key, "value": m.value, "path": m["path"] or "/"}
+                    for m in self._session.cookie_jar
+                ],
+            },
+            "chart_concurrency": self._chart_limiter.limit,
+            "request_budget": self._budget.export(),
+        }
 
-    async def async_get_data(self, force_refresh: bool = False) -> list[dict]:
+    async def _async_restore_state(self) -> bool:
+        """Load persisted session into the cookie jar; True if restored."""
+        if self._state_store is None:
+            return False
+        try:
+            state = await self._state_store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not load saved Energa session: %s", err)
+            return False
+        if isinstance((state or {}).get("chart_concurrency"), (int, float)):
+            self._chart_limiter.restore(state["chart_concurrency"])
+            self._saved_chart_limit = self._chart_limiter.limit
+        if isinstance((state or {}).get("request_budget"), dict):
+            self._budget.restore(state["request_budget"])
+        session = (state or {}).get("session") or {}
+        if not session.get("cookies"):
+            return False
+
+        cookies = SimpleCookie()
+        for cookie in session["cookies"]:
+            cookies[cookie["name"]] = cookie["value"]
+            cookies[cookie["name"]]["path"] = cookie.get("path") or "/"
+        self._session.cookie_jar.update_cookies(cookies, URL(BASE_URL))
+        self._token = session.get("token")
+        return True
+
+    def _schedule_state_save(self) -> None:
+        if self._state_store is not None:
+            self._state_save_due = time.monotonic() + API_STATE_SAVE_DELAY
+            self._state_store.async_delay_save(self.export_state, API_STATE_SAVE_DELAY)
+
+    def _on_budget_change(self) -> None:
+        """Persist request counts as they change (at most one pending write)."""
+        # A pending write exports the counts when it runs; scheduling again
+        # would only push it back for as long as requests keep coming
+        if time.monotonic() < self._state_save_due:
+            return
+        self._schedule_state_save()
+
+    async def async_save_state(self) -> None:
+        """Persist API state now (e.g. on unload)."""
+        if self._state_store is not None and not self._session.closed:
+            await self._state_store.async_save(self.export_state())
+
+    async def async_get_data(
+        self, force_refresh: bool = False, deadline: float | None = None
+    ) -> list[dict]:
+        """Fetch meters with today's daily values.
+
+        ``deadline`` is a ``time.monotonic()`` timestamp; requests that
+        cannot finish before it raise EnergaDeadlineExceeded.
+        """
         if force_refresh:
             self._meters_data = []
         if not self._meters_data:
-            self._meters_data = await self._fetch_all_meters()
+            self._meters_data = await self._fetch_all_meters(deadline)
 
         tz = ZoneInfo("Europe/Warsaw")
         # Construct midnight using datetime constructor (not .replace())
@@ -127,54 +376,72 @@ class EnergaAPI:
                      tzinfo=tz).timestamp() * 1000
         )
 
-        updated_meters = []
-        for meter in self._meters_data:
-            m_data = meter.copy()
-            if m_data.get("obis_plus"):
-                # Fetch total daily consumption (sum of all zones)
-                vals = await self._fetch_chart(
-                    m_data["meter_point_id"], m_data["obis_plus"], ts
-                )
-                m_data["daily_pobor"] = sum(vals)
-
-                # Fetch per-zone daily consumption for G12w
-                if m_data.get("zone_count", 1) > 1:
-                    vals_1 = await self._fetch_chart(
-                        m_data["meter_point_id"], m_data["obis_plus"], ts, zone_index=0
-                    )
-                    vals_2 = await self._fetch_chart(
-                        m_data["meter_point_id"], m_data["obis_plus"], ts, zone_index=1
-                    )
-                    m_data["daily_pobor_1"] = sum(vals_1)
-                    m_data["daily_pobor_2"] = sum(vals_2)
-
-            if m_data.get("obis_minus"):
-                vals = await self._fetch_chart(
-                    m_data["meter_point_id"], m_data["obis_minus"], ts
-                )
-                m_data["daily_produkcja"] = sum(vals)
-
-            _LOGGER.debug(
-                "Energa Meter [%s]: Total(+)=%s, Total(-)=%s, Daily(+)=%s, Daily(-)=%s",
-                m_data.get("meter_serial"),
-                m_data.get("total_plus"),
-                m_data.get("total_minus"),
-                m_data.get("daily_pobor"),
-                m_data.get("daily_produkcja"),
+        # Meters in parallel; the AIMD limiter bounds the chart requests
+        # in flight. gather() keeps the meters in their original order.
+        tasks = [
+            asyncio.ensure_future(self._fetch_meter_daily(meter, ts, deadline))
+            for meter in self._meters_data
+        ]
+        try:
+            updated_meters = await asyncio.gather(*tasks)
+        except BaseException:
+            # e.g. EnergaTokenExpiredError — don't leave siblings running
+            for task in tasks:
+                task.cancel()
+            raise
+        self._meters_data = list(updated_meters)
+        return self._meters_data
+
+    async def _fetch_meter_daily(
+        self, meter: dict, ts: int, deadline: float | None
+    ) -> dict:
+        """Copy of ``meter`` with today's daily consumption and production."""
+        m_data = meter.copy()
+        zone_count = m_data.get("zone_count", 1)
+
+        if m_data.get("obis_plus"):
+            # Total and per-zone (G12w) daily consumption come from
+            # the same mchart response — one request per OBIS code
+            total, zones = await self._fetch_chart_series(
+                m_data["meter_point_id"], m_data["obis_plus"], ts,
+                zone_count=zone_count if zone_count > 1 else 0,
+                deadline=deadline,
+            )
+            m_data["daily_pobor"] = _published_sum(total)
+            for zone_num, vals in enumerate(zones, start=1):
+                m_data[f"daily_pobor_{zone_num}"] = _published_sum(vals)
+
+        if m_data.get("obis_minus"):
+            total, _zones = await self._fetch_chart_series(
+                m_data["meter_point_id"], m_data["obis_minus"], ts,
+                deadline=deadline,
             )
-            updated_meters.append(m_data)
-        self._meters_data = updated_meters
-        return updated_meters
+            m_data["daily_produkcja"] = _published_sum(total)
+
+        _LOGGER.debug(
+            "Energa Meter [%s]: Total(+)=%s, Total(-)=%s, Daily(+)=%s, Daily(-)=%s",
+            m_data.get("meter_serial"),
+            m_data.get("total_plus"),
+            m_data.get("total_minus"),
+            m_data.get("daily_pobor"),
+            m_data.get("daily_produkcja"),
+        )
+        return m_data
 
     async def async_get_history_hourly(
-        self, meter_point_id, date: datetime, include_timestamps: bool = False
+        self,
+        meter_point_id,
+        date: datetime,
+        include_timestamps: bool = False,
+        deadline: float | None = None,
+        directions: tuple[str, ...] = ("import", "export"),
     ):
         meter = next(
             (m for m in self._meters_data if m["meter_point_id"] == meter_point_id),
             None,
         )
         if not meter:
-            await self.async_get_data()
+            await self.async_get_data(deadline=deadline)
             meter = next(
                 (m for m in self._meters_data if m["meter_point_id"] == meter_point_id),
                 None,
@@ -191,38 +458,24 @@ class EnergaAPI:
                      tzinfo=tz).timestamp() * 1000
         )
 
+        # One mchart request per OBIS code: total and per-zone (G12w)
+        # series are all decoded from the same response
+        zone_count = meter.get("zone_count", 1)
+        if zone_count <= 1:
+            zone_count = 0
+
         result = {"import": [], "export": []}
-        if meter.get("obis_plus"):
-            # Total import (sum of all zones)
-            result["import"] = await self._fetch_chart(
-                meter["meter_point_id"], meter["obis_plus"], ts,
-                include_timestamps=include_timestamps,
-            )
-            # Per-zone import for G12w
-            if meter.get("zone_count", 1) > 1:
-                result["import_1"] = await self._fetch_chart(
-                    meter["meter_point_id"], meter["obis_plus"], ts,
-                    zone_index=0, include_timestamps=include_timestamps,
-                )
-                result["import_2"] = await self._fetch_chart(
-                    meter["meter_point_id"], meter["obis_plus"], ts,
-                    zone_index=1, include_timestamps=include_timestamps,
-                )
-        if meter.get("obis_minus"):
-            result["export"] = await self._fetch_chart(
-                meter["meter_point_id"], meter["obis_minus"], ts,
-                include_timestamps=include_timestamps,
+        for key, obis_key in (("import", "obis_plus"), ("export", "obis_minus")):
+            if key not in directions or not meter.get(obis_key):
+                continue
+            total, zones = await self._fetch_chart_series(
+                meter["meter_point_id"], meter[obis_key], ts,
+                zone_count=zone_count, include_timestamps=include_timestamps,
+                deadline=deadline,
             )
-            # Per-zone export for G12w
-            if meter.get("zone_count", 1) > 1:
-                result["export_1"] = await self._fetch_chart(
-                    meter["meter_point_id"], meter["obis_minus"], ts,
-                    zone_index=0, include_timestamps=include_timestamps,
-                )
-                result["export_2"] = await self._fetch_chart(
-                    meter["meter_point_id"], meter["obis_minus"], ts,
-                    zone_index=1, include_timestamps=include_timestamps,
-                )
+            result[key] = total
+            for zone_num, series in enumerate(zones, start=1):
+                result[f"{key}_{zone_num}"] = series
 
         _LOGGER.debug(
             "History %s (ts=%s): Import=%d pts, Export=%d pts",
@@ -234,11 +487,33 @@ class EnergaAPI:
 
         return result
 
+    def history_prefetcher(
+        self, meter_point_id, days: list[datetime]
+    ) -> "HistoryPrefetcher":
+        """Fetch ``days`` ahead of a sequential consumer (history import)."""
+        return HistoryPrefetcher(self, meter_point_id, days, self._fetch_concurrency)
+
     async def async_get_hourly_statistics(
-        self, meter_point_id: str, start_date: datetime = None
+        self,
+        meter_point_id: str,
+        start_date: datetime = None,
+        deadline: float | None = None,
+        series_start: dict[str, datetime] | None = None,
     ):
         """Fetch hourly data from start_date to now (smart fetch).
 
+        ``series_start`` optionally gives each series (``import``,
+        ``export_1``, ...) its own first hour; earlier points of that series
+        are dropped before they are decoded, and a day is only requested
+        for the directions (import/export OBIS) whose tracked series still
+        need it. Series not listed start at ``start_date`` and ride along
+        on the charts fetched for the listed ones.
+
+        If ``deadline`` (``time.monotonic()``) runs out or the circuit
+        breaker opens, only the days before the first unfetched one are
+        returned, so the next cycle's smart fetch resumes from there
+        without leaving a gap.
+
         Returns:
             dict with keys like "import", "import_1", "import_2", "export"
             containing lists of: {"start": datetime, "state": float}
@@ -272,11 +547,12 @@ class EnergaAPI:
         days_to_fetch = max(1, min(days_to_fetch, 365))  # Cap at 365 days
 
         _LOGGER.debug(
-            "Smart fetch for %s: from %s (%d days, zones=%s)",
+            "Smart fetch for %s: from %s (%d days, zones=%s, concurrency=%d)",
             meter_point_id,
             start_date.date(),
             days_to_fetch,
             has_zones,
+            self._fetch_concurrency,
         )
 
         # Collect hourly data points
@@ -285,51 +561,118 @@ class EnergaAPI:
             keys.extend(["import_1", "import_2", "export_1", "export_2"])
         all_points = {k: [] for k in keys}
 
+        # Per-series cutoff (ms, compared before decoding). A direction's
+        # mchart is needed from the first day of the series tracked in
+        # ``series_start``; untracked keys (e.g. G12w totals, which have no
+        # statistics sensor) never hold a direction back.
+        tracked = {
+            key: start if start.tzinfo else start.replace(tzinfo=tz)
+            for key, start in (series_start or {}).items()
+            if key in keys
+        }
+        cutoff = {k: tracked.get(k, start_date) for k in keys}
+        cutoff_ms = {k: int(start.timestamp() * 1000) for k, start in cutoff.items()}
+        direction_start = {}
+        for direction in ("import", "export"):
+            starts = [
+                start
+                for key, start in (tracked or cutoff).items()
+                if key.split("_")[0] == direction
+            ]
+            if starts:
+                direction_start[direction] = min(starts).astimezone(tz).date()
+
+        target_dates = []
         for day_offset in range(days_to_fetch):
             target_date = start_date + timedelta(days=day_offset)
 
             # Skip future dates
             if target_date.date() > now.date():
                 break
+            target_dates.append(target_date)
+
+        # Fetch days concurrently, bounded by fetch_concurrency.
+        # gather() keeps results in day order for the merge below.
+        semaphore = asyncio.Semaphore(self._fetch_concurrency)
+
+        async def _fetch_day(target_date: datetime) -> dict | None:
+            async with semaphore:
+                directions = tuple(
+                    direction
+                    for direction, first_day in direction_start.items()
+                    if first_day <= target_date.date()
+                )
+                try:
+                    return await self.async_get_history_hourly(
+                        meter_point_id,
+                        target_date,
+                        include_timestamps=True,
+                        deadline=deadline,
+                        directions=directions,
+                    )
+                except (EnergaDeadlineExceeded, EnergaCircuitOpenError):
+                    return None
 
-            if day_offset > 0:
-                await asyncio.sleep(0.3)
-
-            day_data = await self.async_get_history_hourly(
-                meter_point_id, target_date, include_timestamps=True
+        tasks = [
+            asyncio.ensure_future(_fetch_day(target_date))
+            for target_date in target_dates
+        ]
+        try:
+            day_results = await asyncio.gather(*tasks)
+        except BaseException:
+            # e.g. EnergaTokenExpiredError — don't leave siblings running
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if None in day_results:
+            fetched = day_results.index(None)
+            _LOGGER.info(
+                "Smart fetch for %s: stopped after %d of %d days "
+                "(deadline or API outage), resuming next cycle",
+                meter_point_id,
+                fetched,
+                len(day_results),
             )
+            day_results = day_results[:fetched]
+
+        # Merging a long catch-up (up to 365 days x 6 series) runs on the loop
+        with self._loop_monitor.measure(
+            "smart_fetch_merge", meter=meter_point_id, days=len(day_results)
+        ):
+            for day_data in day_results:
+                # Process each data key — use API-provided timestamps
+                # instead of computing from array index (#26).
+                # On DST spring-forward, the API returns 23 points (not 24)
+                # with correct Unix timestamps for each hour.
+                for key in keys:
+                    key_cutoff_ms = cutoff_ms[key]
+                    for item in day_data.get(key, []):
+                        # With include_timestamps=True, items are
+                        # (value, timestamp_ms) tuples
+                        if isinstance(item, (list, tuple)):
+                            hourly_value, tm_ms = item
+                        else:
+                            # Fallback for unexpected format
+                            continue
 
-            # Process each data key — use API-provided timestamps
-            # instead of computing from array index (#26).
-            # On DST spring-forward, the API returns 23 points (not 24)
-            # with correct Unix timestamps for each hour.
-            for key in keys:
-                for item in day_data.get(key, []):
-                    # With include_timestamps=True, items are
-                    # (value, timestamp_ms) tuples
-                    if isinstance(item, (list, tuple)):
-                        hourly_value, tm_ms = item
-                    else:
-                        # Fallback for unexpected format
-                        continue
-
-                    if hourly_value is not None and hourly_value >= 0:
-                        hour_dt = datetime.fromtimestamp(
-                            tm_ms / 1000, tz=tz
-                        )
+                        # Only points from the series' own first hour on
+                        if tm_ms < key_cutoff_ms:
+                            continue
 
-                        # Only include points after start_date
-                        if hour_dt >= start_date:
+                        if hourly_value is not None and hourly_value >= 0:
                             all_points[key].append(
                                 {
-                                    "start": hour_dt,
+                                    "start": datetime.fromtimestamp(
+                                        tm_ms / 1000, tz=tz
+                                    ),
                                     "state": hourly_value,
                                 }
                             )
 
-        # Sort by time (oldest first)
-        for key in keys:
-            all_points[key].sort(key=lambda x: x["start"])
+            # Sort by time (oldest first)
+            for key in keys:
+                all_points[key].sort(key=lambda x: x["start"])
 
         _LOGGER.info(
             "Smart fetch for %s: %d import, %d export points (from %s)%s",
@@ -349,8 +692,8 @@ class EnergaAPI:
 
         return all_points
 
-    async def _fetch_all_meters(self):
-        data = await self._api_get(DATA_ENDPOINT)
+    async def _fetch_all_meters(self, deadline: float | None = None):
+        data = await self._api_get(DATA_ENDPOINT, deadline=deadline)
         if not data.get("response"):
             raise EnergaConnectionError("Empty response in fetch_all_meters")
 
@@ -456,21 +799,87 @@ class EnergaAPI:
             meters_found.append(meter_obj)
         return meters_found
 
-    async def _fetch_chart(
+    async def _fetch_chart_series(
         self, meter_id: str, obis: str, timestamp: int,
-        zone_index: int | None = None, include_timestamps: bool = False,
-    ) -> list:
-        """Fetch chart data for a meter.
+        zone_count: int = 0, include_timestamps: bool = False,
+        deadline: float | None = None,
+    ) -> tuple[list, list[list]]:
+        """Fetch total and per-zone chart series from one mchart response.
+
+        Every mchart point carries a ``zones`` array, so the total and
+        all zone series can be decoded from a single request instead of
+        one request per zone.
 
         Args:
             meter_id: Meter point ID
             obis: OBIS code (e.g. 1-0:1.8.0*255)
             timestamp: Day timestamp in milliseconds
-            zone_index: None=sum all zones, 0=zone 1, 1=zone 2
-            include_timestamps: If True, return list of (value, tm_ms) tuples
-                               instead of just values. Used for statistics
-                               to correctly handle DST transitions (#26).
+            zone_count: Number of per-zone series to decode (0 = total only)
+            include_timestamps: If True, series items are (value, tm_ms)
+                               tuples instead of plain values (#26).
+            deadline: ``time.monotonic()`` cut-off for the request
+
+        Returns:
+            (total, zones) where ``zones[i]`` is the series for zone i+1.
+            Hours not published yet (all zones null) are None in every
+            series. Both are empty on fetch errors.
         """
+        try:
+            points = await self._get_chart_points(
+                meter_id, obis, timestamp, deadline
+            )
+            total = []
+            zones = [[] for _ in range(zone_count)]
+            for p in points:
+                point_zones = p.get("zones", [])
+                if all(z is None for z in point_zones):
+                    # Hour not published yet: kept as None (not 0.0), so
+                    # consumers and the publication lag tracker can tell
+                    values = [None] * (zone_count + 1)
+                else:
+                    # Published hour: a null zone is the inactive one
+                    values = [sum(z or 0.0 for z in point_zones)]
+                    for zone_index in range(zone_count):
+                        val = (
+                            point_zones[zone_index]
+                            if zone_index < len(point_zones)
+                            else None
+                        )
+                        values.append(val or 0.0)
+
+                if include_timestamps:
+                    # Return (value, timestamp_ms) for DST-safe mapping
+                    tm_ms = int(p.get("tm", 0))
+                    values = [(val, tm_ms) for val in values]
+
+                total.append(values[0])
+                for zone_index, series in enumerate(zones, start=1):
+                    series.append(values[zone_index])
+            return total, zones
+        except (
+            EnergaTokenExpiredError,
+            EnergaDeadlineExceeded,
+            EnergaCircuitOpenError,
+            EnergaQuotaExceededError,
+        ):
+            raise  # Re-login / cut-off / outage / quota are handled by the caller
+        except Exception as e:
+            _LOGGER.error("Error fetching chart for %s: %s", meter_id, e)
+            return [], [[] for _ in range(zone_count)]
+
+    async def _get_chart_points(
+        self, meter_id: str, obis: str, timestamp: int, deadline: float | None = None
+    ) -> list:
+        """Return raw ``mainChart`` points for a day, cache first."""
+        day = datetime.fromtimestamp(
+            timestamp / 1000, tz=ZoneInfo("Europe/Warsaw")
+        ).date()
+        if self._chart_cache is not None:
+            cached = self._chart_cache.get(meter_id, obis, day)
+            if cached is not None:
+                _LOGGER.debug("Chart cache hit: %s %s %s", meter_id, obis, day)
+                return cached
+
         params = {
             "meterPoint": meter_id,
             "type": "DAY",
@@ -480,42 +889,105 @@ class EnergaAPI:
         # Only add token if it exists, otherwise rely on cookies
         if self._token:
             params["token"] = self._token
-        try:
-            data = await self._api_get(CHART_ENDPOINT, params=params)
-            results = []
-            for p in data["response"]["mainChart"]:
-                zones = p.get("zones", [])
-                if zone_index is not None:
-                    # Specific zone
-                    val = zones[zone_index] if zone_index < len(zones) else None
-                    val = val or 0.0
-                else:
-                    # Sum all zones (total)
-                    val = sum(z or 0.0 for z in zones)
+        data = await self._api_get(CHART_ENDPOINT, params=params, deadline=deadline)
+        points = data["response"]["mainChart"]
+
+        if self._chart_cache is not None:
+            self._chart_cache.put(meter_id, obis, day, points)
+        return points
+
+    async def _api_get(self, path, params=None, deadline: float | None = None):
+        """GET an API path; identical concurrent calls share one request.
+
+        Overlapping coordinator refreshes, fetch_history calls and
+        options-flow imports often ask for the same chart at the same
+        moment. The first caller starts the request, later callers await
+        the same task instead of sending a duplicate. Only callers with
+        the same priority and deadline share a request: the task runs
+        under its creator's, so a live refresh never queues behind a
+        backfill and a backfill never inherits a cycle deadline.
+        """
+        key = (
+            path,
+            tuple(sorted((params or {}).items())),
+            _REQUEST_PRIORITY.get(),
+            deadline,
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._api_request(path, params, deadline=deadline)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda done, key=key: self._inflight_done(key, done)
+            )
+        else:
+            _LOGGER.debug("Joining in-flight request for %s", path)
+        # shield: a cancelled caller must not cancel the shared request
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, key, task: asyncio.Future) -> None:
+        """Forget a finished shared request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Waiters re-raise it; this only silences "never retrieved"
+            # when every waiter was cancelled
+            task.exception()
+
+    def _request_timeout_for(
+        self, path: str, deadline: float | None = None
+    ) -> aiohttp.ClientTimeout:
+        """Per-endpoint timeout, shortened to fit the remaining deadline."""
+        total = min(
+            ENDPOINT_TIMEOUTS.get(path, self._request_timeout), self._request_timeout
+        )
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise EnergaDeadlineExceeded(f"Deadline reached before {path}")
+            total = min(total, remaining)
+        return aiohttp.ClientTimeout(
+            total=total, connect=min(HTTP_CONNECT_TIMEOUT, total)
+        )
 
-                if include_timestamps:
-                    # Return (value, timestamp_ms) for DST-safe mapping
-                    tm_ms = int(p.get("tm", 0))
-                    results.append((val, tm_ms))
-                else:
-                    results.append(val)
-            return results
-        except EnergaTokenExpiredError:
-            raise  # Propagate to coordinator for re-login
-        except Exception as e:
-            _LOGGER.error("Error fetching chart for %s: %s", meter_id, e)
-            return []
+    async def _api_request(
+        self,
+        path,
+        params=None,
+        relogin: bool = True,
+        deadline: float | None = None,
+        priority: int | None = None,
+    ):
+        if priority is None:
+            priority = _REQUEST_PRIORITY.get()
+        if not self._budget.allows(priority):
+            raise EnergaQuotaExceededError(
+                f"Daily request quota ({self._budget.daily_quota}) spent, "
+                f"{path} deferred until tomorrow"
+            )
+        if not self._circuit.allow_request():
+            raise EnergaCircuitOpenError(
+                f"Energa API unavailable, circuit open (next probe in "
+                f"{self._circuit.retry_in():.0f}s)"
+            )
+        auth_retried = False
+        session_retried = False
+        retries = 0
+        waited = 0.0
+        while True:
+            generation = self._login_generation
 
-    async def _api_get(self, path, params=None):
-        for attempt in range(2):
             # Recover from closed session
             if self._session.closed:
-                _LOGGER.warning(
-                    "Session closed (attempt %d), creating new session and re-logging in",
-                    attempt + 1,
-                )
-                self._session = self._create_session_fn()
-                await self.async_login()
+                if relogin:
+                    _LOGGER.warning(
+                        "Session closed, creating new session and re-logging in"
+                    )
+                    await self._async_relogin(generation)
+                else:
+                    self._session = self._create_session_fn()
 
             url = f"{BASE_URL}{path}"
 
@@ -525,56 +997,159 @@ class EnergaAPI:
             if self._token and "token" not in final_params:
                 final_params["token"] = self._token
 
+            retry_after = None
+            # Chart requests also hold an AIMD slot; each attempt reports
+            # its latency (success) or pushback (429/5xx/timeout/drop)
+            limiter = self._chart_limiter if path == CHART_ENDPOINT else None
+            if limiter is not None:
+                await limiter.acquire(priority)
+            outcome = None
             try:
-                async with self._session.get(
-                    url, headers=HEADERS, params=final_params
-                ) as resp:
-                    if resp.status in (401, 403):
-                        if attempt == 0:
-                            _LOGGER.debug(
-                                "Token expired (HTTP %d), re-logging in", resp.status
+                await self._rate_limiter.acquire(priority)
+                timeout = self._request_timeout_for(path, deadline)
+                self._budget.record()
+                started = time.monotonic()
+                try:
+                    async with self._session.get(
+                        url, headers=HEADERS, params=final_params, timeout=timeout
+                    ) as resp:
+                        if resp.status not in RETRYABLE_STATUSES:
+                            # Any real answer means the backend is reachable
+                            self._circuit.record_success()
+                        if resp.status in (401, 403):
+                            if relogin and not auth_retried:
+                                auth_retried = True
+                                _LOGGER.debug(
+                                    "Token expired (HTTP %d), re-logging in",
+                                    resp.status,
+                                )
+                                await self._async_relogin(generation)
+                                continue
+                            raise EnergaTokenExpiredError(
+                                f"API returned {resp.status} for {url}"
                             )
-                            await self.async_login()
-                            continue
-                        raise EnergaTokenExpiredError(
-                            f"API returned {resp.status} for {url}"
+                        if resp.status in RETRYABLE_STATUSES:
+                            # Rate limited / transient server error → back off below
+                            retry_after = resp.headers.get("Retry-After")
+                            failure = f"HTTP {resp.status}"
+                            outcome = AdaptiveConcurrency.PUSHBACK
+                        else:
+                            resp.raise_for_status()
+                            data = await resp.json()
+                            outcome = time.monotonic() - started
+                            self._capture_api_messages(data)
+                            return data
+                except (aiohttp.ClientError, RuntimeError) as err:
+                    if not session_retried and (
+                        self._session.closed or "Session is closed" in str(err)
+                    ):
+                        session_retried = True
+                        _LOGGER.warning(
+                            "Request failed (session issue: %s), retrying", err
                         )
-                    resp.raise_for_status()
-                    data = await resp.json()
+                        continue
+                    if not isinstance(err, aiohttp.ClientConnectionError):
+                        raise EnergaConnectionError(str(err)) from err
+                    failure = str(err) or type(err).__name__
+                    outcome = AdaptiveConcurrency.PUSHBACK
+                except TimeoutError:
+                    failure = "timeout"
+                    outcome = AdaptiveConcurrency.PUSHBACK
+            finally:
+                if limiter is not None:
+                    limiter.release(outcome)
+                    if limiter.limit != self._saved_chart_limit:
+                        # Remember the learned limit for the next run
+                        self._saved_chart_limit = limiter.limit
+                        self._schedule_state_save()
+
+            delay = self._retry_policy.next_delay(retries, waited, retry_after)
+            if delay is None:
+                self._circuit.record_failure(failure)
+                raise EnergaConnectionError(
+                    f"{failure} for {path} (gave up after {retries} retries)"
+                )
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise EnergaDeadlineExceeded(
+                    f"{failure} for {path}, no time left to retry"
+                )
+            retries += 1
+            waited += delay
+            self._telemetry.record_retry(path)
+            _LOGGER.warning(
+                "Energa API %s for %s, retry %d in %.1fs",
+                failure,
+                path,
+                retries,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    def _capture_api_messages(self, data) -> None:
+        """Capture API warnings/errors for HA notifications."""
+        api_warning = data.get("warning") if isinstance(data, dict) else None
+        api_error = data.get("error") if isinstance(data, dict) else None
+        if api_warning and api_warning != self._api_warning:
+            self._api_warning = api_warning
+            _LOGGER.warning("Energa API warning: %s", api_warning)
+            if self._hass:
+                from homeassistant.components import persistent_notification
+                persistent_notification.async_create(
+                    self._hass,
+                    str(api_warning),
+                    title="Energa: Komunikat",
+                    notification_id="energa_api_warning",
+                )
+        if api_error and api_error != self._api_error:
+            self._api_error = api_error
+            _LOGGER.error("Energa API error: %s", api_error)
+            if self._hass:
+                from homeassistant.components import persistent_notification
+                persistent_notification.async_create(
+                    self._hass,
+                    str(api_error),
+                    title="Energa: Błąd API",
+                    notification_id="energa_api_error",
+                )
 
-                    # Capture API warnings/errors for HA notifications
-                    api_warning = data.get("warning") if isinstance(data, dict) else None
-                    api_error = data.get("error") if isinstance(data, dict) else None
-                    if api_warning and api_warning != self._api_warning:
-                        self._api_warning = api_warning
-                        _LOGGER.warning("Energa API warning: %s", api_warning)
-                        if self._hass:
-                            from homeassistant.components import persistent_notification
-                            persistent_notification.async_create(
-                                self._hass,
-                                str(api_warning),
-                                title="Energa: Komunikat",
-                                notification_id="energa_api_warning",
-                            )
-                    if api_error and api_error != self._api_error:
-                        self._api_error = api_error
-                        _LOGGER.error("Energa API error: %s", api_error)
-                        if self._hass:
-                            from homeassistant.components import persistent_notification
-                            persistent_notification.async_create(
-                                self._hass,
-                                str(api_error),
-                                title="Energa: Błąd API",
-                                notification_id="energa_api_error",
-                            )
 
-                    return data
-            except (aiohttp.ClientError, RuntimeError) as err:
-                if attempt == 0 and (
-                    self._session.closed or "Session is closed" in str(err)
-                ):
-                    _LOGGER.warning("Request failed (session issue: %s), retrying", err)
-                    continue
-                raise EnergaConnectionError(str(err)) from err
-        # Should not reach here, but safety net
-        raise EnergaConnectionError("Max retries exceeded in _api_get")
+class HistoryPrefetcher:
+    """Keep up to ``window`` upcoming history days in flight.
+
+    ``get(day)`` returns the same data as ``async_get_history_hourly``
+    (with timestamps) while the following days are already being fetched,
+    so a day-by-day import runs at the API's adaptive concurrency instead
+    of one request at a time. Prefetch tasks inherit the caller's request
+    priority. Call ``cancel()`` when stopping early.
+    """
+
+    def __init__(self, api: EnergaAPI, meter_point_id, days: list, window: int):
+        self._api = api
+        self._meter_point_id = meter_point_id
+        self._days = list(days)
+        self._index = {day: i for i, day in enumerate(self._days)}
+        self._window = max(1, int(window))
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._scheduled = 0
+
+    async def get(self, day: datetime) -> dict:
+        index = self._index[day]
+        while self._scheduled < len(self._days) and self._scheduled <= index + self._window:
+            self._tasks[self._scheduled] = asyncio.ensure_future(
+                self._api.async_get_history_hourly(
+                    self._meter_point_id,
+                    self._days[self._scheduled],
+                    include_timestamps=True,
+                )
+            )
+            self._scheduled += 1
+        return await self._tasks.pop(index)
+
+    def cancel(self) -> None:
+        for task in self._tasks.values():
+            if task.done():
+                if not task.cancelled():
+                    task.exception()  # Retrieved: no "never retrieved" warning
+            else:
+                task.cancel()
+        self._tasks.clear()
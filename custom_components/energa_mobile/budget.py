@@ -0,0 +1,164 @@
+"""Request accounting per job and per day, with an optional daily quota.
+
+Every HTTP request sent to Energa (retries included, cache hits not) is
+counted against the current day (Europe/Warsaw) and against the job
+that caused it: a coordinator cycle or a history backfill. The job is
+carried in a ContextVar, so tasks spawned by a job (parallel days,
+prefetching) are counted with it. Once the daily quota is spent, only
+live (``PRIORITY_LIVE``) requests are still allowed.
+"""
+
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from .const import BUDGET_JOB_HISTORY, PRIORITY_LIVE
+
+TIMEZONE = ZoneInfo("Europe/Warsaw")
+
+_CURRENT_JOB: ContextVar["RequestJob | None"] = ContextVar(
+    "energa_request_job", default=None
+)
+
+
+class RequestJob:
+    """Requests made on behalf of one coordinator cycle or backfill."""
+
+    def __init__(self, kind: str, label: str | None = None) -> None:
+        self.kind = kind  # "cycle" or "backfill"
+        self.label = label
+        self.requests = 0
+        self.started = time.time()
+        self.finished: float | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "label": self.label,
+            "requests": self.requests,
+            "started": datetime.fromtimestamp(self.started, TIMEZONE).isoformat(),
+            "duration_s": None
+            if self.finished is None
+            else round(self.finished - self.started, 1),
+        }
+
+
+class RequestBudget:
+    """Daily request counter and quota for one config entry."""
+
+    def __init__(self, daily_quota: int = 0, today=None) -> None:
+        self._quota = max(0, int(daily_quota))  # 0 = unlimited
+        self._today = today or (lambda: datetime.now(TIMEZONE).date())
+        self._day: date = self._today()
+        self._count = 0
+        self._by_kind: Counter = Counter()  # Today's requests per job kind
+        self._history: deque[RequestJob] = deque(maxlen=BUDGET_JOB_HISTORY)
+        self._last: dict[str, RequestJob] = {}  # Last finished job per kind
+        # Called after counts change, e.g. to schedule persisting them
+        self.on_change: Callable[[], None] | None = None
+
+    @property
+    def daily_quota(self) -> int:
+        return self._quota
+
+    @property
+    def used_today(self) -> int:
+        self._roll()
+        return self._count
+
+    @property
+    def remaining(self) -> int | None:
+        """Requests left today, None when there is no quota."""
+        if not self._quota:
+            return None
+        return max(0, self._quota - self.used_today)
+
+    def last_job(self, kind: str) -> RequestJob | None:
+        return self._last.get(kind)
+
+    def allows(self, priority: int) -> bool:
+        """Whether a request at ``priority`` may be sent now."""
+        return priority == PRIORITY_LIVE or self.remaining != 0
+
+    def record(self) -> None:
+        """Count one HTTP request for today and the current job."""
+        self._roll()
+        self._count += 1
+        job = _CURRENT_JOB.get()
+        self._by_kind[job.kind if job else "other"] += 1
+        if job is not None:
+            job.requests += 1
+        self._changed()
+
+    def new_job(self, kind: str, label: str | None = None) -> RequestJob:
+        return RequestJob(kind, label)
+
+    @contextmanager
+    def track(self, job: RequestJob):
+        """Count the block's requests (and its spawned tasks') for ``job``."""
+        token = _CURRENT_JOB.set(job)
+        try:
+            yield job
+        finally:
+            _CURRENT_JOB.reset(token)
+
+    def finish_job(self, job: RequestJob) -> None:
+        job.finished = time.time()
+        self._history.append(job)
+        self._last[job.kind] = job
+        self._changed()
+
+    @contextmanager
+    def job(self, kind: str, label: str | None = None):
+        """Track a job for the duration of the block."""
+        job = self.new_job(kind, label)
+        try:
+            with self.track(job):
+                yield job
+        finally:
+            self.finish_job(job)
+
+    def export(self) -> dict:
+        """Today's counters, persisted with the API state."""
+        self._roll()
+        return {
+            "day": self._day.isoformat(),
+            "count": self._count,
+            "by_kind": dict(self._by_kind),
+        }
+
+    def restore(self, state: dict) -> None:
+        """Resume today's counters after a restart (ignored for other days)."""
+        try:
+            day = date.fromisoformat(state["day"])
+            count = int(state["count"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if day != self._today():
+            return
+        self._day = day
+        self._count = max(self._count, count)
+        self._by_kind = Counter(state.get("by_kind") or {}) + self._by_kind
+
+    def as_dict(self) -> dict:
+        return {
+            **self.export(),
+            "daily_quota": self._quota or None,
+            "remaining": self.remaining,
+            "recent_jobs": [job.as_dict() for job in self._history],
+        }
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
+
+    def _roll(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._count = 0
+            self._by_kind.clear()
@@ -0,0 +1,144 @@
+"""Persistent cache of Energa mchart day responses.
+
+A past day's hourly chart for a meter/OBIS pair never changes once the
+day is complete, so it only has to be downloaded once. Today's chart
+(and past days that are not fully published yet) expire after a short
+TTL so fresh hours are still picked up.
+"""
+
+import heapq
+import logging
+import time
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from .const import CHART_CACHE_MAX_ENTRIES, CHART_CACHE_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30  # Seconds — batches writes during a backfill
+
+# Fewest points a complete day can have (DST spring-forward: 23 hours)
+MIN_POINTS_PER_DAY = 23
+
+
+class EnergaChartCache:
+    """Cache of raw mchart points keyed by (meter_point_id, obis, day).
+
+    Entries for closed, fully published days are immutable and persisted
+    via the optional ``store`` (an HA ``Store``). Everything else lives
+    in memory only and expires after ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        store=None,
+        ttl: float = CHART_CACHE_TTL,
+        max_entries: int = CHART_CACHE_MAX_ENTRIES,
+        clock=time.time,
+        today_fn=None,
+    ) -> None:
+        self._store = store
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._today_fn = today_fn or (
+            lambda: datetime.now(ZoneInfo("Europe/Warsaw")).date()
+        )
+        self._entries: dict[str, dict] = {}
+        # (day, key) min-heap for eviction; keys dropped elsewhere (TTL
+        # expiry) are skipped lazily when they surface
+        self._by_day: list[tuple[str, str]] = []
+
+    @staticmethod
+    def _key(meter_id, obis: str, day: date) -> str:
+        return f"{meter_id}|{obis}|{day.isoformat()}"
+
+    async def async_load(self) -> None:
+        """Load persisted closed-day entries."""
+        if self._store is None:
+            return
+        try:
+            data = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not load chart cache, starting empty: %s", err)
+            return
+        if data and isinstance(data.get("entries"), dict):
+            self._entries = {
+                key: entry
+                for key, entry in data["entries"].items()
+                if entry.get("closed")
+            }
+            self._rebuild_heap()
+            _LOGGER.debug("Loaded %d cached chart days", len(self._entries))
+
+    def get(self, meter_id, obis: str, day: date) -> list | None:
+        """Return cached mchart points, or None on miss/expiry."""
+        key = self._key(meter_id, obis, day)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.get("closed") and (
+            self._clock() - entry.get("fetched", 0) > self._ttl
+        ):
+            del self._entries[key]
+            return None
+        return entry["points"]
+
+    def put(self, meter_id, obis: str, day: date, points: list) -> None:
+        """Cache mchart points for a day.
+
+        Args:
+            points: ``mainChart`` items (dicts with ``tm`` and ``zones``)
+        """
+        compact = [
+            {"tm": p.get("tm"), "zones": p.get("zones", [])} for p in points
+        ]
+        closed = self._is_closed(day, compact)
+        key = self._key(meter_id, obis, day)
+        if key not in self._entries:
+            heapq.heappush(self._by_day, (day.isoformat(), key))
+        self._entries[key] = {
+            "points": compact,
+            "fetched": self._clock(),
+            "closed": closed,
+        }
+        self._evict()
+        if closed:
+            self._schedule_save()
+
+    def _is_closed(self, day: date, points: list) -> bool:
+        """A day is closed once it is over and every hour is published."""
+        if day >= self._today_fn():
+            return False
+        if len(points) < MIN_POINTS_PER_DAY:
+            return False
+        return all(
+            any(z is not None for z in p.get("zones") or []) for p in points
+        )
+
+    def _evict(self) -> None:
+        """Drop the oldest days once the cache grows past max_entries."""
+        while len(self._entries) > self._max_entries and self._by_day:
+            _day, key = heapq.heappop(self._by_day)
+            self._entries.pop(key, None)
+        if len(self._by_day) > 2 * len(self._entries):
+            self._rebuild_heap()  # Too many stale keys from TTL expiry
+
+    def _rebuild_heap(self) -> None:
+        self._by_day = [(key.rsplit("|", 1)[1], key) for key in self._entries]
+        heapq.heapify(self._by_day)
+
+    def _schedule_save(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {
+            "entries": {
+                key: entry
+                for key, entry in self._entries.items()
+                if entry.get("closed")
+            }
+        }
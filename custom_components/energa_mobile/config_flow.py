@@ -12,25 +12,46 @@ from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import EnergaAPI, EnergaAuthError, EnergaConnectionError
+from .api import (
+    EnergaAPI,
+    EnergaAuthError,
+    EnergaConnectionError,
+    request_priority,
+)
 from .const import (
     CONF_BALANCE_BASELINE_EXPORT,
     CONF_BALANCE_BASELINE_IMPORT,
+    CONF_DAILY_REQUEST_QUOTA,
     CONF_DEVICE_TOKEN,
     CONF_EXPORT_PRICE,
+    CONF_FETCH_CONCURRENCY,
     CONF_IMPORT_PRICE,
     CONF_IMPORT_PRICE_1,
     CONF_IMPORT_PRICE_2,
+    CONF_LOOP_BLOCK_THRESHOLD,
     CONF_PASSWORD,
     CONF_PROSUMER_COEFFICIENT,
+    CONF_REQUEST_BURST,
+    CONF_REQUEST_RATE,
+    CONF_REQUEST_TIMEOUT,
     CONF_USERNAME,
     DEFAULT_BALANCE_BASELINE,
+    DEFAULT_DAILY_REQUEST_QUOTA,
     DEFAULT_EXPORT_PRICE,
+    DEFAULT_FETCH_CONCURRENCY,
     DEFAULT_IMPORT_PRICE,
     DEFAULT_IMPORT_PRICE_1,
     DEFAULT_IMPORT_PRICE_2,
+    DEFAULT_LOOP_BLOCK_THRESHOLD,
     DEFAULT_PROSUMER_COEFFICIENT,
+    DEFAULT_REQUEST_BURST,
+    DEFAULT_REQUEST_RATE,
+    DEFAULT_REQUEST_TIMEOUT,
     DOMAIN,
+    MAX_DAILY_REQUEST_QUOTA,
+    MAX_FETCH_CONCURRENCY,
+    MAX_LOOP_BLOCK_THRESHOLD,
+    PRIORITY_BACKFILL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -156,7 +177,9 @@ class EnergaOptionsFlow(config_entries.OptionsFlow):
         """Show options menu."""
         return self.async_show_menu(
             step_id="init",
-            menu_options=["credentials", "prices", "history", "clear_stats"],
+            menu_options=[
+                "credentials", "prices", "history", "advanced", "clear_stats",
+            ],
         )
 
     async def async_step_credentials(self, user_input=None):
@@ -236,6 +259,20 @@ class EnergaOptionsFlow(config_entries.OptionsFlow):
 
         return False
 
+    def _invalidate_watermarks(self, statistic_ids: list) -> None:
+        """Make coordinators re-read cleared statistics from the recorder."""
+        for entry_data in self.hass.data.get(DOMAIN, {}).values():
+            if isinstance(entry_data, dict) and "coordinator" in entry_data:
+                entry_data["coordinator"].watermarks.invalidate(statistic_ids)
+
+    def _expect_manual_clear(self, statistic_ids: list) -> None:
+        """Make coordinators watch the recorder for a manual statistics clear."""
+        for entry_data in self.hass.data.get(DOMAIN, {}).values():
+            if isinstance(entry_data, dict) and "coordinator" in entry_data:
+                entry_data["coordinator"].watermarks.expect_manual_clear(
+                    statistic_ids
+                )
+
     def _get_active_meters(self) -> list:
         """Get list of active meters from API."""
         entry_data = self.hass.data.get(DOMAIN, {}).get(
@@ -363,17 +400,20 @@ class EnergaOptionsFlow(config_entries.OptionsFlow):
             if days < 1:
                 days = 1
 
-            # Get active meters - handle token expiry
+            # Get active meters - handle token expiry. Like the import
+            # itself, these requests yield to the coordinator's live ones.
             try:
-                meters = await api.async_get_data()
+                with request_priority(PRIORITY_BACKFILL):
+                    meters = await api.async_get_data()
             except Exception as err:
                 # Token expired or other API error - try to re-login
                 from .api import EnergaAuthError, EnergaTokenExpiredError
 
                 if isinstance(err, (EnergaTokenExpiredError, EnergaAuthError)):
                     try:
-                        await api.async_login()
-                        meters = await api.async_get_data()
+                        with request_priority(PRIORITY_BACKFILL):
+                            await api.async_login()
+                            meters = await api.async_get_data()
                     except Exception as login_err:
                         return self.async_abort(
                             reason="cannot_connect",
@@ -412,6 +452,64 @@ class EnergaOptionsFlow(config_entries.OptionsFlow):
             description_placeholders={"contract_date": contract_str},
         )
 
+    async def async_step_advanced(self, user_input=None):
+        """Handle API tuning options (pacing, parallelism, timeouts, loop monitor)."""
+        if user_input is not None:
+            new_options = {**self._config_entry.options, **user_input}
+            return self.async_create_entry(title="", data=new_options)
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_FETCH_CONCURRENCY,
+                        default=options.get(
+                            CONF_FETCH_CONCURRENCY, DEFAULT_FETCH_CONCURRENCY
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=1, max=MAX_FETCH_CONCURRENCY),
+                    ),
+                    vol.Required(
+                        CONF_REQUEST_RATE,
+                        default=options.get(CONF_REQUEST_RATE, DEFAULT_REQUEST_RATE),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=20)),
+                    vol.Required(
+                        CONF_REQUEST_BURST,
+                        default=options.get(
+                            CONF_REQUEST_BURST, DEFAULT_REQUEST_BURST
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+                    vol.Required(
+                        CONF_REQUEST_TIMEOUT,
+                        default=options.get(
+                            CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=120)),
+                    vol.Required(
+                        CONF_DAILY_REQUEST_QUOTA,
+                        default=options.get(
+                            CONF_DAILY_REQUEST_QUOTA, DEFAULT_DAILY_REQUEST_QUOTA
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_DAILY_REQUEST_QUOTA),
+                    ),
+                    vol.Required(
+                        CONF_LOOP_BLOCK_THRESHOLD,
+                        default=options.get(
+                            CONF_LOOP_BLOCK_THRESHOLD, DEFAULT_LOOP_BLOCK_THRESHOLD
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=0, max=MAX_LOOP_BLOCK_THRESHOLD),
+                    ),
+                }
+            ),
+        )
+
     async def async_step_clear_stats(self, user_input=None):
         """Clear Energy Panel statistics for Energa sensors.
 
@@ -449,6 +547,7 @@ class EnergaOptionsFlow(config_entries.OptionsFlow):
                 # HA 2026.4+ removed async_clear_statistics from Recorder
                 if hasattr(rec, "async_clear_statistics"):
                     rec.async_clear_statistics(all_statistic_ids)
+                    self._invalidate_watermarks(statistic_ids)
                     _LOGGER.info(
                         "Cleared Energy Panel statistics for %d Energa sensors: %s",
                         len(statistic_ids),
@@ -460,6 +559,8 @@ class EnergaOptionsFlow(config_entries.OptionsFlow):
                         "Use Developer Tools → Statistics to clear manually: %s",
                         all_statistic_ids,
                     )
+                    # Watch for the manual clear so it gets re-imported
+                    self._expect_manual_clear(statistic_ids)
                     from homeassistant.components import persistent_notification
                     persistent_notification.async_create(
                         self.hass,
@@ -11,6 +11,12 @@ CONF_IMPORT_PRICE_2 = "import_price_2"  # PLN/kWh zone 2 / off-peak (G12w)
 CONF_PROSUMER_COEFFICIENT = "prosumer_coefficient"  # Net billing coefficient (0.0-1.0)
 CONF_BALANCE_BASELINE_IMPORT = "balance_baseline_import"  # Meter import reading at period start (kWh)
 CONF_BALANCE_BASELINE_EXPORT = "balance_baseline_export"  # Meter export reading at period start (kWh)
+CONF_FETCH_CONCURRENCY = "fetch_concurrency"  # Max days fetched in parallel
+CONF_REQUEST_RATE = "request_rate"  # Sustained API requests per second
+CONF_REQUEST_BURST = "request_burst"  # Requests allowed back-to-back
+CONF_REQUEST_TIMEOUT = "request_timeout"  # Seconds per HTTP request
+CONF_LOOP_BLOCK_THRESHOLD = "loop_block_threshold"  # ms; 0 = detector off
+CONF_DAILY_REQUEST_QUOTA = "daily_request_quota"  # Requests/day; 0 = unlimited
 
 # Default prices (PLN/kWh) - G12w tariff from 2026-01-01
 DEFAULT_IMPORT_PRICE = 1.188
@@ -19,6 +25,15 @@ DEFAULT_IMPORT_PRICE_2 = 0.5955  # Zone 2 (off-peak)
 DEFAULT_EXPORT_PRICE = 0.95
 DEFAULT_PROSUMER_COEFFICIENT = 0.8
 DEFAULT_BALANCE_BASELINE = 0.0  # 0 = count from meter installation (lifetime)
+DEFAULT_FETCH_CONCURRENCY = 6  # Ceiling for in-flight days / chart requests
+MAX_FETCH_CONCURRENCY = 8
+DEFAULT_REQUEST_RATE = 3.0  # Requests/s, shared by all call paths of an entry
+DEFAULT_REQUEST_BURST = 6
+DEFAULT_REQUEST_TIMEOUT = 30  # Seconds; a hung request is retried, not awaited forever
+DEFAULT_LOOP_BLOCK_THRESHOLD = 0  # Event-loop blocking detector disabled
+MAX_LOOP_BLOCK_THRESHOLD = 10000
+DEFAULT_DAILY_REQUEST_QUOTA = 0  # Unlimited; backfill stops once a quota is spent
+MAX_DAILY_REQUEST_QUOTA = 100000
 
 # API endpoints
 BASE_URL = "https://api-mojlicznik.energa-operator.pl/dp"
@@ -35,6 +50,68 @@ HEADERS = {
     "Content-Type": "application/json",
 }
 
+# Transport profile for the dedicated aiohttp session
+HTTP_CONNECT_TIMEOUT = 10  # Seconds for TCP connect + TLS handshake
+HTTP_KEEPALIVE_TIMEOUT = 60  # Seconds an idle connection is kept for reuse
+HTTP_DNS_CACHE_TTL = 300  # Seconds a resolved API hostname is cached
+HTTP_CONNECTION_HEADROOM = 2  # Connections beyond fetch_concurrency (live calls)
+
+# Per-endpoint request timeouts (seconds), capped by the request_timeout option
+ENDPOINT_TIMEOUTS = {
+    SESSION_ENDPOINT: 10,
+    LOGIN_ENDPOINT: 15,
+    CHART_ENDPOINT: 20,
+}
+
+# Wall-clock budget for one coordinator update (seconds). Work left when it
+# runs out is skipped and picked up by the next hourly cycle.
+CYCLE_DEADLINE = 20 * 60
+METER_CONCURRENCY = 3  # Meters fetched in parallel; chart requests stay AIMD-bounded
+
+# AIMD controller for concurrent chart requests (ceiling: fetch_concurrency)
+AIMD_INITIAL_LIMIT = 2  # Starting point before anything has been learned
+AIMD_LATENCY_TARGET = 2.0  # Seconds; slower answers count as congestion
+AIMD_DECREASE_FACTOR = 0.5  # Multiplicative decrease on 429 / 5xx / timeouts
+
+# Request priorities for the shared rate limiter (lower is served first)
+PRIORITY_LIVE = 0  # Coordinator refresh: meter totals, today, smart fetch
+PRIORITY_BACKFILL = 1  # fetch_history / options-flow history import
+BACKFILL_STARVATION_LIMIT = 4  # Live grants in a row before backfill gets one
+BUDGET_JOB_HISTORY = 20  # Finished cycles/backfills kept with their request counts
+API_STATE_SAVE_DELAY = 10  # Seconds from a change to writing the API state
+
+# Retry policy for 429 / 5xx / dropped connections (per _api_get call)
+RETRY_MAX_RETRIES = 4  # Retries after the first request (5 attempts in all)
+RETRY_BASE_DELAY = 1.0  # Seconds, doubled per retry (with jitter)
+RETRY_MAX_DELAY = 30.0  # Cap for a single backoff step
+RETRY_MAX_RETRY_AFTER = 120.0  # Cap for server-requested Retry-After
+RETRY_BUDGET = 90.0  # Max total seconds slept on retries per call
+
+# Circuit breaker: stop calling a backend that is down
+CIRCUIT_FAILURE_THRESHOLD = 3  # Consecutive failed calls (each after retries)
+CIRCUIT_COOLDOWN = 300  # Seconds before a single probe request is allowed
+
+# HTTP telemetry (aiohttp trace hooks on the API session)
+TELEMETRY_SAMPLE_SIZE = 200  # Recent latencies kept per endpoint for percentiles
+TELEMETRY_LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0)  # Seconds
+
+# Coordinator cycle tracing (diagnostics download)
+TRACE_MAX_CYCLES = 20  # Update cycles kept in the timeline
+TRACE_MAX_SPANS = 200  # Spans kept per cycle; later ones are counted, not stored
+
+# Event-loop blocking detector (opt-in, see loop_block_threshold option)
+LOOP_MONITOR_MAX_EVENTS = 50  # Blocking events kept for diagnostics
+
+# profile_cycle service
+PROFILE_TOP_FUNCTIONS = 60  # Functions listed in the text summary
+
+# Publication lag of hourly data (hour end -> first seen by the coordinator)
+PUBLICATION_LAG_SAMPLE_SIZE = 168  # Hours kept per meter series (one week)
+
+# Chart cache: TTL (s) for today / partially published days, size cap
+CHART_CACHE_TTL = 900
+CHART_CACHE_MAX_ENTRIES = 5000
+
 # Spike guard: maximum plausible hourly energy consumption in kWh
 MAX_HOURLY_KWH = 100
 
@@ -0,0 +1,62 @@
+"""Diagnostics download for Energa My Meter."""
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_DEVICE_TOKEN, CONF_PASSWORD, CONF_USERNAME, DOMAIN
+
+TO_REDACT = {
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_DEVICE_TOKEN,
+    "token",
+    "address",
+    "ppe",
+    "meter_serial",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    """Return diagnostics: API health, HTTP telemetry and cycle timelines."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    api = entry_data.get("api")
+    coordinator = entry_data.get("coordinator")
+
+    diagnostics = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+    }
+    if api is not None:
+        breaker = api.circuit_breaker
+        limiter = api.chart_limiter
+        diagnostics["api"] = {
+            "circuit_breaker": {
+                "state": breaker.state,
+                "consecutive_failures": breaker.failures,
+                "last_error": breaker.last_error,
+                "next_probe_in_s": round(breaker.retry_in()),
+            },
+            "chart_concurrency": {
+                "limit": limiter.limit,
+                "max_limit": limiter.max_limit,
+                "in_flight": limiter.in_flight,
+            },
+            "http": api.telemetry.as_dict(),
+            "loop_blocking": api.loop_monitor.as_dict(),
+            "request_budget": api.request_budget.as_dict(),
+        }
+    if coordinator is not None:
+        diagnostics["coordinator"] = {
+            "last_update_success": coordinator.last_update_success,
+            "meters": async_redact_data(coordinator.data or [], TO_REDACT),
+            # Phase timeline of the last update cycles, oldest first
+            "cycles": coordinator.tracer.as_dict(),
+            "publication_lag": coordinator.publication_lag.as_dict(),
+            "watermarks": coordinator.watermarks.as_dict(),
+        }
+    return diagnostics
@@ -0,0 +1,56 @@
+"""Batched recorder lookup of the last imported statistic per series.
+
+The coordinator needs the last ``sum``/``start`` of every Energa
+statistic on every cycle: as the base for incremental imports and to
+choose the smart-fetch start date. All of them are read in a single
+recorder executor job instead of one job per series.
+"""
+
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import get_last_statistics
+
+_LOGGER = logging.getLogger(__name__)
+
+STAT_SUFFIXES = ("import", "export")
+ZONE_STAT_SUFFIXES = ("import_1", "import_2", "export_1", "export_2")
+
+
+def stats_suffixes(has_zones: bool) -> tuple[str, ...]:
+    """Statistics sensor suffixes created for a meter."""
+    return ZONE_STAT_SUFFIXES if has_zones else STAT_SUFFIXES
+
+
+def stats_unique_id(meter_id, suffix: str) -> str:
+    """Unique ID of a meter's statistics sensor."""
+    return f"energa_{meter_id}_{suffix}_stats"
+
+
+async def async_get_last_statistics_batch(hass, statistic_ids) -> dict[str, dict]:
+    """Return ``{statistic_id: last row}`` for all ids in one executor job.
+
+    Ids without statistics (new sensors, cleared stats) are left out.
+    """
+    statistic_ids = list(statistic_ids)
+    if not statistic_ids:
+        return {}
+    return await get_instance(hass).async_add_executor_job(
+        _get_last_statistics_batch, hass, statistic_ids
+    )
+
+
+def _get_last_statistics_batch(hass, statistic_ids: list[str]) -> dict[str, dict]:
+    """Query each statistic's last row (runs in the recorder executor)."""
+    result = {}
+    for statistic_id in statistic_ids:
+        try:
+            rows = get_last_statistics(
+                hass, 1, statistic_id, True, {"sum", "start"}
+            )
+        except Exception as err:
+            _LOGGER.debug("Could not read last stats for %s: %s", statistic_id, err)
+            continue
+        if rows.get(statistic_id):
+            result[statistic_id] = rows[statistic_id][0]
+    return result
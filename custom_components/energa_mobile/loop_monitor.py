@@ -0,0 +1,97 @@
+"""Opt-in detector for integration code that blocks the event loop.
+
+Wrap synchronous sections (coordinator callbacks, statistics building,
+response parsing) in ``LoopBlockMonitor.measure()``. When the section
+takes longer than the configured threshold, a warning is logged with
+the section's context (e.g. statistic_id and point count) and the event
+is kept for the diagnostics download. With a threshold of 0 the monitor
+is disabled and ``measure()`` only yields.
+
+Only wrap code without ``await``: time spent suspended would be counted
+as blocking.
+"""
+
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+from .const import LOOP_MONITOR_MAX_EVENTS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LoopBlockMonitor:
+    """Times synchronous sections and reports the ones over a threshold."""
+
+    def __init__(self, threshold_ms: float = 0, clock=time.perf_counter) -> None:
+        self._threshold = max(0.0, float(threshold_ms)) / 1000
+        self._clock = clock
+        self._events: deque[dict] = deque(maxlen=LOOP_MONITOR_MAX_EVENTS)
+        self._sections: dict[str, dict] = {}  # name -> calls / blocked / max_ms
+
+    @property
+    def enabled(self) -> bool:
+        return self._threshold > 0
+
+    @contextmanager
+    def measure(self, name: str, **context):
+        """Time a synchronous section; context goes into the report."""
+        if not self.enabled:
+            yield
+            return
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self._record(name, self._clock() - started, context)
+
+    def _record(self, name: str, elapsed: float, context: dict) -> None:
+        elapsed_ms = round(elapsed * 1000, 1)
+        section = self._sections.setdefault(
+            name, {"calls": 0, "blocked": 0, "max_ms": 0.0}
+        )
+        section["calls"] += 1
+        section["max_ms"] = max(section["max_ms"], elapsed_ms)
+        if elapsed < self._threshold:
+            return
+        section["blocked"] += 1
+        details = ", ".join(f"{key}={value}" for key, value in context.items())
+        _LOGGER.warning(
+            "%s blocked the event loop for %.0f ms%s",
+            name,
+            elapsed_ms,
+            f" ({details})" if details else "",
+        )
+        self._events.append(
+            {
+                "at": datetime.now(UTC).isoformat(),
+                "section": name,
+                "duration_ms": elapsed_ms,
+                **{key: str(value) for key, value in context.items()},
+            }
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "threshold_ms": self._threshold * 1000,
+            "sections": {name: dict(stats) for name, stats in self._sections.items()},
+            "events": list(self._events),  # Oldest first
+        }
+
+
+class MeasuredListenersMixin:
+    """Times a ``DataUpdateCoordinator``'s listener dispatch.
+
+    Listed before ``DataUpdateCoordinator`` in the bases; the coordinator
+    needs an ``api`` with a ``loop_monitor``. Every entity's state write
+    runs in this one synchronous loop step.
+    """
+
+    def async_update_listeners(self) -> None:
+        """Notify entities under the ``coordinator_listeners`` section."""
+        with self.api.loop_monitor.measure(
+            "coordinator_listeners", listeners=len(self._listeners)
+        ):
+            super().async_update_listeners()
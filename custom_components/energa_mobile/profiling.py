@@ -0,0 +1,72 @@
+"""On-demand cProfile capture of a coordinator refresh.
+
+Used by the ``energa_mobile.profile_cycle`` service. The refresh, the
+statistics imports its listeners run and an optional history import all
+execute on the event loop thread, which is the thread being profiled.
+Work handed to the executor (recorder queries) and to the recorder
+thread shows up only as the time spent waiting for it.
+"""
+
+import cProfile
+import logging
+import pstats
+import time
+from collections.abc import Awaitable, Callable
+
+from homeassistant.util import dt as dt_util
+
+from .const import PROFILE_TOP_FUNCTIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+_active = False  # cProfile cannot nest; one capture at a time per process
+
+
+class ProfilerBusyError(Exception):
+    """A profile capture is already running."""
+
+
+async def async_profile_jobs(
+    hass, jobs: list[Callable[[], Awaitable]]
+) -> tuple[str, float]:
+    """Run ``jobs`` one after another under cProfile and write the result.
+
+    Writes ``energa_profile_<timestamp>.prof`` (pstats format, for
+    snakeviz / ``python -m pstats``) and a ``.txt`` summary of the top
+    functions by cumulative time to the config directory. Returns the
+    path prefix and the wall-clock duration in seconds.
+    """
+    global _active
+    if _active:
+        raise ProfilerBusyError("Profiling already in progress")
+    _active = True
+    try:
+        profiler = cProfile.Profile()
+        started = time.monotonic()
+        profiler.enable()
+        try:
+            for job in jobs:
+                await job()
+        finally:
+            profiler.disable()
+        elapsed = time.monotonic() - started
+    finally:
+        _active = False
+
+    base = hass.config.path(
+        f"energa_profile_{dt_util.now().strftime('%Y%m%d_%H%M%S')}"
+    )
+    # Dumping and sorting stats is blocking file I/O
+    await hass.async_add_executor_job(_write_profile, profiler, base, elapsed)
+    _LOGGER.info("Profile of %.1fs run written to %s.prof", elapsed, base)
+    return base, elapsed
+
+
+def _write_profile(profiler: cProfile.Profile, base: str, elapsed: float) -> None:
+    profiler.dump_stats(f"{base}.prof")
+    with open(f"{base}.txt", "w", encoding="utf-8") as file:
+        file.write(f"Energa profile_cycle, wall time {elapsed:.3f}s\n\n")
+        stats = pstats.Stats(profiler, stream=file)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            PROFILE_TOP_FUNCTIONS
+        )
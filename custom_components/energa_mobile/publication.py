@@ -0,0 +1,97 @@
+"""Publication lag of Energa hourly data.
+
+For each meter and series the tracker remembers the newest hour already
+seen in an ``async_get_hourly_statistics`` result. Hours newer than that
+are "first seen" now, and their lag is the time from the end of the hour
+until the result arrived. The measured lag is an upper bound: it includes
+the wait for the next coordinator cycle. It still shows how long after an
+hour ends its value becomes available, which is what poll timing needs.
+"""
+
+from collections import deque
+from datetime import datetime, timedelta
+
+from .const import PUBLICATION_LAG_SAMPLE_SIZE
+from .telemetry import percentile
+
+HOUR = timedelta(hours=1)
+
+
+class SeriesLag:
+    """Newest hour seen and recent lags (seconds) of one series."""
+
+    def __init__(self, sample_size: int = PUBLICATION_LAG_SAMPLE_SIZE) -> None:
+        self.newest_hour: datetime | None = None
+        self.lags: deque[float] = deque(maxlen=sample_size)
+
+    def as_dict(self) -> dict:
+        return {
+            "newest_hour": None
+            if self.newest_hour is None
+            else self.newest_hour.isoformat(),
+            "samples": len(self.lags),
+            "p50_min": _minutes(percentile(self.lags, 50)),
+            "p90_min": _minutes(percentile(self.lags, 90)),
+            "max_min": _minutes(max(self.lags, default=None)),
+        }
+
+
+class PublicationLagTracker:
+    """Per meter and series lag between an hour's end and its first sighting."""
+
+    def __init__(self, sample_size: int = PUBLICATION_LAG_SAMPLE_SIZE) -> None:
+        self._sample_size = sample_size
+        self._series: dict[tuple, SeriesLag] = {}
+
+    def observe(self, meter_id, stats: dict, now: datetime) -> int:
+        """Record hours first seen in a smart-fetch result; returns the count.
+
+        The first result of a series after startup only sets the baseline:
+        its hours may be a backlog fetched long after publication.
+        """
+        recorded = 0
+        for key, points in stats.items():
+            hours = [p["start"] for p in points if p.get("start") is not None]
+            if not hours:
+                continue
+            series = self._series.get((meter_id, key))
+            if series is None:
+                series = self._series[(meter_id, key)] = SeriesLag(self._sample_size)
+                series.newest_hour = max(hours)
+                continue
+            for hour in sorted(hours):
+                if hour <= series.newest_hour:
+                    continue
+                series.lags.append(max(0.0, (now - (hour + HOUR)).total_seconds()))
+                series.newest_hour = hour
+                recorded += 1
+        return recorded
+
+    def lags(self, meter_id) -> list[float]:
+        """Recent lags (seconds) of all series of a meter."""
+        return [
+            lag
+            for (meter, _key), series in self._series.items()
+            if meter == meter_id
+            for lag in series.lags
+        ]
+
+    def percentile(self, meter_id, q: float) -> float | None:
+        return percentile(self.lags(meter_id), q)
+
+    def series(self, meter_id) -> dict[str, SeriesLag]:
+        return {
+            key: series
+            for (meter, key), series in self._series.items()
+            if meter == meter_id
+        }
+
+    def as_dict(self) -> dict:
+        meters: dict[str, dict] = {}
+        for (meter, key), series in self._series.items():
+            meters.setdefault(str(meter), {})[key] = series.as_dict()
+        return meters
+
+
+def _minutes(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds / 60, 1)
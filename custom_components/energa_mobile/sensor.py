@@ -5,8 +5,10 @@ Implements invisible statistics sensors for Energy Dashboard integration.
 Supports multi-zone tariffs (G12w: strefa 1 + strefa 2).
 """
 
+import asyncio
 import logging
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
 from typing import override
 from zoneinfo import ZoneInfo
 
@@ -21,10 +23,11 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfEnergy
+from homeassistant.const import PERCENTAGE, UnitOfEnergy, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -39,17 +42,33 @@ from .const import (
     CONF_BALANCE_BASELINE_EXPORT,
     CONF_BALANCE_BASELINE_IMPORT,
     CONF_PROSUMER_COEFFICIENT,
+    CYCLE_DEADLINE,
     DEFAULT_BALANCE_BASELINE,
     DEFAULT_PROSUMER_COEFFICIENT,
     DOMAIN,
+    METER_CONCURRENCY,
     get_price_for_key,
 )
+from .last_stats import (
+    async_get_last_statistics_batch,
+    stats_suffixes,
+    stats_unique_id,
+)
+from .loop_monitor import MeasuredListenersMixin
+from .publication import PublicationLagTracker
+from .telemetry import ENDPOINT_KEYS
+from .throttle import CircuitBreaker
+from .tracing import CycleTracer
+from .watermarks import StatisticsWatermarks
 
 _LOGGER = logging.getLogger(__name__)
 
 # Timezone for Energa data
 TIMEZONE = ZoneInfo("Europe/Warsaw")
 
+# Seconds allowed for resuming the session / logging in
+LOGIN_TIMEOUT = 30
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -57,33 +76,18 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Energa sensors from config entry."""
-    api = hass.data[DOMAIN][entry.entry_id]["api"]
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
     # Get integration version for device info
     integration = await async_get_integration(hass, DOMAIN)
     sw_version = str(integration.version)  # Must be string for AwesomeVersion
 
-    # Create coordinator
-    coordinator = EnergaCoordinator(hass, api, entry)
-
-    # Initial data fetch
-    try:
-        await coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug("Energa: Initial refresh successful")
-    except Exception as err:
-        _LOGGER.warning("Energa: Initial fetch failed, will retry: %s", err)
-
-    # CRITICAL: Fetch meters directly from API to create sensors
-    # Don't rely on coordinator.data which may be empty at startup
-    try:
-        meters_list = await api.async_get_data(force_refresh=False)
-        _LOGGER.info(
-            "Energa: Fetched %d meters from API for sensor setup",
-            len(meters_list) if meters_list else 0,
-        )
-    except Exception as err:
-        _LOGGER.error("Energa: Failed to fetch meters for setup: %s", err)
-        meters_list = []
+    # Entities come from the coordinator: either the restored snapshot or
+    # the first refresh done in __init__ — no extra API round-trip here
+    meters_list = coordinator.data or []
+    _LOGGER.info(
+        "Energa: %d meters available for sensor setup", len(meters_list)
+    )
 
     # Filter active meters (total_plus > 0)
     meters_to_process = (
@@ -408,6 +412,16 @@ async def async_setup_entry(
                 )
             )
 
+        # === DIAGNOSTICS ===
+        sensors.append(
+            EnergaPublicationLagSensor(
+                coordinator=coordinator,
+                meter_id=meter_id,
+                serial=serial,
+                device_info=device_info,
+            )
+        )
+
         # === INFO SENSORS ===
 
         info_types = [
@@ -432,6 +446,49 @@ async def async_setup_entry(
                     )
                 )
 
+    # === ACCOUNT-LEVEL DIAGNOSTICS ===
+    # Not tied to a meter: live on one service device per config entry
+    service_device_info = DeviceInfo(
+        identifiers={(DOMAIN, service_device_id(entry))},
+        name="Energa My Meter API",
+        manufacturer="Energa-Operator",
+        entry_type=DeviceEntryType.SERVICE,
+        configuration_url="https://mojlicznik.energa-operator.pl",
+        sw_version=sw_version,
+    )
+    sensors.append(
+        EnergaApiStatusSensor(
+            coordinator=coordinator,
+            entry=entry,
+            device_info=service_device_info,
+        )
+    )
+    sensors.append(
+        EnergaApiRequestsSensor(
+            coordinator=coordinator,
+            entry=entry,
+            device_info=service_device_info,
+        )
+    )
+    # Per-endpoint HTTP telemetry (disabled by default, enable when tuning)
+    for endpoint in ENDPOINT_KEYS.values():
+        sensors.append(
+            EnergaEndpointLatencySensor(
+                coordinator=coordinator,
+                entry=entry,
+                device_info=service_device_info,
+                endpoint=endpoint,
+            )
+        )
+        sensors.append(
+            EnergaEndpointErrorRateSensor(
+                coordinator=coordinator,
+                entry=entry,
+                device_info=service_device_info,
+                endpoint=endpoint,
+            )
+        )
+
     _LOGGER.info("Created %d Energa sensors", len(sensors))
     _LOGGER.debug(
         "Energa: Sensor list: %s",
@@ -440,7 +497,7 @@ async def async_setup_entry(
             for s in sensors
         ],
     )
-    async_add_entities(sensors, update_before_add=True)
+    async_add_entities(sensors)
 
     # === CLEANUP STALE DEVICES ===
     # Remove devices for meters no longer returned by the API
@@ -449,6 +506,7 @@ async def async_setup_entry(
         str(m.get("meter_serial", m["meter_point_id"]))
         for m in meters_to_process
     }
+    active_serials.add(service_device_id(entry))  # Account device is not a meter
 
     dev_reg = dr.async_get(hass)
     for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id):
@@ -463,10 +521,17 @@ async def async_setup_entry(
                 break
 
 
-class EnergaCoordinator(DataUpdateCoordinator):
+def service_device_id(entry: ConfigEntry) -> str:
+    """Device identifier of the per-entry account (service) device."""
+    return f"{entry.entry_id}_service"
+
+
+class EnergaCoordinator(MeasuredListenersMixin, DataUpdateCoordinator):
     """Coordinator for fetching Energa data with smart fetch."""
 
-    def __init__(self, hass: HomeAssistant, api, entry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, api, entry, snapshot=None, watermarks=None
+    ) -> None:
         """Initialize coordinator."""
         super().__init__(
             hass,
@@ -477,15 +542,91 @@ class EnergaCoordinator(DataUpdateCoordinator):
         self.api = api
         self.entry = entry
         self._hourly_stats: dict = {}  # {meter_id: {"import_1": [...], "import_2": [...], ...}}
-        self._pre_fetched_stats: dict = {}  # {entity_id: {"sum": x, "start": dt}}
+        self._stats_entity_ids: dict = {}  # {stats unique_id: entity_id}
+        # Last imported {start, sum} per statistic; recorder only on a miss
+        self.watermarks = watermarks or StatisticsWatermarks()
         self._meter_totals: dict = {}  # {meter_id: {"import_1": x, "import_2": y, ...}}
+        self._snapshot = snapshot
+        self._session_ready = False
+        self._snapshot_meter_ids: set | None = None
+        self.tracer = CycleTracer()  # Phase timeline of recent cycles
+        self.publication_lag = PublicationLagTracker()  # Hour end -> first seen
+
+    async def async_restore_snapshot(self) -> bool:
+        """Seed coordinator data from the last snapshot (no API calls)."""
+        if self._snapshot is None:
+            return False
+        meters = await self._snapshot.async_load()
+        if not meters:
+            return False
+        self.data = meters
+        for meter in meters:
+            self._store_meter_totals(meter)
+        self._snapshot_meter_ids = {m["meter_point_id"] for m in meters}
+        _LOGGER.debug("Restored snapshot with %d meters", len(meters))
+        return True
+
+    async def _async_start_session(self) -> None:
+        """Resume the saved session or log in (first update after setup)."""
+        try:
+            await asyncio.wait_for(
+                self.api.async_resume_session(), timeout=LOGIN_TIMEOUT
+            )
+        except TimeoutError as err:
+            raise UpdateFailed("Login timeout — API nie odpowiada") from err
+        self._session_ready = True
+
+    def _store_meter_totals(self, meter: dict) -> None:
+        """Store meter totals for reference."""
+        totals = {
+            "import": float(meter.get("total_plus", 0) or 0),
+            "export": float(meter.get("total_minus", 0) or 0),
+        }
+        if meter.get("zone_count", 1) > 1:
+            totals["import_1"] = float(meter.get("total_plus_1", 0) or 0)
+            totals["import_2"] = float(meter.get("total_plus_2", 0) or 0)
+            totals["export_1"] = float(meter.get("total_minus_1", 0) or 0)
+            totals["export_2"] = float(meter.get("total_minus_2", 0) or 0)
+        self._meter_totals[meter["meter_point_id"]] = totals
+
+    def _check_meter_list(self, active_meters: list) -> None:
+        """Reload once if the API's meters differ from the snapshot's."""
+        if self._snapshot_meter_ids is None:
+            return
+        current = {m["meter_point_id"] for m in active_meters}
+        if current != self._snapshot_meter_ids:
+            _LOGGER.info("Meter list changed since last run, reloading entities")
+            self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
+        self._snapshot_meter_ids = None
 
     async def _async_update_data(self):
         """Fetch data from API using smart fetch pattern."""
+        if getattr(self, "_retrying", False):
+            # Re-login retry: same deadline, same traced cycle
+            return await self._async_update_cycle()
+        # One budget for the whole cycle (including a re-login retry);
+        # days not fetched in time are picked up by the next cycle
+        self._deadline = time.monotonic() + CYCLE_DEADLINE
+        with self.tracer.cycle(), self.api.request_budget.job("cycle"):
+            return await self._async_update_cycle()
+
+    async def _async_update_cycle(self):
+        """One update: session, meter list, then smart fetch per meter."""
+        tracer = self.tracer
         try:
+            fresh_session = False
+            if not self._session_ready:
+                with tracer.span("session_start"):
+                    await self._async_start_session()
+                fresh_session = True
+
             # Fetch meter data (force_refresh=True to update total readings
-            # from lastMeasurements on every cycle — fixes #20, #22)
-            meters = await self.api.async_get_data(force_refresh=True)
+            # from lastMeasurements on every cycle — fixes #20, #22).
+            # A just-resumed session already fetched the meter list.
+            with tracer.span("meter_refresh", cached=fresh_session):
+                meters = await self.api.async_get_data(
+                    force_refresh=not fresh_session, deadline=self._deadline
+                )
 
             # Filter active meters
             active_meters = [
@@ -494,41 +635,33 @@ class EnergaCoordinator(DataUpdateCoordinator):
                 if m.get("total_plus") and float(m.get("total_plus", 0)) > 0
             ]
 
-            for meter in active_meters:
-                meter_id = meter["meter_point_id"]
-                has_zones = meter.get("zone_count", 1) > 1
-
-                # Store meter totals for reference
-                totals = {
-                    "import": float(meter.get("total_plus", 0) or 0),
-                    "export": float(meter.get("total_minus", 0) or 0),
-                }
-                if has_zones:
-                    totals["import_1"] = float(meter.get("total_plus_1", 0) or 0)
-                    totals["import_2"] = float(meter.get("total_plus_2", 0) or 0)
-                    totals["export_1"] = float(meter.get("total_minus_1", 0) or 0)
-                    totals["export_2"] = float(meter.get("total_minus_2", 0) or 0)
-                self._meter_totals[meter_id] = totals
+            # Last imported statistic of every series: watermarks, plus one
+            # recorder job for series without one
+            with tracer.span("last_stats", meters=len(active_meters)):
+                await self._fetch_last_stats(active_meters)
 
-                # Pre-fetch last statistics for this meter (async-safe)
-                await self._fetch_last_stats_for_meter(meter_id, has_zones)
+            # Meters in parallel: the cycle takes about as long as the
+            # slowest one, and a failing meter doesn't hold up the others
+            semaphore = asyncio.Semaphore(METER_CONCURRENCY)
 
-                # Query last_stat_date for this meter (smart fetch)
-                start_date = await self._get_smart_start_date(meter_id, has_zones)
-
-                try:
-                    stats = await self.api.async_get_hourly_statistics(
-                        meter_id, start_date=start_date
-                    )
-                    self._hourly_stats[meter_id] = stats
-                except EnergaTokenExpiredError:
-                    raise  # Propagate to outer handler for re-login
-                except Exception as err:
-                    _LOGGER.warning(
-                        "Failed to fetch hourly stats for %s: %s", meter_id, err
-                    )
-                    self._hourly_stats[meter_id] = {"import": [], "export": []}
+            async def _refresh(meter: dict) -> None:
+                async with semaphore:
+                    await self._async_refresh_meter(meter)
 
+            tasks = [
+                asyncio.ensure_future(_refresh(meter)) for meter in active_meters
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # EnergaTokenExpiredError — re-login retries the whole cycle
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            self._check_meter_list(active_meters)
+            if self._snapshot is not None:
+                self._snapshot.schedule_save(active_meters)
             return active_meters
 
         except EnergaTokenExpiredError:
@@ -536,89 +669,93 @@ class EnergaCoordinator(DataUpdateCoordinator):
                 raise UpdateFailed("Token expired again after re-login")
             _LOGGER.debug("Token expired, attempting re-login")
             try:
-                await self.api.async_login()
+                with tracer.span("relogin"):
+                    await self.api.async_login()
+                self._session_ready = True
                 self._retrying = True
                 try:
                     return await self._async_update_data()
                 finally:
                     self._retrying = False
             except EnergaAuthError as err:
-                raise UpdateFailed(f"Auth error after token refresh: {err}") from err
+                raise ConfigEntryAuthFailed(err) from err
+
+        except EnergaAuthError as err:
+            raise ConfigEntryAuthFailed(err) from err
 
         except EnergaConnectionError as err:
             raise UpdateFailed(f"Connection error: {err}") from err
 
+        except (ConfigEntryAuthFailed, UpdateFailed):
+            raise
+
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    async def _get_smart_start_date(self, meter_id: str, has_zones: bool = False):
-        """Get start_date based on last imported statistic."""
-        from datetime import datetime as dt_datetime
-
-        from homeassistant.components.recorder import get_instance
-        from homeassistant.components.recorder.statistics import get_last_statistics
-        from homeassistant.helpers import entity_registry as er
-        from homeassistant.util import dt as dt_util
-
-        tz = ZoneInfo("Europe/Warsaw")
-        now = dt_datetime.now(tz)
-        default_start = now - timedelta(days=30)
+    async def _async_refresh_meter(self, meter: dict) -> None:
+        """Totals and smart fetch of one meter; errors stay with the meter."""
+        meter_id = meter["meter_point_id"]
+        has_zones = meter.get("zone_count", 1) > 1
+        try:
+            self._store_meter_totals(meter)
+
+            # Each series resumes after its own last imported hour; the
+            # fetch window starts at the series furthest behind
+            series_start = self._get_series_starts(meter_id, has_zones)
+            start_date = min(
+                series_start.values(),
+                default=datetime.now(TIMEZONE) - timedelta(days=30),
+            )
 
-        # Find entity_id for this meter's import sensor
-        registry = er.async_get(self.hass)
-        entity_id = None
+            with self.tracer.span(
+                "hourly_fetch", meter=meter_id, start=start_date.date()
+            ):
+                stats = await self.api.async_get_hourly_statistics(
+                    meter_id,
+                    start_date=start_date,
+                    deadline=self._deadline,
+                    series_start=series_start,
+                )
+            self._hourly_stats[meter_id] = stats
+            self.publication_lag.observe(meter_id, stats, datetime.now(TIMEZONE))
+        except EnergaTokenExpiredError:
+            raise  # Propagate to outer handler for re-login
+        except Exception as err:
+            _LOGGER.warning("Failed to fetch hourly stats for %s: %s", meter_id, err)
+            self._hourly_stats[meter_id] = {"import": [], "export": []}
 
-        # For G12w, check zone 1 sensor; for single zone, check import sensor
-        target_unique_id = (
-            f"energa_{meter_id}_import_1_stats"
-            if has_zones
-            else f"energa_{meter_id}_import_stats"
-        )
+    def _get_series_starts(self, meter_id: str, has_zones: bool = False) -> dict:
+        """First hour to fetch per statistics series (see _fetch_last_stats).
 
-        for entity in registry.entities.values():
-            if (
-                entity.unique_id == target_unique_id
-                and entity.platform == DOMAIN
-            ):
-                entity_id = entity.entity_id
-                break
+        A series resumes the hour after its watermark; one without a
+        watermark yet (new sensor, cleared statistics) starts 30 days back.
+        Series whose sensor is not registered are left out.
+        """
+        default_start = datetime.now(TIMEZONE) - timedelta(days=30)
+        starts = {}
+        for suffix in stats_suffixes(has_zones):
+            entity_id = self._stats_entity_ids.get(stats_unique_id(meter_id, suffix))
+            if not entity_id:
+                continue
+            last_ts = (self.watermarks.get(entity_id) or {}).get("start")
+            if last_ts is None:
+                starts[suffix] = default_start
+                continue
+            starts[suffix] = datetime.fromtimestamp(last_ts, TIMEZONE) + timedelta(
+                hours=1
+            )
 
-        if not entity_id:
+        if not starts:
             _LOGGER.debug(
                 "No entity found for meter %s, using default 30 days", meter_id
             )
-            return default_start
-
-        # Query last statistic
-        try:
-            last_stats = await get_instance(self.hass).async_add_executor_job(
-                get_last_statistics, self.hass, 1, entity_id, True, {"sum"}
+        else:
+            _LOGGER.debug(
+                "Smart fetch for %s: %s",
+                meter_id,
+                ", ".join(f"{key} from {start}" for key, start in starts.items()),
             )
-
-            if entity_id in last_stats and last_stats[entity_id]:
-                last_ts = last_stats[entity_id][0].get("start")
-                if last_ts:
-                    # Convert to datetime
-                    if isinstance(last_ts, (int, float)):
-                        last_dt = dt_util.utc_from_timestamp(last_ts).astimezone(tz)
-                    else:
-                        last_dt = last_ts.astimezone(tz)
-
-                    # Start from next hour
-                    start_date = last_dt + timedelta(hours=1)
-
-                    _LOGGER.debug(
-                        "Smart fetch for %s: last_stat=%s, start=%s",
-                        entity_id,
-                        last_dt,
-                        start_date,
-                    )
-                    return start_date
-
-        except Exception as err:
-            _LOGGER.warning("Failed to query last stats for %s: %s", entity_id, err)
-
-        return default_start
+        return starts
 
     def get_hourly_stats(self, meter_id: str, data_key: str) -> list:
         """Get hourly statistics for a meter."""
@@ -626,59 +763,49 @@ class EnergaCoordinator(DataUpdateCoordinator):
         return meter_stats.get(data_key, [])
 
     def get_pre_fetched_stats(self) -> dict:
-        """Get pre-fetched last statistics for all entities."""
-        return self._pre_fetched_stats
+        """Get last imported statistics (watermarks) for all entities."""
+        return self.watermarks.rows
 
     def get_meter_total(self, meter_id: str, data_key: str) -> float:
         """Get meter total reading from API data."""
         totals = self._meter_totals.get(meter_id, {})
         return totals.get(data_key, 0.0)
 
-    async def _fetch_last_stats_for_meter(self, meter_id: str, has_zones: bool = False):
-        """Pre-fetch last statistics for meter entities (async-safe)."""
-        from homeassistant.components.recorder import get_instance
-        from homeassistant.components.recorder.statistics import get_last_statistics
+    async def _fetch_last_stats(self, meters: list) -> None:
+        """Make sure every series of the meters has a watermark (async-safe).
+
+        The entity registry resolves every statistics sensor by unique_id.
+        Series whose watermark is verified need no recorder access; the
+        rest (first run, cold start, new or renamed sensors, cleared
+        statistics) are read and reconciled in one recorder executor job. The watermarks feed both
+        incremental imports and the smart-fetch start date.
+        """
         from homeassistant.helpers import entity_registry as er
 
         registry = er.async_get(self.hass)
+        self._stats_entity_ids = {}
+        for meter in meters:
+            for suffix in stats_suffixes(meter.get("zone_count", 1) > 1):
+                unique_id = stats_unique_id(meter["meter_point_id"], suffix)
+                # Indexed registry lookup, no scan over all entities
+                entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+                if entity_id:
+                    self._stats_entity_ids[unique_id] = entity_id
+
+        to_read = self.watermarks.to_verify(self._stats_entity_ids.values())
+        if not to_read:
+            return
+        try:
+            last_stats = await async_get_last_statistics_batch(self.hass, to_read)
+        except Exception as err:
+            _LOGGER.warning("Failed to query last stats: %s", err)
+            return
 
-        # Determine which suffixes to check
-        if has_zones:
-            suffixes = ["import_1", "import_2", "export_1", "export_2"]
-        else:
-            suffixes = ["import", "export"]
-
-        for suffix in suffixes:
-            unique_id = f"energa_{meter_id}_{suffix}_stats"
-
-            for entity in registry.entities.values():
-                if entity.unique_id == unique_id and entity.platform == DOMAIN:
-                    entity_id = entity.entity_id
-
-                    try:
-                        last_stats = await get_instance(self.hass).async_add_executor_job(
-                            get_last_statistics,
-                            self.hass,
-                            1,
-                            entity_id,
-                            True,
-                            {"sum", "start"},
-                        )
-
-                        if entity_id in last_stats and last_stats[entity_id]:
-                            self._pre_fetched_stats[entity_id] = last_stats[entity_id][
-                                0
-                            ]
-                            _LOGGER.debug(
-                                "Pre-fetched stats for %s: sum=%.3f",
-                                entity_id,
-                                last_stats[entity_id][0].get("sum", 0),
-                            )
-
-                    except Exception as err:
-                        _LOGGER.debug(
-                            "Could not pre-fetch stats for %s: %s", entity_id, err
-                        )
+        self.watermarks.reconcile(to_read, last_stats)
+        for entity_id, stat in last_stats.items():
+            _LOGGER.debug(
+                "Pre-fetched stats for %s: sum=%.3f", entity_id, stat.get("sum") or 0
+            )
 
 
 class EnergaLiveSensor(CoordinatorEntity, SensorEntity):
@@ -946,10 +1073,28 @@ class EnergaStatisticsSensor(CoordinatorEntity, SensorEntity):
         """Get price for this sensor's zone/type."""
         return get_price_for_key(dict(self._entry.options), self._data_key, meter_id=self._meter_id)
 
+    async def async_added_to_hass(self) -> None:
+        """Import stats fetched by the setup refresh (ran before this entity existed)."""
+        await super().async_added_to_hass()
+        if self.coordinator.get_hourly_stats(self._meter_id, self._data_key):
+            self._handle_coordinator_update()
+
     @override
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle coordinator update - import energy and cost statistics to recorder.
+        """Handle coordinator update - import statistics, traced as a cycle span."""
+        points = len(self.coordinator.get_hourly_stats(self._meter_id, self._data_key))
+        with (
+            self.coordinator.tracer.span("statistics_import", entity=self.entity_id),
+            self.coordinator.api.loop_monitor.measure(
+                "statistics_import", statistic_id=self.entity_id, points=points
+            ),
+        ):
+            self._import_statistics()
+        super()._handle_coordinator_update()
+
+    def _import_statistics(self) -> None:
+        """Import energy and cost statistics to recorder.
 
         Uses EnergaDataUpdater for proper incremental statistics:
         - Queries last sum from database
@@ -965,7 +1110,6 @@ class EnergaStatisticsSensor(CoordinatorEntity, SensorEntity):
 
         if not hourly_stats:
             _LOGGER.debug("No hourly stats available for %s", self.entity_id)
-            super()._handle_coordinator_update()
             return
 
         # Convert coordinator format to DataUpdater format
@@ -984,7 +1128,6 @@ class EnergaStatisticsSensor(CoordinatorEntity, SensorEntity):
                 continue
 
         if not hourly_data:
-            super()._handle_coordinator_update()
             return
 
         updater = EnergaDataUpdater(
@@ -993,16 +1136,18 @@ class EnergaStatisticsSensor(CoordinatorEntity, SensorEntity):
             pre_fetched_stats=self.coordinator.get_pre_fetched_stats(),
         )
 
-        energy_stats, cost_stats = updater.gather_stats_for_sensor(
-            meter_id=self._meter_id,
-            data_key=self._data_key,
-            hourly_data=hourly_data,
-            entity_id=self.entity_id,
-        )
+        with self.coordinator.api.loop_monitor.measure(
+            "statistics_gather", statistic_id=self.entity_id, points=len(hourly_data)
+        ):
+            energy_stats, cost_stats = updater.gather_stats_for_sensor(
+                meter_id=self._meter_id,
+                data_key=self._data_key,
+                hourly_data=hourly_data,
+                entity_id=self.entity_id,
+            )
 
         if not energy_stats:
             _LOGGER.debug("DataUpdater returned no stats for %s", self.entity_id)
-            super()._handle_coordinator_update()
             return
 
         # === IMPORT ENERGY STATISTICS ===
@@ -1023,6 +1168,12 @@ class EnergaStatisticsSensor(CoordinatorEntity, SensorEntity):
             self.entity_id,
         )
         async_import_statistics(self.hass, energy_metadata, energy_stats)
+        self.coordinator.watermarks.advance(
+            self.entity_id,
+            energy_stats[-1]["start"],
+            energy_stats[-1]["sum"],
+            cost_stats[-1]["sum"] if cost_stats else None,
+        )
 
         # === IMPORT COST STATISTICS ===
         if cost_stats:
@@ -1057,8 +1208,6 @@ class EnergaStatisticsSensor(CoordinatorEntity, SensorEntity):
             )
             async_import_statistics(self.hass, cost_metadata, cost_stats)
 
-        super()._handle_coordinator_update()
-
 
 class EnergaInfoSensor(CoordinatorEntity, SensorEntity):
     """Info sensor showing static meter details (Address, Tariff, etc)."""
@@ -1214,3 +1363,267 @@ class EnergaPriceSensor(SensorEntity):
         return get_price_for_key(
             opts, self._data_key, meter_id=self._meter_id
         )
+
+
+class EnergaApiStatusSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor exposing the API circuit breaker state.
+
+    ``closed`` = normal operation, ``open`` = Energa considered down and
+    requests fail fast, ``half_open`` = next request is a probe.
+    """
+
+    def __init__(
+        self,
+        coordinator: EnergaCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize API status sensor."""
+        super().__init__(coordinator)
+        self._breaker = coordinator.api.circuit_breaker
+
+        self._attr_name = "Status API"
+        self._attr_unique_id = f"energa_{entry.entry_id}_api_status"
+        self._attr_has_entity_name = True
+        self._attr_icon = "mdi:api"
+        self._attr_device_info = device_info
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_device_class = SensorDeviceClass.ENUM
+        self._attr_options = [
+            CircuitBreaker.CLOSED,
+            CircuitBreaker.OPEN,
+            CircuitBreaker.HALF_OPEN,
+        ]
+
+    @property
+    def native_value(self):
+        """Return circuit breaker state."""
+        return self._breaker.state
+
+    @property
+    def available(self) -> bool:
+        """Always available — it reports outages itself."""
+        return True
+
+    @property
+    def extra_state_attributes(self):
+        """Return failure details."""
+        return {
+            "consecutive_failures": self._breaker.failures,
+            "last_error": self._breaker.last_error,
+            "next_probe_in_s": round(self._breaker.retry_in()),
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Write state on every breaker transition, not only per cycle."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._breaker.add_listener(self.async_write_ha_state))
+
+
+class EnergaApiRequestsSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic count of HTTP requests sent to Energa today.
+
+    Resets at midnight (Europe/Warsaw). Attributes show the daily quota,
+    what is left of it and the request count of the last cycle/backfill.
+    """
+
+    def __init__(
+        self,
+        coordinator: EnergaCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize API requests sensor."""
+        super().__init__(coordinator)
+        self._budget = coordinator.api.request_budget
+
+        self._attr_name = "Zapytania API dziś"
+        self._attr_unique_id = f"energa_{entry.entry_id}_api_requests_today"
+        self._attr_has_entity_name = True
+        self._attr_icon = "mdi:counter"
+        self._attr_device_info = device_info
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self):
+        """Return today's request count."""
+        return self._budget.used_today
+
+    @property
+    def available(self) -> bool:
+        """Always available — the count is local."""
+        return True
+
+    @property
+    def extra_state_attributes(self):
+        """Return quota and per-job counts."""
+        last_cycle = self._budget.last_job("cycle")
+        last_backfill = self._budget.last_job("backfill")
+        return {
+            "daily_quota": self._budget.daily_quota or None,
+            "remaining": self._budget.remaining,
+            "last_cycle_requests": last_cycle.requests if last_cycle else None,
+            "last_backfill_requests": (
+                last_backfill.requests if last_backfill else None
+            ),
+        }
+
+
+class EnergaPublicationLagSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic median delay between an hour's end and its data appearing.
+
+    Measured per series by the coordinator's PublicationLagTracker; an
+    upper bound, since it includes the wait for the next update cycle.
+    """
+
+    def __init__(
+        self,
+        coordinator: EnergaCoordinator,
+        meter_id: str,
+        serial: str,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize publication lag sensor."""
+        super().__init__(coordinator)
+        self._meter_id = meter_id
+        self._tracker = coordinator.publication_lag
+
+        self._attr_name = "Opóźnienie Publikacji Danych"
+        self._attr_unique_id = f"energa_{serial}_publication_lag"
+        self._attr_has_entity_name = True
+        self._attr_icon = "mdi:clock-alert-outline"
+        self._attr_device_info = device_info
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
+        self._attr_suggested_display_precision = 0
+
+    @property
+    def native_value(self):
+        """Return median publication lag in minutes."""
+        p50 = self._tracker.percentile(self._meter_id, 50)
+        return None if p50 is None else round(p50 / 60, 1)
+
+    @property
+    def extra_state_attributes(self):
+        """Return lag percentiles overall and per series."""
+        p90 = self._tracker.percentile(self._meter_id, 90)
+        p99 = self._tracker.percentile(self._meter_id, 99)
+        return {
+            "p90_min": None if p90 is None else round(p90 / 60, 1),
+            "p99_min": None if p99 is None else round(p99 / 60, 1),
+            "samples": len(self._tracker.lags(self._meter_id)),
+            "series": {
+                key: series.as_dict()
+                for key, series in self._tracker.series(self._meter_id).items()
+            },
+        }
+
+
+class EnergaEndpointLatencySensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic p90 latency of one API endpoint (time to response headers).
+
+    Attributes carry the rest of the endpoint's telemetry: p50/p99,
+    request, retry and byte counts, and status codes seen.
+    """
+
+    def __init__(
+        self,
+        coordinator: EnergaCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+        endpoint: str,
+    ) -> None:
+        """Initialize endpoint latency sensor."""
+        super().__init__(coordinator)
+        self._stats = coordinator.api.telemetry.stats(endpoint)
+
+        self._attr_name = f"Opóźnienie {endpoint}"
+        self._attr_unique_id = f"energa_{entry.entry_id}_latency_{endpoint}"
+        self._attr_has_entity_name = True
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_device_info = device_info
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_suggested_display_precision = 0
+
+    @property
+    def native_value(self):
+        """Return p90 latency in ms over the recent sample."""
+        p90 = self._stats.percentile(90)
+        return None if p90 is None else round(p90 * 1000)
+
+    @property
+    def available(self) -> bool:
+        """Available regardless of the last update — it measures outages too."""
+        return True
+
+    @property
+    def extra_state_attributes(self):
+        """Return percentiles and counters."""
+        data = self._stats.as_dict()
+        latency = data["latency_s"]
+        return {
+            "p50_ms": _to_ms(latency["p50"]),
+            "p99_ms": _to_ms(latency["p99"]),
+            "samples": latency["samples"],
+            "requests": data["requests"],
+            "retries": data["retries"],
+            "response_bytes": data["response_bytes"],
+            "status_codes": data["status_codes"],
+        }
+
+
+class EnergaEndpointErrorRateSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic share of failed requests (HTTP >= 400 or client error)."""
+
+    def __init__(
+        self,
+        coordinator: EnergaCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+        endpoint: str,
+    ) -> None:
+        """Initialize endpoint error rate sensor."""
+        super().__init__(coordinator)
+        self._stats = coordinator.api.telemetry.stats(endpoint)
+
+        self._attr_name = f"Błędy {endpoint}"
+        self._attr_unique_id = f"energa_{entry.entry_id}_error_rate_{endpoint}"
+        self._attr_has_entity_name = True
+        self._attr_icon = "mdi:alert-circle-outline"
+        self._attr_device_info = device_info
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = PERCENTAGE
+        self._attr_suggested_display_precision = 1
+
+    @property
+    def native_value(self):
+        """Return error rate in percent since startup."""
+        rate = self._stats.error_rate
+        return None if rate is None else round(rate * 100, 2)
+
+    @property
+    def available(self) -> bool:
+        """Available regardless of the last update — it measures outages too."""
+        return True
+
+    @property
+    def extra_state_attributes(self):
+        """Return error breakdown."""
+        return {
+            "requests": self._stats.requests,
+            "errors": self._stats.errors,
+            "exceptions": dict(self._stats.exceptions),
+        }
+
+
+def _to_ms(seconds: float | None) -> int | None:
+    return None if seconds is None else round(seconds * 1000)
@@ -0,0 +1,65 @@
+"""Persistent snapshot of the last successful coordinator update.
+
+Setup creates entities from this snapshot right away instead of waiting
+for a login and a full refresh against the Energa API.
+"""
+
+import logging
+from datetime import date
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 5  # Seconds
+
+
+class EnergaSnapshot:
+    """Last known meter list with totals and daily values.
+
+    Backed by an HA ``Store``; ``contract_date`` (a ``date``) is stored
+    as an ISO string and parsed back on load.
+    """
+
+    def __init__(self, store) -> None:
+        self._store = store
+        self._meters: list[dict] = []
+
+    async def async_load(self) -> list[dict] | None:
+        """Return the saved meter list, or None when there is none."""
+        try:
+            data = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not load snapshot, ignoring it: %s", err)
+            return None
+        if not data or not isinstance(data.get("meters"), list):
+            return None
+        meters = [_decode_meter(m) for m in data["meters"] if isinstance(m, dict)]
+        if not meters:
+            return None
+        _LOGGER.debug("Loaded snapshot with %d meters", len(meters))
+        return meters
+
+    def schedule_save(self, meters: list[dict]) -> None:
+        """Persist the meter list after a successful update."""
+        self._meters = list(meters)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {"meters": [_encode_meter(m) for m in self._meters]}
+
+
+def _encode_meter(meter: dict) -> dict:
+    encoded = dict(meter)
+    if isinstance(encoded.get("contract_date"), date):
+        encoded["contract_date"] = encoded["contract_date"].isoformat()
+    return encoded
+
+
+def _decode_meter(meter: dict) -> dict:
+    decoded = dict(meter)
+    if isinstance(decoded.get("contract_date"), str):
+        try:
+            decoded["contract_date"] = date.fromisoformat(decoded["contract_date"])
+        except ValueError:
+            decoded["contract_date"] = None
+    return decoded
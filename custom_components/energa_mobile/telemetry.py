@@ -0,0 +1,177 @@
+"""HTTP telemetry for the Energa API session.
+
+Every request made through the dedicated aiohttp session is observed via
+``aiohttp.TraceConfig`` hooks: latency (time to response headers),
+response size, status codes and client errors, grouped per endpoint.
+Retries are reported by ``EnergaAPI._api_request``, which is the only
+place that knows a request is a repeat.
+"""
+
+import bisect
+import math
+import time
+from collections import Counter, deque
+
+import aiohttp
+
+from .const import (
+    CHART_ENDPOINT,
+    DATA_ENDPOINT,
+    LOGIN_ENDPOINT,
+    SESSION_ENDPOINT,
+    TELEMETRY_LATENCY_BUCKETS,
+    TELEMETRY_SAMPLE_SIZE,
+)
+
+# Stable keys used in sensor unique IDs and the diagnostics download
+ENDPOINT_KEYS = {
+    SESSION_ENDPOINT: "session_status",
+    LOGIN_ENDPOINT: "user_login",
+    DATA_ENDPOINT: "user_data",
+    CHART_ENDPOINT: "mchart",
+}
+OTHER_ENDPOINT = "other"
+
+
+class EndpointStats:
+    """Counters and a rolling latency sample for one endpoint."""
+
+    def __init__(self, sample_size: int = TELEMETRY_SAMPLE_SIZE) -> None:
+        self.requests = 0
+        self.errors = 0  # Client errors/timeouts and HTTP status >= 400
+        self.retries = 0
+        self.response_bytes = 0
+        self.status_codes: Counter = Counter()
+        self.exceptions: Counter = Counter()
+        self.last_latency: float | None = None
+        self._latencies: deque[float] = deque(maxlen=sample_size)
+        # Cumulative since start; last bucket is "slower than the largest bound"
+        self._histogram = [0] * (len(TELEMETRY_LATENCY_BUCKETS) + 1)
+
+    def record(
+        self, latency: float, status: int | None = None, error: str | None = None
+    ) -> None:
+        self.requests += 1
+        self.last_latency = latency
+        self._latencies.append(latency)
+        self._histogram[bisect.bisect_left(TELEMETRY_LATENCY_BUCKETS, latency)] += 1
+        if status is not None:
+            self.status_codes[status] += 1
+            if status >= 400:
+                self.errors += 1
+        if error is not None:
+            self.exceptions[error] += 1
+            self.errors += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Latency percentile (nearest rank) over the recent sample."""
+        return percentile(self._latencies, q)
+
+    @property
+    def error_rate(self) -> float | None:
+        """Share of failed requests (0.0–1.0), None before the first one."""
+        if not self.requests:
+            return None
+        return self.errors / self.requests
+
+    def histogram(self) -> dict[str, int]:
+        bounds = [f"le_{b:g}s" for b in TELEMETRY_LATENCY_BUCKETS] + ["inf"]
+        return dict(zip(bounds, self._histogram))
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": _round(self.error_rate, 4),
+            "retries": self.retries,
+            "response_bytes": self.response_bytes,
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+            "exceptions": dict(self.exceptions),
+            "latency_s": {
+                "last": _round(self.last_latency),
+                "p50": _round(self.percentile(50)),
+                "p90": _round(self.percentile(90)),
+                "p99": _round(self.percentile(99)),
+                "samples": len(self._latencies),
+            },
+            "latency_histogram": self.histogram(),
+        }
+
+
+class HttpTelemetry:
+    """Per-endpoint request statistics for one config entry."""
+
+    def __init__(self, sample_size: int = TELEMETRY_SAMPLE_SIZE) -> None:
+        self._sample_size = sample_size
+        self._endpoints: dict[str, EndpointStats] = {
+            key: EndpointStats(sample_size) for key in ENDPOINT_KEYS.values()
+        }
+        self._started = time.time()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Trace hooks to pass to a new session (``trace_configs=[...]``)."""
+        config = aiohttp.TraceConfig()
+        config.on_request_start.append(self._on_request_start)
+        config.on_request_end.append(self._on_request_end)
+        config.on_request_exception.append(self._on_request_exception)
+        config.on_response_chunk_received.append(self._on_response_chunk)
+        return config
+
+    def stats(self, endpoint: str) -> EndpointStats:
+        """Statistics for an endpoint key (see ``ENDPOINT_KEYS``)."""
+        if endpoint not in self._endpoints:
+            self._endpoints[endpoint] = EndpointStats(self._sample_size)
+        return self._endpoints[endpoint]
+
+    def record_retry(self, path: str) -> None:
+        self.stats(ENDPOINT_KEYS.get(path, OTHER_ENDPOINT)).retries += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "since": time.strftime(
+                "%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._started)
+            ),
+            "endpoints": {
+                key: stats.as_dict() for key, stats in self._endpoints.items()
+            },
+        }
+
+    @staticmethod
+    def endpoint_for(url) -> str:
+        path = str(getattr(url, "path", url))
+        for endpoint, key in ENDPOINT_KEYS.items():
+            if path.endswith(endpoint):
+                return key
+        return OTHER_ENDPOINT
+
+    async def _on_request_start(self, session, ctx, params) -> None:
+        ctx.energa_endpoint = self.endpoint_for(params.url)
+        ctx.energa_started = time.monotonic()
+
+    async def _on_request_end(self, session, ctx, params) -> None:
+        self.stats(ctx.energa_endpoint).record(
+            time.monotonic() - ctx.energa_started, status=params.response.status
+        )
+
+    async def _on_request_exception(self, session, ctx, params) -> None:
+        self.stats(ctx.energa_endpoint).record(
+            time.monotonic() - ctx.energa_started,
+            error=type(params.exception).__name__,
+        )
+
+    async def _on_response_chunk(self, session, ctx, params) -> None:
+        # Sent once per read() with the decoded body
+        self.stats(ctx.energa_endpoint).response_bytes += len(params.chunk)
+
+
+def percentile(values, q: float) -> float | None:
+    """Nearest-rank percentile of ``values``, None when empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(q / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def _round(value: float | None, digits: int = 3) -> float | None:
+    return None if value is None else round(value, digits)
@@ -0,0 +1,391 @@
+"""Request throttling for the Energa API."""
+
+import asyncio
+import itertools
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .const import (
+    AIMD_DECREASE_FACTOR,
+    AIMD_INITIAL_LIMIT,
+    AIMD_LATENCY_TARGET,
+    BACKFILL_STARVATION_LIMIT,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURE_THRESHOLD,
+    PRIORITY_LIVE,
+    RETRY_BASE_DELAY,
+    RETRY_BUDGET,
+    RETRY_MAX_DELAY,
+    RETRY_MAX_RETRIES,
+    RETRY_MAX_RETRY_AFTER,
+)
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Priority-aware token-bucket rate limiter shared by an EnergaAPI.
+
+    Allows short bursts of up to ``burst`` requests, then paces callers
+    to ``rate`` requests per second. Waiting callers are served by
+    priority (``PRIORITY_LIVE`` before ``PRIORITY_BACKFILL``), FIFO within
+    a priority. After ``starvation_limit`` consecutive grants to a higher
+    priority while lower-priority callers wait, the oldest of those gets
+    the next token, so a long import keeps moving under live traffic.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock=time.monotonic,
+        starvation_limit: int = BACKFILL_STARVATION_LIMIT,
+    ) -> None:
+        self._rate = max(0.01, float(rate))
+        self._capacity = max(1, int(burst))
+        self._tokens = float(self._capacity)
+        self._clock = clock
+        self._updated = clock()
+        self._starvation_limit = max(1, int(starvation_limit))
+        self._queues: dict[int, deque] = {}  # priority -> (seq, future)
+        self._seq = itertools.count()
+        self._streak = 0  # Grants that jumped ahead of waiting lower priorities
+        self._dispatcher: asyncio.Task | None = None
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        return self._capacity
+
+    def waiting(self, priority: int | None = None) -> int:
+        """Number of callers queued (optionally for one priority)."""
+        if priority is not None:
+            return len(self._queues.get(priority, ()))
+        return sum(len(q) for q in self._queues.values())
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    async def acquire(self, priority: int = PRIORITY_LIVE) -> None:
+        """Wait until a request of the given priority may be sent."""
+        self._refill()
+        if self._tokens >= 1 and not self.waiting():
+            self._tokens -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(priority, deque()).append((next(self._seq), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Token was granted but the caller went away: give it back
+                self._tokens = min(self._capacity, self._tokens + 1)
+            raise
+
+    async def _dispatch(self) -> None:
+        """Hand out tokens to queued callers as they refill."""
+        while self._prune():
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                continue
+            future = self._next_waiter()
+            self._tokens -= 1
+            future.set_result(None)
+
+    def _prune(self) -> bool:
+        """Drop cancelled waiters; True while anyone is still queued."""
+        for priority, queue in list(self._queues.items()):
+            while queue and queue[0][1].done():
+                queue.popleft()
+            if not queue:
+                del self._queues[priority]
+        return bool(self._queues)
+
+    def _next_waiter(self) -> asyncio.Future:
+        priorities = sorted(self._queues)
+        chosen = priorities[0]
+        if len(priorities) > 1:
+            if self._streak >= self._starvation_limit:
+                # Oldest waiter among the lower priorities goes next
+                chosen = min(priorities[1:], key=lambda p: self._queues[p][0][0])
+                self._streak = 0
+            else:
+                self._streak += 1
+        else:
+            self._streak = 0
+        queue = self._queues[chosen]
+        _seq, future = queue.popleft()
+        if not queue:
+            del self._queues[chosen]
+        return future
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter, Retry-After and a per-call budget.
+
+    ``next_delay`` returns how long to wait before retry number ``retries``
+    (0-based), or None once the retry count or time budget is spent.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = RETRY_MAX_RETRIES,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        max_retry_after: float = RETRY_MAX_RETRY_AFTER,
+        budget: float = RETRY_BUDGET,
+        rng=random.random,
+    ) -> None:
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self._rng = rng
+
+    def next_delay(
+        self, retries: int, waited: float, retry_after: str | None = None
+    ) -> float | None:
+        """Delay before the next retry, or None when the budget is spent."""
+        if retries >= self.max_retries:
+            return None
+        backoff = min(self.max_delay, self.base_delay * (2**retries))
+        # "Equal jitter": half fixed, half random — spreads out retries
+        # from concurrent requests without collapsing to zero
+        delay = backoff / 2 + self._rng() * backoff / 2
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            delay = max(delay, min(server_delay, self.max_retry_after))
+        if waited + delay > self.budget:
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    """Fail fast while the Energa backend is down.
+
+    Opens after ``failure_threshold`` consecutive failed requests. While
+    open, requests are refused without touching the network. After
+    ``cooldown`` seconds a single probe request is let through: success
+    closes the circuit, failure re-opens it for another cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        cooldown: float = CIRCUIT_COOLDOWN,
+        clock=time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = cooldown
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+        self._last_error: str | None = None
+        self._listeners: list = []
+
+    @property
+    def state(self) -> str:
+        """Current state; an open circuit past its cooldown reports half-open."""
+        if self._state == self.OPEN and self._cooldown_elapsed():
+            return self.HALF_OPEN
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    @property
+    def last_error(self) -> str | None:
+        return self._last_error
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when not open)."""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.cooldown - self._clock())
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now (claims the probe slot)."""
+        if self._state == self.CLOSED:
+            return True
+        if self._state == self.OPEN:
+            if not self._cooldown_elapsed():
+                return False
+            self._set_state(self.HALF_OPEN)
+        # Half-open: one probe at a time. A probe that never reports back
+        # (e.g. cancelled) frees the slot after another cooldown.
+        now = self._clock()
+        if self._probe_started is not None and now - self._probe_started < self.cooldown:
+            return False
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        """The backend answered; close the circuit."""
+        self._failures = 0
+        self._probe_started = None
+        if self._state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def record_failure(self, error: str | None = None) -> None:
+        """A request failed for backend reasons (after its own retries)."""
+        self._failures += 1
+        self._last_error = error
+        self._probe_started = None
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            self._set_state(self.OPEN)
+
+    def add_listener(self, listener):
+        """Call ``listener()`` on every state change; returns a remover."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _cooldown_elapsed(self) -> bool:
+        return self._clock() - self._opened_at >= self.cooldown
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        for listener in list(self._listeners):
+            listener()
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on concurrent chart requests.
+
+    Each finished attempt reports its latency, or ``PUSHBACK`` for a 429,
+    5xx, timeout or dropped connection. A success under
+    ``latency_target`` adds ``1/limit`` (about +1 per window of
+    ``limit`` requests); pushback or a slow success multiplies the limit
+    by ``decrease_factor``, at most once per window so one burst of
+    errors is only counted once. The limit stays within
+    ``[min_limit, max_limit]``. Freed slots go to waiting callers by
+    priority (``PRIORITY_LIVE`` first), FIFO within a priority, so a
+    live chart request never queues behind a backfill.
+    """
+
+    PUSHBACK = "pushback"
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial: float = AIMD_INITIAL_LIMIT,
+        min_limit: int = 1,
+        latency_target: float = AIMD_LATENCY_TARGET,
+        decrease_factor: float = AIMD_DECREASE_FACTOR,
+    ) -> None:
+        self._max = max(1, int(max_limit))
+        self._min = max(1, min(int(min_limit), self._max))
+        self._latency_target = latency_target
+        self._decrease_factor = decrease_factor
+        self._limit = self._clamp(initial)
+        self._in_flight = 0
+        self._waiters: dict[int, deque[asyncio.Future]] = {}  # priority -> FIFO
+        self._since_decrease = self._max  # First congestion signal acts at once
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        return self._max
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def restore(self, limit: float) -> None:
+        """Start from a limit learned in an earlier run."""
+        self._limit = self._clamp(limit)
+
+    def _clamp(self, limit: float) -> float:
+        return float(min(self._max, max(self._min, limit)))
+
+    def waiting(self, priority: int | None = None) -> int:
+        """Number of callers queued (optionally for one priority)."""
+        if priority is not None:
+            return len(self._waiters.get(priority, ()))
+        return sum(len(q) for q in self._waiters.values())
+
+    async def acquire(self, priority: int = PRIORITY_LIVE) -> None:
+        """Wait for a free slot under the current limit."""
+        if self._in_flight < self.limit and not self.waiting():
+            self._in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(priority, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over but the caller went away
+                self.release()
+            raise
+
+    def release(self, outcome: float | str | None = None) -> None:
+        """Free a slot; ``outcome`` is latency (s), PUSHBACK or None (no signal)."""
+        self._in_flight -= 1
+        if outcome is not None:
+            self._record(outcome)
+        self._wake()
+
+    def _record(self, outcome: float | str) -> None:
+        self._since_decrease += 1
+        if outcome == self.PUSHBACK or outcome > self._latency_target:
+            if self._since_decrease >= self.limit:
+                self._limit = self._clamp(self._limit * self._decrease_factor)
+                self._since_decrease = 0
+        else:
+            self._limit = self._clamp(self._limit + 1 / self._limit)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            priority = min(self._waiters)
+            queue = self._waiters[priority]
+            future = queue.popleft()
+            if not queue:
+                del self._waiters[priority]
+            if future.done():
+                continue
+            self._in_flight += 1
+            future.set_result(None)
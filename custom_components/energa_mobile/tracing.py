@@ -0,0 +1,109 @@
+"""Lightweight span tracing of coordinator update cycles.
+
+The coordinator wraps each update in ``CycleTracer.cycle()`` and its
+phases (login, meter refresh, last-stats lookup, hourly fetch per
+meter) in ``CycleTracer.span()``. Statistics sensors record their
+recorder imports as spans of the cycle that produced the data. The last
+cycles are kept as a timeline for the diagnostics download.
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+from .const import TRACE_MAX_CYCLES, TRACE_MAX_SPANS
+
+
+class CycleTrace:
+    """Timeline of one coordinator update cycle."""
+
+    def __init__(self, clock=time.monotonic) -> None:
+        self._clock = clock
+        self.started_at = datetime.now(UTC)
+        self._t0 = clock()
+        self.duration: float | None = None  # Set when the update returns
+        self.outcome: str | None = None  # "ok" or the exception class name
+        self.spans: list[dict] = []
+        self.dropped_spans = 0
+
+    def offset(self) -> float:
+        return self._clock() - self._t0
+
+    def add_span(self, span: dict) -> None:
+        if len(self.spans) >= TRACE_MAX_SPANS:
+            self.dropped_spans += 1
+            return
+        self.spans.append(span)
+
+    def finish(self, outcome: str) -> None:
+        self.duration = self.offset()
+        self.outcome = outcome
+
+    def as_dict(self) -> dict:
+        slowest = max(self.spans, key=lambda s: s["duration_s"], default=None)
+        return {
+            "started_at": self.started_at.isoformat(),
+            "duration_s": None if self.duration is None else round(self.duration, 3),
+            "outcome": self.outcome,
+            "slowest_span": None if slowest is None else slowest["name"],
+            "dropped_spans": self.dropped_spans,
+            "spans": self.spans,
+        }
+
+
+class CycleTracer:
+    """Keeps the last ``max_cycles`` update cycles with their spans."""
+
+    def __init__(self, max_cycles: int = TRACE_MAX_CYCLES, clock=time.monotonic):
+        self._clock = clock
+        self._cycles: deque[CycleTrace] = deque(maxlen=max_cycles)
+
+    @property
+    def current(self) -> CycleTrace | None:
+        """The running cycle, or the last one (late spans attach to it)."""
+        return self._cycles[-1] if self._cycles else None
+
+    @contextmanager
+    def cycle(self):
+        """Trace one update cycle; the outcome is the exception raised, if any."""
+        trace = CycleTrace(self._clock)
+        self._cycles.append(trace)
+        try:
+            yield trace
+        except BaseException as err:
+            trace.finish(type(err).__name__)
+            raise
+        trace.finish("ok")
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """Record a phase of the current cycle (no-op before the first cycle)."""
+        trace = self.current
+        if trace is None:
+            yield
+            return
+        start = trace.offset()
+        error = None
+        try:
+            yield
+        except BaseException as err:
+            error = type(err).__name__
+            raise
+        finally:
+            span = {
+                "name": name,
+                "start_s": round(start, 3),
+                "duration_s": round(trace.offset() - start, 3),
+            }
+            span.update(
+                (key, value if isinstance(value, (int, float, bool)) else str(value))
+                for key, value in attrs.items()
+            )
+            if error is not None:
+                span["error"] = error
+            trace.add_span(span)
+
+    def as_dict(self) -> list[dict]:
+        """Cycles oldest first."""
+        return [trace.as_dict() for trace in self._cycles]
@@ -0,0 +1,85 @@
+"""HTTP transport settings for the dedicated Energa aiohttp session."""
+
+from dataclasses import dataclass
+
+import aiohttp
+
+from .const import (
+    CONF_FETCH_CONCURRENCY,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_REQUEST_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_CONNECTION_HEADROOM,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+)
+
+
+@dataclass(frozen=True)
+class TransportProfile:
+    """Connection pool, keep-alive, DNS cache, compression and timeouts.
+
+    A smart-fetch cycle makes dozens of mchart calls to a single host;
+    keeping a small pool of warm connections avoids a TLS handshake per
+    request, and gzip shrinks the JSON payloads.
+    """
+
+    limit_per_host: int = DEFAULT_FETCH_CONCURRENCY + HTTP_CONNECTION_HEADROOM
+    keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT
+    dns_cache_ttl: int = HTTP_DNS_CACHE_TTL
+    connect_timeout: float = HTTP_CONNECT_TIMEOUT
+    request_timeout: float = DEFAULT_REQUEST_TIMEOUT
+    compression: bool = True
+
+    @classmethod
+    def from_options(cls, options) -> "TransportProfile":
+        """Build a profile from config entry options."""
+        concurrency = int(
+            options.get(CONF_FETCH_CONCURRENCY, DEFAULT_FETCH_CONCURRENCY)
+        )
+        return cls(
+            limit_per_host=max(1, concurrency) + HTTP_CONNECTION_HEADROOM,
+            request_timeout=float(
+                options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+            ),
+        )
+
+    def connector(self) -> aiohttp.TCPConnector:
+        # Only one host is ever contacted, so the total pool equals the per-host pool
+        return aiohttp.TCPConnector(
+            limit=self.limit_per_host,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.request_timeout,
+            connect=min(self.connect_timeout, self.request_timeout),
+        )
+
+    def headers(self) -> dict:
+        if not self.compression:
+            return {}
+        # aiohttp decompresses gzip/deflate bodies transparently
+        return {"Accept-Encoding": "gzip, deflate"}
+
+
+def create_client_session(
+    profile: TransportProfile | None = None, **kwargs
+) -> aiohttp.ClientSession:
+    """Create an aiohttp session configured by ``profile``.
+
+    Must be called from within the event loop (the connector binds to it).
+    Extra keyword arguments are passed to ``aiohttp.ClientSession``.
+    """
+    profile = profile or TransportProfile()
+    return aiohttp.ClientSession(
+        connector=profile.connector(),
+        timeout=profile.timeout(),
+        headers=profile.headers(),
+        **kwargs,
+    )
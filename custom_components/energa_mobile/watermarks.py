@@ -0,0 +1,203 @@
+"""Write-through watermarks of the statistics this integration imported.
+
+A watermark is the last ``start``/``sum`` (and cost ``sum``) written for a
+statistic_id. It advances as each import is queued and is persisted via
+an HA ``Store``, so the next cycle (and the next HA start) knows where
+every series ends without asking the recorder. The recorder is read for
+series without a watermark (first run, a new or renamed sensor, or after
+``invalidate``), once per series for watermarks loaded from disk, and on
+every cycle for series the user was asked to clear by hand. Whenever the
+recorder disagrees, e.g. a watermark points past a cleared statistic, the
+recorder wins.
+"""
+
+import logging
+from datetime import UTC, datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Longer than the recorder commit interval, so a crash cannot leave a
+# watermark ahead of what the recorder actually stored
+SAVE_DELAY = 30  # Seconds
+
+
+class StatisticsWatermarks:
+    """``{statistic_id: {"start": ts, "sum": x, "cost_sum": y}}``.
+
+    ``start`` is a UTC timestamp (the recorder's own format), so
+    ``get()`` can stand in for a ``get_last_statistics`` row.
+    """
+
+    def __init__(self, store=None) -> None:
+        self._store = store
+        self._marks: dict[str, dict] = {}
+        self._verified: set[str] = set()  # Marks known to match the recorder
+        self._recheck: set[str] = set()  # Manual clear pending: read every cycle
+        self._recorder_reads = 0
+        self._mismatches = 0
+
+    async def async_load(self) -> None:
+        """Load persisted watermarks; a bad file means a cold start."""
+        if self._store is None:
+            return
+        try:
+            data = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not load statistics watermarks: %s", err)
+            return
+        if data and isinstance(data.get("marks"), dict):
+            self._marks = {
+                statistic_id: mark
+                for statistic_id, mark in data["marks"].items()
+                if isinstance(mark, dict) and mark.get("start") is not None
+            }
+            _LOGGER.debug("Loaded %d statistics watermarks", len(self._marks))
+
+    @property
+    def rows(self) -> dict[str, dict]:
+        """Live ``{statistic_id: mark}`` view (last rows for imports)."""
+        return self._marks
+
+    def get(self, statistic_id: str) -> dict | None:
+        return self._marks.get(statistic_id)
+
+    def to_verify(self, statistic_ids) -> list[str]:
+        """Ids the recorder has to be asked about.
+
+        Those without a watermark, those loaded from disk and not yet
+        checked this run (cold start), and those awaiting a manual clear.
+        """
+        return [
+            sid
+            for sid in statistic_ids
+            if sid not in self._verified or sid in self._recheck
+        ]
+
+    def reconcile(self, statistic_ids, rows: dict[str, dict]) -> None:
+        """Align the watermarks of ``statistic_ids`` with recorder rows.
+
+        ``rows`` holds the last row of each id that has statistics; an id
+        without a row has none (new sensor or cleared statistics).
+        """
+        self._recorder_reads += 1
+        changed = False
+        for statistic_id in statistic_ids:
+            row = rows.get(statistic_id)
+            mark = self._marks.get(statistic_id)
+            if row is None or row.get("start") is None or row.get("sum") is None:
+                self._recheck.discard(statistic_id)  # Cleared: nothing to wait for
+                self._verified.discard(statistic_id)
+                if mark is not None:
+                    _LOGGER.info(
+                        "Watermark of %s is ahead of the recorder (no statistics), "
+                        "dropping it",
+                        statistic_id,
+                    )
+                    self._mismatches += 1
+                    del self._marks[statistic_id]
+                    changed = True
+                continue
+            start = _timestamp(row["start"])
+            if mark is None or mark["start"] != start or mark["sum"] != row["sum"]:
+                if mark is not None:
+                    _LOGGER.info(
+                        "Watermark of %s does not match the recorder, using the "
+                        "recorder's last row",
+                        statistic_id,
+                    )
+                    self._mismatches += 1
+                self._marks[statistic_id] = {
+                    "start": start,
+                    "sum": row["sum"],
+                    "cost_sum": None,
+                }
+                changed = True
+            self._verified.add(statistic_id)
+        if changed:
+            self._schedule_save()
+
+    def advance(
+        self,
+        statistic_id: str,
+        start,
+        energy_sum: float,
+        cost_sum: float | None = None,
+    ) -> None:
+        """Record the newest row of an import that was just queued."""
+        start = _timestamp(start)
+        mark = self._marks.get(statistic_id)
+        if mark is not None and start < mark["start"]:
+            return  # Never move backwards
+        self._marks[statistic_id] = {
+            "start": start,
+            "sum": energy_sum,
+            "cost_sum": cost_sum,
+        }
+        self._verified.add(statistic_id)  # Written by us
+        self._schedule_save()
+
+    def invalidate(self, statistic_ids=None) -> None:
+        """Forget watermarks (all when ``statistic_ids`` is None).
+
+        Used when statistics are cleared or rewritten outside the
+        incremental import; the next cycle reads them from the recorder.
+        """
+        if statistic_ids is None:
+            dropped = len(self._marks)
+            self._marks.clear()
+            self._verified.clear()
+        else:
+            statistic_ids = list(statistic_ids)
+            self._verified.difference_update(statistic_ids)
+            dropped = sum(
+                self._marks.pop(sid, None) is not None for sid in statistic_ids
+            )
+        if dropped:
+            _LOGGER.debug("Invalidated %d statistics watermarks", dropped)
+            self._schedule_save()
+
+    def expect_manual_clear(self, statistic_ids) -> None:
+        """The user was asked to clear these statistics by hand.
+
+        They are read from the recorder on every cycle until it reports
+        them empty; then the watermark is dropped and the series is
+        imported afresh. Until then the recorder's last row is used.
+        """
+        statistic_ids = list(statistic_ids)
+        self.invalidate(statistic_ids)
+        self._recheck.update(statistic_ids)
+
+    async def async_save(self) -> None:
+        """Write now (unload), instead of waiting for the delayed save."""
+        if self._store is not None:
+            await self._store.async_save(self._data_to_save())
+
+    def as_dict(self) -> dict:
+        return {
+            "recorder_reads": self._recorder_reads,
+            "mismatches": self._mismatches,
+            "unverified": sorted(set(self._marks) - self._verified),
+            "manual_clear_pending": sorted(self._recheck),
+            "marks": {
+                statistic_id: {
+                    **mark,
+                    "start": datetime.fromtimestamp(mark["start"], UTC).isoformat(),
+                }
+                for statistic_id, mark in self._marks.items()
+            },
+        }
+
+    def _schedule_save(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {"marks": self._marks}
+
+
+def _timestamp(value) -> float:
+    """Recorder rows carry float timestamps, imports carry datetimes."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
@@ -13,12 +13,14 @@ _HA_MODULES = [
     "homeassistant.helpers",
     "homeassistant.helpers.aiohttp_client",
     "homeassistant.helpers.selector",
+    "homeassistant.helpers.storage",
     "homeassistant.helpers.entity_registry",
     "homeassistant.helpers.update_coordinator",
     "homeassistant.helpers.entity",
     "homeassistant.helpers.entity_platform",
     "homeassistant.helpers.frame",
     "homeassistant.components",
+    "homeassistant.components.diagnostics",
     "homeassistant.components.sensor",
     "homeassistant.components.recorder",
     "homeassistant.components.recorder.models",
@@ -154,10 +156,11 @@ def g12w_user_data():
     }
 
 
-def make_mock_response(status=200, json_data=None):
+def make_mock_response(status=200, json_data=None, headers=None):
     """Create a mock aiohttp response with __aenter__/__aexit__."""
     response = AsyncMock()
     response.status = status
+    response.headers = headers or {}
     response.json = AsyncMock(return_value=json_data or {})
     response.raise_for_status = MagicMock()
     if status >= 400:
@@ -1,14 +1,27 @@
 """Tests for EnergaAPI — login, retry, token refresh."""
 
+import asyncio
+import time
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
 
 import aiohttp
 import pytest
+from yarl import URL
 
 from custom_components.energa_mobile.api import (
+    _REQUEST_PRIORITY,
     EnergaAuthError,
     EnergaConnectionError,
+    EnergaDeadlineExceeded,
     EnergaTokenExpiredError,
+    request_priority,
+)
+from custom_components.energa_mobile.const import (
+    CHART_ENDPOINT,
+    PRIORITY_BACKFILL,
+    PRIORITY_LIVE,
 )
 from tests.conftest import make_mock_response
 
@@ -193,3 +206,697 @@ class TestApiGetRetry:
 
         assert result == {"response": "data"}
         assert api._session is new_session
+
+
+
+class TestApiGetTransientRetry:
+    """Tests for 429 / 5xx / connection-error retries in _api_get."""
+
+    @pytest.mark.asyncio
+    async def test_429_honours_retry_after(self, api, mock_session, monkeypatch):
+        """429 waits at least Retry-After seconds, then succeeds."""
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        mock_session.get = MagicMock(
+            side_effect=[
+                make_mock_response(429, {}, headers={"Retry-After": "7"}),
+                make_mock_response(200, {"response": "ok"}),
+            ]
+        )
+
+        result = await api._api_get("/resources/mchart")
+
+        assert result == {"response": "ok"}
+        assert sleep.await_args[0][0] >= 7
+
+    @pytest.mark.asyncio
+    async def test_5xx_retried_until_budget_spent(self, api, mock_session, monkeypatch):
+        """Persistent 503 gives up after max_retries with EnergaConnectionError."""
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        mock_session.get = MagicMock(
+            side_effect=lambda *a, **kw: make_mock_response(503, {})
+        )
+
+        with pytest.raises(EnergaConnectionError, match="HTTP 503"):
+            await api._api_get("/resources/mchart")
+
+        assert mock_session.get.call_count == api._retry_policy.max_retries + 1
+
+    @pytest.mark.asyncio
+    async def test_connection_error_retried(self, api, mock_session, monkeypatch):
+        """A dropped connection is retried instead of failing the day."""
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        mock_session.get = MagicMock(
+            side_effect=[
+                aiohttp.ServerDisconnectedError(),
+                make_mock_response(200, {"response": "ok"}),
+            ]
+        )
+
+        result = await api._api_get("/resources/mchart")
+
+        assert result == {"response": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_404_not_retried(self, api, mock_session, monkeypatch):
+        """Non-transient client errors fail immediately."""
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        mock_session.get = MagicMock(return_value=make_mock_response(404, {}))
+
+        with pytest.raises(EnergaConnectionError):
+            await api._api_get("/resources/mchart")
+
+        assert mock_session.get.call_count == 1
+        sleep.assert_not_awaited()
+
+
+class TestApiGetSingleFlight:
+    """Identical concurrent requests share one HTTP call."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_coalesce(self, api, mock_session):
+        gate = asyncio.Event()
+        resp = make_mock_response(200, {"response": "chart"})
+        original_enter = resp.__aenter__
+
+        async def slow_enter(*args, **kwargs):
+            await gate.wait()
+            return await original_enter(*args, **kwargs)
+
+        resp.__aenter__ = slow_enter
+        mock_session.get = MagicMock(return_value=resp)
+
+        params = {"meterPoint": "1", "mainChartDate": "1000"}
+        first = asyncio.ensure_future(api._api_get("/resources/mchart", params))
+        second = asyncio.ensure_future(api._api_get("/resources/mchart", dict(params)))
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert await first == {"response": "chart"}
+        assert await second == {"response": "chart"}
+        assert mock_session.get.call_count == 1
+        assert api._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_coalesced(self, api, mock_session):
+        mock_session.get = MagicMock(
+            side_effect=lambda *a, **kw: make_mock_response(200, {"response": "x"})
+        )
+
+        await asyncio.gather(
+            api._api_get("/resources/mchart", {"mainChartDate": "1000"}),
+            api._api_get("/resources/mchart", {"mainChartDate": "2000"}),
+        )
+
+        assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_shared_with_all_waiters(self, api, mock_session):
+        mock_session.get = MagicMock(return_value=make_mock_response(404, {}))
+
+        results = await asyncio.gather(
+            api._api_get("/resources/mchart", {"a": "1"}),
+            api._api_get("/resources/mchart", {"a": "1"}),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, EnergaConnectionError) for r in results)
+        assert mock_session.get.call_count == 1
+
+    @staticmethod
+    def _gated_requests(api):
+        """Fake _api_request recording (priority, deadline) until released."""
+        gate = asyncio.Event()
+        started = []
+
+        async def fake_request(path, params=None, deadline=None):
+            started.append((_REQUEST_PRIORITY.get(), deadline))
+            await gate.wait()
+            return {"response": "chart"}
+
+        api._api_request = fake_request
+        return gate, started
+
+    @pytest.mark.asyncio
+    async def test_live_does_not_join_backfill_request(self, api):
+        """A live refresh must not wait at backfill priority."""
+        gate, started = self._gated_requests(api)
+        params = {"meterPoint": "1", "mainChartDate": "1000"}
+        with request_priority(PRIORITY_BACKFILL):
+            backfill = asyncio.ensure_future(api._api_get(CHART_ENDPOINT, params))
+        await asyncio.sleep(0)
+        live = asyncio.ensure_future(api._api_get(CHART_ENDPOINT, dict(params)))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(backfill, live)
+
+        assert [priority for priority, _ in started] == [
+            PRIORITY_BACKFILL,
+            PRIORITY_LIVE,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backfill_does_not_inherit_cycle_deadline(self, api):
+        """A backfill joining a live request would fail at its deadline."""
+        gate, started = self._gated_requests(api)
+        params = {"meterPoint": "1", "mainChartDate": "1000"}
+        deadline = time.monotonic() + 60
+        live = asyncio.ensure_future(
+            api._api_get(CHART_ENDPOINT, params, deadline=deadline)
+        )
+        await asyncio.sleep(0)
+        with request_priority(PRIORITY_BACKFILL):
+            backfill = asyncio.ensure_future(api._api_get(CHART_ENDPOINT, params))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(live, backfill)
+
+        assert started == [(PRIORITY_LIVE, deadline), (PRIORITY_BACKFILL, None)]
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_cached(self, api, mock_session):
+        """Single-flight only joins in-flight requests; it is not a cache."""
+        mock_session.get = MagicMock(
+            side_effect=lambda *a, **kw: make_mock_response(200, {"response": "x"})
+        )
+
+        await api._api_get("/resources/user/data")
+        await api._api_get("/resources/user/data")
+
+        assert mock_session.get.call_count == 2
+
+
+class TestReloginGuard:
+    """Concurrent requests hitting an expired session trigger one login."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_403s_single_login(self, api, mock_session):
+        gate = asyncio.Event()
+        seen = {}
+        login_calls = 0
+
+        def fake_get(url, **kwargs):
+            nonlocal login_calls
+            if url.endswith("/apihelper/SessionStatus"):
+                return make_mock_response(200, {})
+            if url.endswith("/apihelper/UserLogin"):
+                login_calls += 1
+                return make_mock_response(200, {"success": True, "token": "fresh"})
+            seen[url] = seen.get(url, 0) + 1
+            if seen[url] > 1:
+                return make_mock_response(200, {"response": url})
+            resp = make_mock_response(403, {})
+            original_enter = resp.__aenter__
+
+            async def gated_enter(*args, **kw):
+                await gate.wait()
+                return await original_enter(*args, **kw)
+
+            resp.__aenter__ = gated_enter
+            return resp
+
+        mock_session.get = MagicMock(side_effect=fake_get)
+
+        tasks = [
+            asyncio.ensure_future(api._api_get(f"/resources/path{i}"))
+            for i in range(3)
+        ]
+        for _ in range(5):  # Let every request reach the gate
+            await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert login_calls == 1
+        assert [r["response"].rsplit("/", 1)[1] for r in results] == [
+            "path0", "path1", "path2",
+        ]
+        assert api._login_generation == 1
+
+    @pytest.mark.asyncio
+    async def test_new_expiry_after_login_relogs_again(self, api, mock_session):
+        """A 403 seen with the current generation is a fresh expiry event."""
+        api._login_generation = 5
+        mock_session.get = MagicMock(
+            side_effect=[
+                make_mock_response(403, {}),
+                make_mock_response(200, {}),
+                make_mock_response(200, {"success": True, "token": "t"}),
+                make_mock_response(200, {"response": "ok"}),
+            ]
+        )
+
+        result = await api._api_get("/resources/user/data")
+
+        assert result == {"response": "ok"}
+        assert api._login_generation == 6
+
+    @pytest.mark.asyncio
+    async def test_session_status_401_during_login_does_not_recurse(
+        self, api, mock_session
+    ):
+        """SessionStatus rejection inside login fails instead of re-logging."""
+        mock_session.get = MagicMock(return_value=make_mock_response(401, {}))
+
+        with pytest.raises(EnergaTokenExpiredError):
+            await api.async_login()
+
+        assert mock_session.get.call_count == 1
+
+
+class TestSessionPersistence:
+    """Saved cookies/token are tried before a full login."""
+
+    @staticmethod
+    def _store(state=None):
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value=state)
+        store.async_save = AsyncMock()
+        return store
+
+    @pytest.mark.asyncio
+    async def test_export_restore_round_trip(self, api, mock_session):
+        mock_session.cookie_jar = aiohttp.CookieJar()
+        api._token = "tok"
+        mock_session.cookie_jar.update_cookies(
+            {"JSESSIONID": "abc"}, URL("https://api-mojlicznik.energa-operator.pl/dp")
+        )
+        state = api.export_state()
+        assert state["session"]["token"] == "tok"
+        assert state["session"]["cookies"][0]["name"] == "JSESSIONID"
+
+        fresh_jar = aiohttp.CookieJar()
+        mock_session.cookie_jar = fresh_jar
+        api._token = None
+        api._state_store = self._store(state)
+
+        assert await api._async_restore_state() is True
+        assert api._token == "tok"
+        assert [m.value for m in fresh_jar] == ["abc"]
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_login_when_session_valid(
+        self, api, mock_session, g11_user_data
+    ):
+        api._state_store = self._store(
+            {"session": {"token": "t", "cookies": [{"name": "S", "value": "v"}]}}
+        )
+        mock_session.get = MagicMock(return_value=make_mock_response(200, g11_user_data))
+
+        assert await api.async_resume_session() is True
+
+        assert mock_session.get.call_count == 1  # Only user/data, no login
+        assert len(api._meters_data) == 1
+
+    @pytest.mark.asyncio
+    async def test_resume_without_saved_state_logs_in(self, api, mock_session):
+        api._state_store = self._store(None)
+        mock_session.get = MagicMock(
+            side_effect=[
+                make_mock_response(200, {}),
+                make_mock_response(200, {"success": True, "token": "new"}),
+            ]
+        )
+
+        assert await api.async_resume_session() is False
+        assert api._token == "new"
+        save = api._state_store.async_delay_save.call_args.args[0]
+        assert save()["session"]["token"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_resume_falls_back_to_login_on_rejected_session(
+        self, api, mock_session
+    ):
+        """Dead session answered with an empty payload → full login."""
+        api._state_store = self._store(
+            {"session": {"token": None, "cookies": [{"name": "S", "value": "old"}]}}
+        )
+        mock_session.get = MagicMock(
+            side_effect=[
+                make_mock_response(200, {"response": None}),
+                make_mock_response(200, {}),
+                make_mock_response(200, {"success": True, "token": "new"}),
+            ]
+        )
+
+        assert await api.async_resume_session() is False
+        assert api._token == "new"
+
+    @pytest.mark.asyncio
+    async def test_resume_reports_relogin_after_401(
+        self, api, mock_session, g11_user_data
+    ):
+        """Cookies rejected with 401 → re-login inside the request → False."""
+        api._state_store = self._store(
+            {"session": {"token": None, "cookies": [{"name": "S", "value": "old"}]}}
+        )
+        mock_session.get = MagicMock(
+            side_effect=[
+                make_mock_response(401, {}),
+                make_mock_response(200, {}),
+                make_mock_response(200, {"success": True, "token": "new"}),
+                make_mock_response(200, g11_user_data),
+            ]
+        )
+
+        assert await api.async_resume_session() is False
+        assert api._token == "new"
+        assert len(api._meters_data) == 1
+
+
+_real_sleep = asyncio.sleep
+
+
+def _day_data(target_date):
+    """One import point at 12:00 local time of target_date."""
+    noon = datetime(
+        target_date.year, target_date.month, target_date.day, 12,
+        tzinfo=ZoneInfo("Europe/Warsaw"),
+    )
+    return {"import": [(1.0, int(noon.timestamp() * 1000))], "export": []}
+
+
+def _days_ago(days):
+    """Local midnight `days` days before today."""
+    start = datetime.now(ZoneInfo("Europe/Warsaw")) - timedelta(days=days)
+    return start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class TestHourlyStatisticsConcurrency:
+    """Tests for concurrent day fetching in async_get_hourly_statistics."""
+
+    @pytest.mark.asyncio
+    async def test_days_fetched_in_parallel_up_to_limit(self, api, monkeypatch):
+        """No more than fetch_concurrency days are in flight at once."""
+        api._fetch_concurrency = 3
+        api._meters_data = [{"meter_point_id": "123", "zone_count": 1}]
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_history(meter_point_id, target_date, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            for _ in range(3):
+                await _real_sleep(0)
+            in_flight -= 1
+            return _day_data(target_date)
+
+        api.async_get_history_hourly = fake_history
+
+        result = await api.async_get_hourly_statistics("123", start_date=_days_ago(9))
+
+        assert peak == 3
+        assert len(result["import"]) == 10
+        starts = [p["start"] for p in result["import"]]
+        assert starts == sorted(starts)
+
+    @pytest.mark.asyncio
+    async def test_results_sorted_when_days_finish_out_of_order(self, api, monkeypatch):
+        """Later days finishing first still yield oldest-first output."""
+        api._fetch_concurrency = 4
+        api._meters_data = [{"meter_point_id": "123", "zone_count": 1}]
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        start = _days_ago(3)
+
+        async def fake_history(meter_point_id, target_date, **_kwargs):
+            # Older days take longer → finish last
+            age = (datetime.now(ZoneInfo("Europe/Warsaw")).date() - target_date.date()).days
+            for _ in range(age * 2):
+                await _real_sleep(0)
+            return _day_data(target_date)
+
+        api.async_get_history_hourly = fake_history
+
+        result = await api.async_get_hourly_statistics("123", start_date=start)
+
+        starts = [p["start"] for p in result["import"]]
+        assert len(starts) == 4
+        assert starts == sorted(starts)
+
+    @pytest.mark.asyncio
+    async def test_token_expired_propagates(self, api, monkeypatch):
+        """EnergaTokenExpiredError from any day aborts the whole fetch."""
+        api._meters_data = [{"meter_point_id": "123", "zone_count": 1}]
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        api.async_get_history_hourly = AsyncMock(
+            side_effect=EnergaTokenExpiredError("403")
+        )
+
+        with pytest.raises(EnergaTokenExpiredError):
+            await api.async_get_hourly_statistics("123")
+
+
+class TestDailyValuesConcurrency:
+    """Today's daily charts of all meters are fetched in parallel."""
+
+    @staticmethod
+    def _meters():
+        return [
+            {"meter_point_id": mid, "obis_plus": "1.8.0", "zone_count": 1}
+            for mid in ("1", "2", "3")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_meters_fetched_in_parallel_in_order(self, api):
+        api._meters_data = self._meters()
+        in_flight = 0
+        peak = 0
+
+        async def fake_series(meter_point_id, obis, ts, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Meter "1" finishes last
+            for _ in range(6 if meter_point_id == "1" else 2):
+                await _real_sleep(0)
+            in_flight -= 1
+            return [float(meter_point_id)], []
+
+        api._fetch_chart_series = fake_series
+
+        meters = await api.async_get_data()
+
+        assert peak == 3
+        assert [m["meter_point_id"] for m in meters] == ["1", "2", "3"]
+        assert [m["daily_pobor"] for m in meters] == [1.0, 2.0, 3.0]
+        assert api._meters_data == meters
+
+    @pytest.mark.asyncio
+    async def test_token_expired_cancels_other_meters(self, api):
+        api._meters_data = self._meters()
+        finished = []
+
+        async def fake_series(meter_point_id, obis, ts, **_kwargs):
+            if meter_point_id == "1":
+                raise EnergaTokenExpiredError("403")
+            for _ in range(3):
+                await _real_sleep(0)
+            finished.append(meter_point_id)
+            return [1.0], []
+
+        api._fetch_chart_series = fake_series
+
+        with pytest.raises(EnergaTokenExpiredError):
+            await api.async_get_data()
+        for _ in range(5):
+            await _real_sleep(0)
+        assert finished == []
+
+
+class TestPerSeriesWindows:
+    """Each series resumes after its own watermark."""
+
+    @pytest.mark.asyncio
+    async def test_series_cutoffs_and_directions(self, api):
+        api._meters_data = [{"meter_point_id": "123", "zone_count": 1}]
+        import_start = _days_ago(4)
+        export_start = _days_ago(1)
+        requested = []
+
+        async def fake_history(meter_point_id, target_date, **kwargs):
+            requested.append((target_date.date(), kwargs["directions"]))
+            day = _day_data(target_date)
+            day["export"] = list(day["import"])
+            return day
+
+        api.async_get_history_hourly = fake_history
+
+        result = await api.async_get_hourly_statistics(
+            "123",
+            start_date=import_start,
+            series_start={"import": import_start, "export": export_start},
+        )
+
+        assert len(result["import"]) == 5
+        assert [p["start"].date() for p in result["export"]] == [
+            export_start.date(),
+            (export_start + timedelta(days=1)).date(),
+        ]
+        # Export OBIS only requested once that series needs the day
+        assert [d for d, dirs in requested if "export" in dirs] == [
+            export_start.date(),
+            (export_start + timedelta(days=1)).date(),
+        ]
+        assert all("import" in dirs for _, dirs in requested)
+
+    @pytest.mark.asyncio
+    async def test_zone_meter_current_export_not_refetched(self, api):
+        """G12w: only zone series are tracked; totals don't pin the window."""
+        api._meters_data = [{"meter_point_id": "123", "zone_count": 2}]
+        import_start = _days_ago(5)
+        export_start = datetime.now(ZoneInfo("Europe/Warsaw")).replace(
+            minute=0, second=0, microsecond=0
+        )
+        requested = []
+
+        async def fake_history(meter_point_id, target_date, **kwargs):
+            requested.append((target_date.date(), kwargs["directions"]))
+            return _day_data(target_date)
+
+        api.async_get_history_hourly = fake_history
+
+        await api.async_get_hourly_statistics(
+            "123",
+            start_date=import_start,
+            series_start={
+                "import_1": import_start,
+                "import_2": import_start,
+                "export_1": export_start,
+                "export_2": export_start,
+            },
+        )
+
+        assert len(requested) == 6
+        assert [d for d, dirs in requested if "export" in dirs] == [
+            export_start.date()
+        ]
+
+    @pytest.mark.asyncio
+    async def test_history_skips_unneeded_direction(self, api, mock_session):
+        api._meters_data = [
+            {
+                "meter_point_id": "123",
+                "zone_count": 1,
+                "obis_plus": "1.8.0",
+                "obis_minus": "2.8.0",
+            }
+        ]
+        api._fetch_chart_series = AsyncMock(return_value=([], []))
+
+        await api.async_get_history_hourly(
+            "123", _days_ago(1), directions=("import",)
+        )
+
+        assert api._fetch_chart_series.await_count == 1
+        assert api._fetch_chart_series.call_args.args[1] == "1.8.0"
+
+
+class TestDeadlines:
+    """Per-endpoint timeouts and the coordinator cycle deadline."""
+
+    @pytest.mark.asyncio
+    async def test_endpoint_timeout_passed_to_request(self, api, mock_session):
+        mock_session.get = MagicMock(return_value=make_mock_response(200, {}))
+
+        await api._api_get("/resources/mchart")
+
+        assert mock_session.get.call_args.kwargs["timeout"].total == 20
+
+    @pytest.mark.asyncio
+    async def test_timeout_shrinks_to_remaining_deadline(self, api, mock_session):
+        mock_session.get = MagicMock(return_value=make_mock_response(200, {}))
+
+        await api._api_get("/resources/user/data", deadline=time.monotonic() + 5)
+
+        assert mock_session.get.call_args.kwargs["timeout"].total <= 5
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_sends_nothing(self, api, mock_session):
+        mock_session.get = MagicMock()
+
+        with pytest.raises(EnergaDeadlineExceeded):
+            await api._api_get("/resources/mchart", deadline=time.monotonic() - 1)
+
+        mock_session.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_retry_past_deadline(self, api, mock_session, monkeypatch):
+        """A 503 is not retried when the backoff would overrun the deadline."""
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        mock_session.get = MagicMock(return_value=make_mock_response(503, {}))
+
+        with pytest.raises(EnergaDeadlineExceeded):
+            await api._api_get(
+                "/resources/mchart", deadline=time.monotonic() + 0.2
+            )
+
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_smart_fetch_stops_at_first_unfetched_day(self, api):
+        """Days after a deadline gap are dropped so the next cycle resumes there."""
+        api._meters_data = [{"meter_point_id": "123", "zone_count": 1}]
+        start = _days_ago(4)
+        cutoff = start + timedelta(days=2)
+
+        async def fake_history(meter_point_id, target_date, **_kwargs):
+            if target_date.date() == cutoff.date():
+                raise EnergaDeadlineExceeded("cycle over")
+            return _day_data(target_date)
+
+        api.async_get_history_hourly = fake_history
+
+        result = await api.async_get_hourly_statistics("123", start_date=start)
+
+        days = [p["start"].date() for p in result["import"]]
+        assert days == [start.date(), (start + timedelta(days=1)).date()]
+
+
+class TestHistoryPrefetcher:
+    """Backfill days are fetched ahead but handed out in order."""
+
+    @pytest.mark.asyncio
+    async def test_days_fetched_ahead_and_returned_in_order(self, api):
+        api._fetch_concurrency = 2
+        days = [_days_ago(n) for n in (3, 2, 1, 0)]
+        started = []
+
+        async def fake_history(meter_point_id, target_date, **_kwargs):
+            started.append(target_date)
+            await _real_sleep(0)
+            return _day_data(target_date)
+
+        api.async_get_history_hourly = fake_history
+        prefetcher = api.history_prefetcher("123", days)
+
+        first = await prefetcher.get(days[0])
+
+        assert first == _day_data(days[0])
+        assert started == days[:3]  # Requested day + 2 ahead
+        for day in days[1:]:
+            assert await prefetcher.get(day) == _day_data(day)
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_pending_days(self, api):
+        api._fetch_concurrency = 3
+        days = [_days_ago(n) for n in (3, 2, 1, 0)]
+        gate = asyncio.Event()
+
+        async def fake_history(meter_point_id, target_date, **_kwargs):
+            if target_date != days[0]:
+                await gate.wait()
+            return _day_data(target_date)
+
+        api.async_get_history_hourly = fake_history
+        prefetcher = api.history_prefetcher("123", days)
+        await prefetcher.get(days[0])
+        pending = list(prefetcher._tasks.values())
+
+        prefetcher.cancel()
+        await _real_sleep(0)
+
+        assert pending and all(t.cancelled() for t in pending)
@@ -1,5 +1,6 @@
 """Tests for API zone detection and meter parsing."""
 
+from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
@@ -104,3 +105,104 @@ class TestHasMultiZoneMeters:
         """No meters → False."""
         api._meters_data = []
         assert api.has_multi_zone_meters() is False
+
+
+def _chart_response(points):
+    """Build an mchart response from (tm_ms, zones) pairs."""
+    return {
+        "response": {
+            "mainChart": [{"tm": tm, "zones": zones} for tm, zones in points]
+        }
+    }
+
+
+class TestFetchChartSeries:
+    """Tests for _fetch_chart_series — one mchart request per OBIS code."""
+
+    @pytest.mark.asyncio
+    async def test_total_and_zones_from_one_response(self, api, mock_session):
+        """Total and zone series are decoded from a single response."""
+        resp = make_mock_response(
+            200, _chart_response([(1000, [0.5, 0.25]), (2000, [None, 1.0])])
+        )
+        mock_session.get = MagicMock(return_value=resp)
+
+        total, zones = await api._fetch_chart_series(
+            "360074", "1-0:1.8.0*255", 0, zone_count=2
+        )
+
+        assert mock_session.get.call_count == 1
+        assert total == [0.75, 1.0]
+        assert zones == [[0.5, 0.0], [0.25, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_unpublished_hours_stay_none(self, api, mock_session):
+        """Trailing all-null hours are None, not 0.0, in every series."""
+        resp = make_mock_response(
+            200,
+            _chart_response(
+                [(1000, [0.5, None]), (2000, [None, None]), (3000, [])]
+            ),
+        )
+        mock_session.get = MagicMock(return_value=resp)
+
+        total, zones = await api._fetch_chart_series(
+            "360074", "1-0:1.8.0*255", 0, zone_count=2, include_timestamps=True
+        )
+
+        assert total == [(0.5, 1000), (None, 2000), (None, 3000)]
+        assert zones == [
+            [(0.5, 1000), (None, 2000), (None, 3000)],
+            [(0.0, 1000), (None, 2000), (None, 3000)],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_include_timestamps(self, api, mock_session):
+        """Series items carry the API timestamp when requested (#26)."""
+        resp = make_mock_response(200, _chart_response([(1000, [0.5, 0.25])]))
+        mock_session.get = MagicMock(return_value=resp)
+
+        total, zones = await api._fetch_chart_series(
+            "360074", "1-0:1.8.0*255", 0, zone_count=2, include_timestamps=True
+        )
+
+        assert total == [(0.75, 1000)]
+        assert zones == [[(0.5, 1000)], [(0.25, 1000)]]
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_returns_empty_series(self, api, mock_session):
+        """Malformed response → empty total and zone series."""
+        resp = make_mock_response(200, {"response": None})
+        mock_session.get = MagicMock(return_value=resp)
+
+        total, zones = await api._fetch_chart_series(
+            "360074", "1-0:1.8.0*255", 0, zone_count=2
+        )
+
+        assert total == []
+        assert zones == [[], []]
+
+    @pytest.mark.asyncio
+    async def test_g12w_history_uses_one_request_per_obis(self, api, mock_session):
+        """G12w prosumer day costs 2 requests (import + export), not 6."""
+        api._meters_data = [
+            {
+                "meter_point_id": "360074",
+                "obis_plus": "1-0:1.8.0*255",
+                "obis_minus": "1-0:2.8.0*255",
+                "zone_count": 2,
+            }
+        ]
+        resp = make_mock_response(200, _chart_response([(1000, [0.5, 0.25])]))
+        mock_session.get = MagicMock(return_value=resp)
+
+        result = await api.async_get_history_hourly(
+            "360074", datetime(2026, 1, 15), include_timestamps=True
+        )
+
+        assert mock_session.get.call_count == 2
+        assert result["import"] == [(0.75, 1000)]
+        assert result["import_1"] == [(0.5, 1000)]
+        assert result["import_2"] == [(0.25, 1000)]
+        assert result["export_1"] == [(0.5, 1000)]
+        assert result["export_2"] == [(0.25, 1000)]
@@ -0,0 +1,164 @@
+"""Tests for request budget accounting and the daily quota."""
+
+import asyncio
+import time
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.energa_mobile.api import (
+    EnergaQuotaExceededError,
+    request_priority,
+)
+from custom_components.energa_mobile.budget import RequestBudget
+from custom_components.energa_mobile.const import (
+    DATA_ENDPOINT,
+    PRIORITY_BACKFILL,
+    PRIORITY_LIVE,
+)
+from custom_components.energa_mobile.throttle import TokenBucket
+from tests.conftest import make_mock_response
+
+
+class _Today:
+    def __init__(self):
+        self.day = date(2026, 3, 1)
+
+    def __call__(self):
+        return self.day
+
+
+class TestRequestBudget:
+    """Counting per day and per job."""
+
+    def test_counts_per_job_and_kind(self):
+        budget = RequestBudget()
+        with budget.job("cycle") as job:
+            budget.record()
+            budget.record()
+        budget.record()  # Outside any job
+        assert job.requests == 2
+        assert budget.last_job("cycle") is job
+        assert budget.used_today == 3
+        assert budget.export()["by_kind"] == {"cycle": 2, "other": 1}
+
+    @pytest.mark.asyncio
+    async def test_spawned_tasks_count_for_job(self):
+        budget = RequestBudget()
+
+        async def request():
+            budget.record()
+
+        with budget.job("backfill", "123") as job:
+            await asyncio.gather(*(asyncio.ensure_future(request()) for _ in range(3)))
+        assert job.requests == 3
+
+    def test_quota_only_limits_backfill(self):
+        budget = RequestBudget(daily_quota=2)
+        assert budget.remaining == 2
+        budget.record()
+        budget.record()
+        assert budget.remaining == 0
+        assert not budget.allows(PRIORITY_BACKFILL)
+        assert budget.allows(PRIORITY_LIVE)
+
+    def test_unlimited(self):
+        budget = RequestBudget()
+        budget.record()
+        assert budget.remaining is None
+        assert budget.allows(PRIORITY_BACKFILL)
+
+    def test_resets_at_midnight(self):
+        today = _Today()
+        budget = RequestBudget(daily_quota=1, today=today)
+        budget.record()
+        assert not budget.allows(PRIORITY_BACKFILL)
+        today.day = date(2026, 3, 2)
+        assert budget.used_today == 0
+        assert budget.allows(PRIORITY_BACKFILL)
+
+    def test_restore_same_day_only(self):
+        today = _Today()
+        saved = RequestBudget(today=today)
+        with saved.job("cycle"):
+            saved.record()
+        state = saved.export()
+
+        restored = RequestBudget(today=today)
+        restored.restore(state)
+        assert restored.used_today == 1
+
+        today.day = date(2026, 3, 2)
+        stale = RequestBudget(today=today)
+        stale.restore(state)
+        assert stale.used_today == 0
+
+        stale.restore({"day": "garbage"})
+        assert stale.used_today == 0
+
+
+class TestApiQuota:
+    """_api_request counts requests and defers backfill past the quota."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_deferred_live_served(self, api, mock_session):
+        api._budget = RequestBudget(daily_quota=1)
+        api._rate_limiter = TokenBucket(rate=1000, burst=100)
+        mock_session.get = MagicMock(
+            side_effect=lambda *a, **kw: make_mock_response(200, {})
+        )
+
+        with request_priority(PRIORITY_BACKFILL):
+            await api._api_request(DATA_ENDPOINT)
+            with pytest.raises(EnergaQuotaExceededError):
+                await api._api_request(DATA_ENDPOINT)
+        assert mock_session.get.call_count == 1
+
+        await api._api_request(DATA_ENDPOINT)  # Live: over quota but served
+        assert mock_session.get.call_count == 2
+        assert api.request_budget.used_today == 2
+
+    def test_budget_persisted_with_state(self, api):
+        mock_jar = MagicMock()
+        mock_jar.__iter__ = lambda self: iter([])
+        api._session.cookie_jar = mock_jar
+        api.request_budget.record()
+        assert api.export_state()["request_budget"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recorded_request_persisted_without_unload(
+        self, api, mock_session
+    ):
+        """A restart or crash skips unload: counts are saved as they change."""
+        mock_jar = MagicMock()
+        mock_jar.__iter__ = lambda self: iter([])
+        mock_session.cookie_jar = mock_jar
+        api._state_store = MagicMock()
+        mock_session.get = MagicMock(
+            side_effect=lambda *a, **kw: make_mock_response(200, {})
+        )
+
+        await api._api_request(DATA_ENDPOINT)
+
+        api._state_store.async_delay_save.assert_called_once()
+        save = api._state_store.async_delay_save.call_args.args[0]
+        assert save()["request_budget"]["count"] == 1
+        api._state_store.async_save.assert_not_called()
+
+    def test_pending_write_not_pushed_back(self, api, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        api._state_store = MagicMock()
+
+        api.request_budget.record()
+        now[0] += 5
+        api.request_budget.record()
+        job = api.request_budget.new_job("backfill")
+        api.request_budget.finish_job(job)
+        assert api._state_store.async_delay_save.call_count == 1
+
+        # The write has run: the next change schedules another one
+        now[0] += 6
+        api.request_budget.finish_job(job)
+        assert api._state_store.async_delay_save.call_count == 2
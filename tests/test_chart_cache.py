@@ -0,0 +1,171 @@
+"""Tests for the persistent mchart day cache."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.energa_mobile.chart_cache import EnergaChartCache
+from tests.conftest import make_mock_response
+
+TODAY = date(2026, 3, 10)
+YESTERDAY = date(2026, 3, 9)
+
+
+def _points(count=24, zones=(0.5,)):
+    return [{"tm": i * 3_600_000, "zones": list(zones)} for i in range(count)]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def cache(clock):
+    return EnergaChartCache(ttl=900, clock=clock, today_fn=lambda: TODAY)
+
+
+class TestChartCacheExpiry:
+    """Closed days are immutable; open days expire after the TTL."""
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get("1", "obis", YESTERDAY) is None
+
+    def test_closed_day_never_expires(self, cache, clock):
+        cache.put("1", "obis", YESTERDAY, _points())
+        clock.now += 10 * 86400
+        assert cache.get("1", "obis", YESTERDAY) == _points()
+
+    def test_today_expires_after_ttl(self, cache, clock):
+        cache.put("1", "obis", TODAY, _points(10))
+        clock.now += 899
+        assert cache.get("1", "obis", TODAY) is not None
+        clock.now += 2
+        assert cache.get("1", "obis", TODAY) is None
+
+    def test_past_day_with_unpublished_hours_expires(self, cache, clock):
+        """A past day with null hours is partial → TTL, not immutable."""
+        points = _points()
+        points[-1]["zones"] = [None]
+        cache.put("1", "obis", YESTERDAY, points)
+        clock.now += 901
+        assert cache.get("1", "obis", YESTERDAY) is None
+
+    def test_short_past_day_is_partial(self, cache, clock):
+        cache.put("1", "obis", YESTERDAY, _points(12))
+        clock.now += 901
+        assert cache.get("1", "obis", YESTERDAY) is None
+
+    def test_dst_spring_forward_day_is_closed(self, cache, clock):
+        """23 published hours (spring-forward) still count as complete."""
+        cache.put("1", "obis", YESTERDAY, _points(23))
+        clock.now += 10 * 86400
+        assert cache.get("1", "obis", YESTERDAY) is not None
+
+    def test_keys_are_per_meter_and_obis(self, cache):
+        cache.put("1", "import", YESTERDAY, _points())
+        assert cache.get("2", "import", YESTERDAY) is None
+        assert cache.get("1", "export", YESTERDAY) is None
+
+    def test_oldest_days_evicted_over_cap(self, clock):
+        cache = EnergaChartCache(max_entries=2, clock=clock, today_fn=lambda: TODAY)
+        cache.put("1", "obis", date(2026, 3, 1), _points())
+        cache.put("1", "obis", date(2026, 3, 3), _points())
+        cache.put("1", "obis", date(2026, 3, 2), _points())
+        assert cache.get("1", "obis", date(2026, 3, 1)) is None
+        assert cache.get("1", "obis", date(2026, 3, 2)) is not None
+        assert cache.get("1", "obis", date(2026, 3, 3)) is not None
+
+    def test_expired_entries_do_not_pile_up_in_eviction_heap(self, clock):
+        cache = EnergaChartCache(
+            ttl=900, max_entries=3, clock=clock, today_fn=lambda: TODAY
+        )
+        cache.put("1", "obis", YESTERDAY, _points())
+        for _ in range(50):
+            cache.put("1", "obis", TODAY, _points(5))
+            clock.now += 901
+            assert cache.get("1", "obis", TODAY) is None
+        assert len(cache._by_day) <= 2 * len(cache._entries) + 1
+        # Eviction still goes by day after the churn
+        cache.put("1", "obis", date(2026, 3, 1), _points())
+        cache.put("1", "obis", date(2026, 3, 2), _points())
+        cache.put("1", "obis", TODAY, _points(5))
+        assert cache.get("1", "obis", date(2026, 3, 1)) is None
+        assert cache.get("1", "obis", TODAY) is not None
+
+
+class TestChartCachePersistence:
+    """Only closed days are written to and loaded from the store."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_store(self, clock):
+        store = MagicMock()
+        cache = EnergaChartCache(store, clock=clock, today_fn=lambda: TODAY)
+        cache.put("1", "obis", YESTERDAY, _points())
+        cache.put("1", "obis", TODAY, _points(5))
+
+        store.async_delay_save.assert_called_once()
+        saved = store.async_delay_save.call_args[0][0]()
+        assert len(saved["entries"]) == 1
+
+        store.async_load = AsyncMock(return_value=saved)
+        restored = EnergaChartCache(store, clock=clock, today_fn=lambda: TODAY)
+        await restored.async_load()
+        assert restored.get("1", "obis", YESTERDAY) == _points()
+        assert restored.get("1", "obis", TODAY) is None
+
+    @pytest.mark.asyncio
+    async def test_loaded_days_are_evicted_oldest_first(self, clock):
+        store = MagicMock()
+        store.async_load = AsyncMock(
+            return_value={
+                "entries": {
+                    f"1|obis|2026-03-0{d}": {
+                        "points": _points(),
+                        "fetched": 0,
+                        "closed": True,
+                    }
+                    for d in (3, 1, 2)
+                }
+            }
+        )
+        cache = EnergaChartCache(
+            store, max_entries=3, clock=clock, today_fn=lambda: TODAY
+        )
+        await cache.async_load()
+        cache.put("1", "obis", YESTERDAY, _points())
+        assert cache.get("1", "obis", date(2026, 3, 1)) is None
+        assert cache.get("1", "obis", date(2026, 3, 2)) is not None
+
+    @pytest.mark.asyncio
+    async def test_load_failure_starts_empty(self, clock):
+        store = MagicMock()
+        store.async_load = AsyncMock(side_effect=ValueError("corrupt"))
+        cache = EnergaChartCache(store, clock=clock, today_fn=lambda: TODAY)
+        await cache.async_load()
+        assert cache.get("1", "obis", YESTERDAY) is None
+
+
+class TestFetchChartUsesCache:
+    """_fetch_chart_series checks the cache before the network."""
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_of_closed_day_is_free(self, api, mock_session):
+        api._chart_cache = EnergaChartCache(today_fn=lambda: date(2100, 1, 1))
+        resp = make_mock_response(200, {"response": {"mainChart": _points()}})
+        mock_session.get = MagicMock(return_value=resp)
+
+        first = await api._fetch_chart_series("1", "obis", 1_700_000_000_000)
+        second = await api._fetch_chart_series("1", "obis", 1_700_000_000_000)
+
+        assert mock_session.get.call_count == 1
+        assert first == second
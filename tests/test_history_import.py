@@ -0,0 +1,121 @@
+"""Tests for the fetch_history / options-flow history import."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import custom_components.energa_mobile as energa
+from custom_components.energa_mobile import _import_meter_history
+from custom_components.energa_mobile.api import (
+    _REQUEST_PRIORITY,
+    EnergaCircuitOpenError,
+    EnergaQuotaExceededError,
+)
+from custom_components.energa_mobile.budget import _CURRENT_JOB
+from custom_components.energa_mobile.const import PRIORITY_BACKFILL
+
+TZ = ZoneInfo("Europe/Warsaw")
+METER = {"meter_point_id": "123", "meter_serial": "30132815", "zone_count": 1}
+
+
+def _entry():
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    entry.options = {}
+    return entry
+
+
+def _hass():
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def imported(monkeypatch):
+    """Statistic ids written to the recorder, in order."""
+    imported = []
+    monkeypatch.setattr(
+        energa, "dt_util", SimpleNamespace(as_utc=lambda d: d.astimezone(UTC))
+    )
+    monkeypatch.setattr(
+        energa, "StatisticMetaData", lambda **kwargs: SimpleNamespace(**kwargs)
+    )
+    monkeypatch.setattr(
+        energa,
+        "async_import_statistics",
+        lambda hass, metadata, stats: imported.append(metadata.statistic_id),
+    )
+    return imported
+
+
+@pytest.fixture
+def notifications(monkeypatch):
+    notifications = MagicMock()
+    monkeypatch.setattr(energa, "persistent_notification", notifications)
+    return notifications
+
+
+class TestHistoryImportRequests:
+    """Every request of an import, extension days included, is backfill."""
+
+    @pytest.fixture
+    def fetched(self, api):
+        fetched = []
+
+        async def fake_history(meter_point_id, day, **_kwargs):
+            if day.date() in getattr(api, "_fail_days", ()):
+                raise api._fail_with("stop")
+            api.request_budget.record()
+            fetched.append((day.date(), _REQUEST_PRIORITY.get(), _CURRENT_JOB.get()))
+            tm_ms = int(day.timestamp() * 1000)
+            return {"import": [(0.5, tm_ms)], "export": []}
+
+        api.async_get_history_hourly = fake_history
+        api._fail_with = EnergaQuotaExceededError
+        return fetched
+
+    @pytest.mark.asyncio
+    async def test_extension_days_are_backfill_and_charged(
+        self, api, fetched, imported
+    ):
+        start = datetime.now(TZ) - timedelta(days=4)
+        await _import_meter_history(_hass(), api, METER, start, 2, _entry())
+
+        # 2 requested days + 3 days extended up to today
+        assert [day for day, _, _ in fetched] == [
+            (start + timedelta(days=i)).date() for i in range(5)
+        ]
+        assert {priority for _, priority, _ in fetched} == {PRIORITY_BACKFILL}
+        job = api.request_budget.last_job("backfill")
+        assert {id(j) for _, _, j in fetched} == {id(job)}
+        assert job.requests == 5
+        assert job.finished is not None
+        assert imported == [
+            "sensor.energa_30132815_panel_energia_zuzycie",
+            "sensor.energa_30132815_panel_energia_zuzycie_cost",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error", [EnergaQuotaExceededError, EnergaCircuitOpenError]
+    )
+    async def test_stop_imports_nothing(
+        self, api, fetched, imported, notifications, error
+    ):
+        start = datetime.now(TZ) - timedelta(days=4)
+        api._fail_with = error
+        api._fail_days = {(start + timedelta(days=1)).date()}
+        api._fetch_concurrency = 1  # Prefetch one day ahead only
+        await _import_meter_history(_hass(), api, METER, start, 2, _entry())
+
+        # No day past the stop is fetched, and no truncated, restarted-from-0
+        # sum series is written over the recorder's rows
+        assert [day for day, _, _ in fetched] == [start.date()]
+        assert imported == []
+        assert api.request_budget.last_job("backfill").finished is not None
+        message = notifications.async_create.call_args.args[1]
+        assert f"od {start.date()}" in message
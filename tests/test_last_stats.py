@@ -0,0 +1,69 @@
+"""Tests for the batched last-statistics lookup."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import custom_components.energa_mobile.last_stats as last_stats
+from custom_components.energa_mobile.last_stats import (
+    async_get_last_statistics_batch,
+    stats_suffixes,
+    stats_unique_id,
+)
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """Recorder whose executor runs jobs inline and counts them."""
+    instance = MagicMock()
+    instance.jobs = 0
+
+    async def run_job(func, *args):
+        instance.jobs += 1
+        return func(*args)
+
+    instance.async_add_executor_job = run_job
+    monkeypatch.setattr(last_stats, "get_instance", lambda hass: instance)
+    return instance
+
+
+class TestLastStatisticsBatch:
+    """All series are read in one executor job."""
+
+    @pytest.mark.asyncio
+    async def test_one_job_for_all_ids(self, recorder, monkeypatch):
+        rows = {
+            "sensor.a": [{"sum": 10.0, "start": 1_700_000_000}],
+            "sensor.b": [],
+        }
+        queried = []
+
+        def fake_get_last_statistics(hass, count, statistic_id, convert, types):
+            queried.append(statistic_id)
+            if statistic_id == "sensor.c":
+                raise RuntimeError("db locked")
+            return {statistic_id: rows[statistic_id]} if rows[statistic_id] else {}
+
+        monkeypatch.setattr(
+            last_stats, "get_last_statistics", fake_get_last_statistics
+        )
+        result = await async_get_last_statistics_batch(
+            MagicMock(), ["sensor.a", "sensor.b", "sensor.c"]
+        )
+        assert recorder.jobs == 1
+        assert queried == ["sensor.a", "sensor.b", "sensor.c"]
+        assert result == {"sensor.a": {"sum": 10.0, "start": 1_700_000_000}}
+
+    @pytest.mark.asyncio
+    async def test_no_ids_no_job(self, recorder):
+        assert await async_get_last_statistics_batch(MagicMock(), []) == {}
+        assert recorder.jobs == 0
+
+
+class TestSeriesNaming:
+    """Unique IDs match the statistics sensors."""
+
+    def test_suffixes(self):
+        assert stats_suffixes(False) == ("import", "export")
+        assert len(stats_suffixes(True)) == 4
+        assert stats_unique_id(123, "import") == "energa_123_import_stats"
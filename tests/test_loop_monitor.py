@@ -0,0 +1,104 @@
+"""Tests for the event-loop blocking detector."""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.energa_mobile.loop_monitor import (
+    LoopBlockMonitor,
+    MeasuredListenersMixin,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLoopBlockMonitor:
+    """Sections over the threshold are logged with their context."""
+
+    def test_disabled_by_default(self):
+        monitor = LoopBlockMonitor()
+        assert not monitor.enabled
+        with monitor.measure("statistics_import", points=10):
+            pass
+        assert monitor.as_dict()["sections"] == {}
+
+    def test_reports_blocking_section(self, caplog):
+        clock = _Clock()
+        monitor = LoopBlockMonitor(threshold_ms=100, clock=clock)
+        with caplog.at_level(logging.WARNING):
+            with monitor.measure(
+                "statistics_import", statistic_id="sensor.x", points=8760
+            ):
+                clock.now += 0.25
+        assert "statistics_import blocked the event loop for 250 ms" in caplog.text
+        assert "statistic_id=sensor.x, points=8760" in caplog.text
+        event = monitor.as_dict()["events"][0]
+        assert event["section"] == "statistics_import"
+        assert event["duration_ms"] == 250
+        assert event["points"] == "8760"
+
+    def test_fast_section_only_counted(self, caplog):
+        clock = _Clock()
+        monitor = LoopBlockMonitor(threshold_ms=100, clock=clock)
+        with caplog.at_level(logging.WARNING):
+            with monitor.measure("coordinator_listeners"):
+                clock.now += 0.01
+        assert caplog.text == ""
+        data = monitor.as_dict()
+        assert data["events"] == []
+        assert data["sections"]["coordinator_listeners"] == {
+            "calls": 1,
+            "blocked": 0,
+            "max_ms": 10,
+        }
+
+    def test_measures_failing_section(self):
+        clock = _Clock()
+        monitor = LoopBlockMonitor(threshold_ms=1, clock=clock)
+        with pytest.raises(ValueError):
+            with monitor.measure("statistics_gather"):
+                clock.now += 1
+                raise ValueError
+        assert monitor.as_dict()["sections"]["statistics_gather"]["blocked"] == 1
+
+
+class _Coordinator:
+    """Stands in for DataUpdateCoordinator."""
+
+    def __init__(self, clock):
+        self._listeners = {1: None, 2: None}
+        self._clock = clock
+        self.dispatched = 0
+
+    def async_update_listeners(self) -> None:
+        self.dispatched += 1
+        self._clock.now += 0.3
+
+
+class TestMeasuredListeners:
+    """The coordinator's listener dispatch is a measured section."""
+
+    def test_dispatch_recorded(self, caplog):
+        clock = _Clock()
+
+        class Coordinator(MeasuredListenersMixin, _Coordinator):
+            api = SimpleNamespace(
+                loop_monitor=LoopBlockMonitor(threshold_ms=100, clock=clock)
+            )
+
+        coordinator = Coordinator(clock)
+        with caplog.at_level(logging.WARNING):
+            coordinator.async_update_listeners()
+
+        assert coordinator.dispatched == 1
+        monitor = coordinator.api.loop_monitor.as_dict()
+        assert monitor["sections"]["coordinator_listeners"]["calls"] == 1
+        assert monitor["events"][0]["section"] == "coordinator_listeners"
+        assert "listeners=2" in caplog.text
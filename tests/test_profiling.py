@@ -0,0 +1,78 @@
+"""Tests for the profile_cycle capture."""
+
+import asyncio
+import pstats
+from unittest.mock import MagicMock
+
+import pytest
+
+import custom_components.energa_mobile.profiling as profiling
+from custom_components.energa_mobile.profiling import (
+    ProfilerBusyError,
+    async_profile_jobs,
+)
+
+
+def _hot_spot():
+    return sum(i * i for i in range(1000))
+
+
+@pytest.fixture
+def hass(tmp_path):
+    hass = MagicMock()
+    hass.config.path = lambda name: str(tmp_path / name)
+
+    async def run_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = run_job
+    return hass
+
+
+class TestProfileJobs:
+    """Jobs run under cProfile; stats and a summary are written."""
+
+    @pytest.mark.asyncio
+    async def test_writes_prof_and_summary(self, hass, monkeypatch):
+        monkeypatch.setattr(profiling.dt_util, "now", MagicMock())
+        profiling.dt_util.now.return_value.strftime.return_value = "20260101_120000"
+        calls = []
+
+        async def refresh():
+            calls.append("refresh")
+            _hot_spot()
+
+        base, elapsed = await async_profile_jobs(hass, [refresh, refresh])
+
+        assert calls == ["refresh", "refresh"]
+        assert base.endswith("energa_profile_20260101_120000")
+        assert elapsed >= 0
+        stats = pstats.Stats(f"{base}.prof")
+        assert any(func[2] == "_hot_spot" for func in stats.stats)
+        with open(f"{base}.txt", encoding="utf-8") as file:
+            assert "_hot_spot" in file.read()
+
+    @pytest.mark.asyncio
+    async def test_one_capture_at_a_time(self, hass):
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        first = asyncio.ensure_future(async_profile_jobs(hass, [slow]))
+        await asyncio.sleep(0)
+        with pytest.raises(ProfilerBusyError):
+            await async_profile_jobs(hass, [slow])
+        release.set()
+        await first
+        # Flag cleared: a new capture can start
+        await async_profile_jobs(hass, [])
+
+    @pytest.mark.asyncio
+    async def test_failing_job_releases_profiler(self, hass):
+        async def broken():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await async_profile_jobs(hass, [broken])
+        await async_profile_jobs(hass, [])
@@ -0,0 +1,102 @@
+"""Tests for the publication lag tracker."""
+
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.energa_mobile.publication import PublicationLagTracker
+
+TZ = ZoneInfo("Europe/Warsaw")
+T0 = datetime(2026, 3, 10, 0, 0, tzinfo=TZ)
+
+
+def _points(*hours):
+    return [{"start": T0 + timedelta(hours=h), "state": 0.5} for h in hours]
+
+
+class TestPublicationLagTracker:
+    """Lag = first sighting minus the hour's end, per meter series."""
+
+    def test_first_result_is_baseline(self):
+        tracker = PublicationLagTracker()
+        recorded = tracker.observe(
+            1, {"import": _points(0, 1, 2)}, T0 + timedelta(days=30)
+        )
+        assert recorded == 0
+        assert tracker.percentile(1, 50) is None
+        assert tracker.series(1)["import"].newest_hour == T0 + timedelta(hours=2)
+
+    def test_new_hours_record_lag(self):
+        tracker = PublicationLagTracker()
+        tracker.observe(1, {"import": _points(0)}, T0 + timedelta(hours=2))
+        # Hours 1 and 2 first seen at 04:30 → ends at 02:00 / 03:00
+        now = T0 + timedelta(hours=4, minutes=30)
+        recorded = tracker.observe(1, {"import": _points(0, 1, 2)}, now)
+        assert recorded == 2
+        assert sorted(tracker.lags(1)) == [5400.0, 9000.0]
+        assert tracker.percentile(1, 50) == 5400.0
+        # Seen again: nothing new
+        assert tracker.observe(1, {"import": _points(1, 2)}, now) == 0
+
+    def test_series_and_meters_are_separate(self):
+        tracker = PublicationLagTracker()
+        tracker.observe(1, {"import": _points(0), "export": _points(0)}, T0)
+        tracker.observe(2, {"import": _points(0)}, T0)
+        now = T0 + timedelta(hours=3)
+        tracker.observe(1, {"import": _points(1), "export": []}, now)
+        assert tracker.lags(1) == [3600.0]
+        assert tracker.lags(2) == []
+        data = tracker.as_dict()
+        assert data["1"]["import"]["p50_min"] == 60.0
+        assert data["1"]["export"]["samples"] == 0
+
+    def test_sample_is_bounded(self):
+        tracker = PublicationLagTracker(sample_size=2)
+        tracker.observe(1, {"import": _points(0)}, T0)
+        tracker.observe(
+            1, {"import": _points(1, 2, 3)}, T0 + timedelta(hours=10)
+        )
+        assert len(tracker.lags(1)) == 2
+
+
+class TestUnpublishedHours:
+    """Null chart hours reach the tracker as unpublished, not as 0 kWh."""
+
+    @pytest.mark.asyncio
+    async def test_trailing_null_hours_are_not_first_seen(self, api):
+        api._meters_data = [
+            {"meter_point_id": "1", "obis_plus": "1.8.0", "zone_count": 1}
+        ]
+        today = datetime.now(TZ).date()
+        yesterday = datetime(
+            today.year, today.month, today.day, tzinfo=TZ
+        ) - timedelta(days=1)
+        published = 20  # Hours of yesterday with data; the rest is null
+
+        async def chart_points(meter_id, obis, timestamp, deadline=None):
+            day = datetime.fromtimestamp(timestamp / 1000, tz=TZ)
+            return [
+                {
+                    "tm": int((day.astimezone(UTC) + timedelta(hours=h)).timestamp() * 1000),
+                    "zones": [0.4]
+                    if day == yesterday and h < published
+                    else [None],
+                }
+                for h in range(24)
+            ]
+
+        api._get_chart_points = chart_points
+        tracker = PublicationLagTracker()
+
+        stats = await api.async_get_hourly_statistics("1", start_date=yesterday)
+        assert len(stats["import"]) == published
+        tracker.observe("1", stats, datetime.now(TZ))
+        assert tracker.series("1")["import"].newest_hour == yesterday.astimezone(
+            UTC
+        ) + timedelta(hours=published - 1)
+
+        # The next hour gets published: it is first seen now
+        published += 1
+        stats = await api.async_get_hourly_statistics("1", start_date=yesterday)
+        assert tracker.observe("1", stats, datetime.now(TZ)) == 1
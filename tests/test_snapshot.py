@@ -0,0 +1,57 @@
+"""Tests for the persisted coordinator snapshot."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.energa_mobile.snapshot import EnergaSnapshot
+
+METER = {
+    "meter_point_id": 123456,
+    "meter_serial": "30132815",
+    "total_plus": 26955.924,
+    "daily_pobor": 4.2,
+    "contract_date": date(2025, 6, 11),
+}
+
+
+class TestSnapshot:
+    """Round trip of the meter list through the store."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_restores_contract_date(self):
+        store = MagicMock()
+        snapshot = EnergaSnapshot(store)
+        snapshot.schedule_save([METER])
+
+        store.async_delay_save.assert_called_once()
+        saved = store.async_delay_save.call_args[0][0]()
+        assert saved["meters"][0]["contract_date"] == "2025-06-11"
+
+        store.async_load = AsyncMock(return_value=saved)
+        assert await EnergaSnapshot(store).async_load() == [METER]
+
+    @pytest.mark.asyncio
+    async def test_missing_snapshot(self):
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value=None)
+        assert await EnergaSnapshot(store).async_load() is None
+
+        store.async_load = AsyncMock(return_value={"meters": []})
+        assert await EnergaSnapshot(store).async_load() is None
+
+    @pytest.mark.asyncio
+    async def test_load_failure_is_ignored(self):
+        store = MagicMock()
+        store.async_load = AsyncMock(side_effect=ValueError("corrupt"))
+        assert await EnergaSnapshot(store).async_load() is None
+
+    @pytest.mark.asyncio
+    async def test_bad_contract_date_dropped(self):
+        store = MagicMock()
+        store.async_load = AsyncMock(
+            return_value={"meters": [{"meter_point_id": 1, "contract_date": "?"}]}
+        )
+        meters = await EnergaSnapshot(store).async_load()
+        assert meters[0]["contract_date"] is None
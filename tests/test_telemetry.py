@@ -0,0 +1,127 @@
+"""Tests for the per-endpoint HTTP telemetry."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.energa_mobile.const import CHART_ENDPOINT, DATA_ENDPOINT
+from custom_components.energa_mobile.telemetry import (
+    OTHER_ENDPOINT,
+    EndpointStats,
+    HttpTelemetry,
+)
+from tests.conftest import make_mock_response
+
+
+class TestEndpointStats:
+    """Counters, percentiles and error rate."""
+
+    def test_percentiles_nearest_rank(self):
+        stats = EndpointStats()
+        for latency in range(1, 101):
+            stats.record(latency / 100, status=200)
+        assert stats.percentile(50) == 0.5
+        assert stats.percentile(90) == 0.9
+        assert stats.percentile(99) == 0.99
+        assert stats.error_rate == 0
+
+    def test_empty(self):
+        stats = EndpointStats()
+        assert stats.percentile(90) is None
+        assert stats.error_rate is None
+
+    def test_sample_is_bounded(self):
+        stats = EndpointStats(sample_size=3)
+        for latency in (10.0, 10.0, 0.1, 0.1, 0.1):
+            stats.record(latency, status=200)
+        assert stats.percentile(99) == 0.1
+        assert stats.requests == 5
+        # Histogram is cumulative, not limited to the sample
+        assert stats.histogram()["le_0.25s"] == 3
+        assert stats.histogram()["le_10s"] == 2
+
+    def test_errors_and_status_codes(self):
+        stats = EndpointStats()
+        stats.record(0.1, status=200)
+        stats.record(0.1, status=503)
+        stats.record(5.0, error="TimeoutError")
+        stats.record(0.1, status=200)
+        assert stats.error_rate == 0.5
+        data = stats.as_dict()
+        assert data["status_codes"] == {"200": 2, "503": 1}
+        assert data["exceptions"] == {"TimeoutError": 1}
+
+
+class TestHttpTelemetry:
+    """Endpoint mapping and trace hooks on a real session."""
+
+    def test_endpoint_for(self):
+        assert HttpTelemetry.endpoint_for(f"/dp{CHART_ENDPOINT}") == "mchart"
+        assert HttpTelemetry.endpoint_for(f"/dp{DATA_ENDPOINT}") == "user_data"
+        assert HttpTelemetry.endpoint_for("/dp/other") == OTHER_ENDPOINT
+
+    def test_record_retry(self):
+        telemetry = HttpTelemetry()
+        telemetry.record_retry(CHART_ENDPOINT)
+        assert telemetry.stats("mchart").retries == 1
+        assert telemetry.as_dict()["endpoints"]["mchart"]["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_trace_hooks_record_requests(self):
+        async def chart(request):
+            return web.json_response({"response": {"mainChart": []}})
+
+        async def data(request):
+            return web.Response(status=503)
+
+        app = web.Application()
+        app.router.add_get(f"/dp{CHART_ENDPOINT}", chart)
+        app.router.add_get(f"/dp{DATA_ENDPOINT}", data)
+        telemetry = HttpTelemetry()
+
+        async with TestServer(app) as server:
+            async with aiohttp.ClientSession(
+                trace_configs=[telemetry.trace_config()]
+            ) as session:
+                async with session.get(server.make_url(f"/dp{CHART_ENDPOINT}")) as r:
+                    body = await r.read()
+                async with session.get(server.make_url(f"/dp{DATA_ENDPOINT}")) as r:
+                    assert r.status == 503
+
+        chart_stats = telemetry.stats("mchart")
+        assert chart_stats.requests == 1
+        assert chart_stats.status_codes[200] == 1
+        assert chart_stats.response_bytes == len(body)
+        assert chart_stats.percentile(50) is not None
+        assert telemetry.stats("user_data").error_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_connection_error_recorded(self):
+        telemetry = HttpTelemetry()
+        async with aiohttp.ClientSession(
+            trace_configs=[telemetry.trace_config()]
+        ) as session:
+            with pytest.raises(aiohttp.ClientError):
+                # Port 1 on localhost: connection refused
+                await session.get(f"http://127.0.0.1:1/dp{CHART_ENDPOINT}")
+        stats = telemetry.stats("mchart")
+        assert stats.requests == 1
+        assert stats.errors == 1
+        assert sum(stats.exceptions.values()) == 1
+
+
+class TestApiRetryTelemetry:
+    """Retries performed by _api_request are counted per endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_retry_counted(self, api, mock_session, monkeypatch):
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        mock_session.get = MagicMock(
+            side_effect=[make_mock_response(503, {}), make_mock_response(200, {})]
+        )
+        await api._api_get(DATA_ENDPOINT)
+        assert api.telemetry.stats("user_data").retries == 1
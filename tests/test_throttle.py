@@ -0,0 +1,456 @@
+"""Tests for request throttling primitives."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.energa_mobile.api import (
+    EnergaCircuitOpenError,
+    EnergaConnectionError,
+    request_priority,
+)
+from custom_components.energa_mobile.const import PRIORITY_BACKFILL, PRIORITY_LIVE
+from custom_components.energa_mobile.throttle import (
+    AdaptiveConcurrency,
+    CircuitBreaker,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+from tests.conftest import make_mock_response
+
+_real_sleep = asyncio.sleep
+
+
+class _FakeTime:
+    """Monotonic clock advanced by the patched asyncio.sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake = _FakeTime()
+    monkeypatch.setattr(asyncio, "sleep", fake.sleep)
+    return fake
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket pacing."""
+
+    @pytest.mark.asyncio
+    async def test_burst_passes_without_waiting(self, fake_time):
+        bucket = TokenBucket(rate=2.0, burst=3, clock=fake_time)
+        for _ in range(3):
+            await bucket.acquire()
+        assert fake_time.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_paces_to_rate_after_burst(self, fake_time):
+        bucket = TokenBucket(rate=2.0, burst=1, clock=fake_time)
+        for _ in range(5):
+            await bucket.acquire()
+        # 1 free token, then 4 more at 2/s → 2 s total
+        assert fake_time.now == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_refills_while_idle(self, fake_time):
+        bucket = TokenBucket(rate=1.0, burst=2, clock=fake_time)
+        await bucket.acquire()
+        await bucket.acquire()
+        fake_time.now += 10  # Idle: refills to capacity, not beyond
+        await bucket.acquire()
+        await bucket.acquire()
+        assert fake_time.sleeps == []
+        await bucket.acquire()
+        assert fake_time.sleeps == [pytest.approx(1.0)]
+
+
+class TestTokenBucketPriority:
+    """Live requests jump queued backfill, which still keeps moving."""
+
+    async def _grant_order(self, bucket, callers):
+        order = []
+
+        async def _call(name, priority):
+            await bucket.acquire(priority)
+            order.append(name)
+
+        await bucket.acquire()  # Drain the burst so everyone queues
+        await asyncio.gather(*(_call(n, p) for n, p in callers))
+        return order
+
+    @pytest.mark.asyncio
+    async def test_live_served_before_queued_backfill(self, fake_time):
+        bucket = TokenBucket(rate=1.0, burst=1, clock=fake_time)
+        callers = [(f"b{i}", PRIORITY_BACKFILL) for i in range(3)]
+        callers += [(f"l{i}", PRIORITY_LIVE) for i in range(3)]
+
+        order = await self._grant_order(bucket, callers)
+
+        assert order == ["l0", "l1", "l2", "b0", "b1", "b2"]
+
+    @pytest.mark.asyncio
+    async def test_backfill_not_starved(self, fake_time):
+        bucket = TokenBucket(rate=1.0, burst=1, clock=fake_time, starvation_limit=2)
+        callers = [("b0", PRIORITY_BACKFILL)]
+        callers += [(f"l{i}", PRIORITY_LIVE) for i in range(5)]
+
+        order = await self._grant_order(bucket, callers)
+
+        assert order == ["l0", "l1", "b0", "l2", "l3", "l4"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self, fake_time):
+        bucket = TokenBucket(rate=1.0, burst=1, clock=fake_time)
+        await bucket.acquire()
+        waiter = asyncio.ensure_future(bucket.acquire(PRIORITY_BACKFILL))
+        await _real_sleep(0)
+        waiter.cancel()
+        await bucket.acquire()
+        assert bucket.waiting() == 0
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delta_seconds(self):
+        assert parse_retry_after("30") == 30.0
+
+    def test_http_date(self):
+        now = datetime(2026, 3, 10, 12, 0, 0, tzinfo=timezone.utc)
+        value = "Tue, 10 Mar 2026 12:00:45 GMT"
+        assert parse_retry_after(value, now=now) == 45.0
+
+    def test_past_date_is_zero(self):
+        now = datetime(2026, 3, 10, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after("Tue, 10 Mar 2026 11:00:00 GMT", now=now) == 0.0
+
+    def test_missing_or_garbage(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryPolicy:
+    """Tests for jittered exponential backoff and the retry budget."""
+
+    def test_exponential_with_jitter_bounds(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=30.0, rng=lambda: 1.0)
+        assert [policy.next_delay(n, 0) for n in range(4)] == [1.0, 2.0, 4.0, 8.0]
+        low = RetryPolicy(base_delay=1.0, max_delay=30.0, rng=lambda: 0.0)
+        assert [low.next_delay(n, 0) for n in range(4)] == [0.5, 1.0, 2.0, 4.0]
+
+    def test_max_delay_caps_backoff(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, max_retries=10, budget=1000, rng=lambda: 1.0)
+        assert policy.next_delay(8, 0) == 5.0
+
+    def test_retry_after_raises_delay_but_is_capped(self):
+        policy = RetryPolicy(max_retry_after=60.0, budget=1000, rng=lambda: 0.0)
+        assert policy.next_delay(0, 0, "20") == 20.0
+        assert policy.next_delay(0, 0, "3600") == 60.0
+
+    def test_retry_count_exhausted(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.next_delay(2, 0) is None
+
+    def test_time_budget_exhausted(self):
+        policy = RetryPolicy(budget=10.0, rng=lambda: 1.0)
+        assert policy.next_delay(0, 9.5) is None
+        assert policy.next_delay(0, 5.0) == 1.0
+
+
+class TestApiUsesLimiter:
+    """Every _api_get request draws from the shared bucket."""
+
+    @pytest.mark.asyncio
+    async def test_api_get_acquires_token(self, api, mock_session):
+        api._rate_limiter = MagicMock()
+        api._rate_limiter.acquire = AsyncMock()
+        mock_session.get = MagicMock(return_value=make_mock_response(200, {}))
+
+        await api._api_get("/resources/user/data")
+        await api._api_get("/resources/user/data")
+
+        assert api._rate_limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_request_priority_tags_requests(self, api, mock_session):
+        api._rate_limiter = MagicMock()
+        api._rate_limiter.acquire = AsyncMock()
+        mock_session.get = MagicMock(return_value=make_mock_response(200, {}))
+
+        with request_priority(PRIORITY_BACKFILL):
+            await api._api_get("/resources/mchart", {"day": 1})
+        await api._api_get("/resources/mchart", {"day": 2})
+
+        priorities = [c.args[0] for c in api._rate_limiter.acquire.await_args_list]
+        assert priorities == [PRIORITY_BACKFILL, PRIORITY_LIVE]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Tests for open / half-open / closed transitions."""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=60, clock=_Clock())
+        breaker.record_failure("HTTP 503")
+        breaker.record_failure("HTTP 503")
+        assert breaker.allow_request()
+        breaker.record_failure("HTTP 503")
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=_Clock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_single_probe_after_cooldown(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=60, clock=clock)
+        breaker.record_failure()
+        clock.now = 59
+        assert not breaker.allow_request()
+        clock.now = 60
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # Probe already in flight
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=60, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 60
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.retry_in() == 60
+
+    def test_lost_probe_frees_slot_after_cooldown(self):
+        clock = _Clock()
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=60, clock=clock)
+        breaker.record_failure()
+        clock.now = 60
+        assert breaker.allow_request()
+        clock.now = 120
+        assert breaker.allow_request()
+
+    def test_listeners_notified_on_transition(self):
+        breaker = CircuitBreaker(failure_threshold=1, clock=_Clock())
+        calls = []
+        remove = breaker.add_listener(lambda: calls.append(breaker.state))
+        breaker.record_failure()
+        breaker.record_success()
+        remove()
+        breaker.record_failure()
+        assert calls == [CircuitBreaker.OPEN, CircuitBreaker.CLOSED]
+
+
+class TestApiCircuitBreaker:
+    """_api_get fails fast while the circuit is open."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_network(self, api, mock_session, monkeypatch):
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        api._circuit = CircuitBreaker(failure_threshold=2, cooldown=300)
+        api._rate_limiter = TokenBucket(rate=1000, burst=100)
+        mock_session.get = MagicMock(
+            side_effect=lambda *a, **kw: make_mock_response(503, {})
+        )
+
+        for _ in range(2):
+            with pytest.raises(EnergaConnectionError, match="HTTP 503"):
+                await api._api_get("/resources/mchart")
+        calls = mock_session.get.call_count
+
+        with pytest.raises(EnergaCircuitOpenError):
+            await api._api_get("/resources/mchart")
+        assert mock_session.get.call_count == calls
+
+    @pytest.mark.asyncio
+    async def test_auth_response_counts_as_backend_up(self, api, mock_session):
+        """A 401 means Energa answered — the probe closes the circuit."""
+        clock = _Clock()
+        api._circuit = CircuitBreaker(failure_threshold=1, cooldown=60, clock=clock)
+        api._circuit.record_failure()
+        clock.now = 60
+        api._async_relogin = AsyncMock()
+        mock_session.get = MagicMock(
+            side_effect=[
+                make_mock_response(401, {}),
+                make_mock_response(200, {"response": "ok"}),
+            ]
+        )
+
+        assert await api._api_get("/resources/mchart") == {"response": "ok"}
+        assert api._circuit.state == CircuitBreaker.CLOSED
+
+
+class TestAdaptiveConcurrency:
+    """Additive increase on fast successes, multiplicative decrease on pushback."""
+
+    def test_additive_increase_up_to_ceiling(self):
+        limiter = AdaptiveConcurrency(max_limit=4, initial=2, latency_target=1.0)
+        for _ in range(3):  # ~1 window of fast completions → +1
+            limiter._in_flight += 1
+            limiter.release(0.1)
+        assert limiter.limit == 3
+        for _ in range(50):
+            limiter._in_flight += 1
+            limiter.release(0.1)
+        assert limiter.limit == 4
+
+    def test_pushback_halves_once_per_window(self):
+        limiter = AdaptiveConcurrency(max_limit=8, initial=8)
+        for _ in range(3):  # A burst of 429s from requests of the same window
+            limiter._in_flight += 1
+            limiter.release(AdaptiveConcurrency.PUSHBACK)
+        assert limiter.limit == 4
+
+    def test_slow_success_counts_as_congestion(self):
+        limiter = AdaptiveConcurrency(max_limit=8, initial=4, latency_target=1.0)
+        limiter._in_flight += 1
+        limiter.release(5.0)
+        assert limiter.limit == 2
+
+    def test_never_below_minimum(self):
+        limiter = AdaptiveConcurrency(max_limit=8, initial=1)
+        limiter._in_flight += 1
+        limiter.release(AdaptiveConcurrency.PUSHBACK)
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_free_slot(self):
+        limiter = AdaptiveConcurrency(max_limit=2, initial=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await _real_sleep(0)
+        assert not waiter.done()
+        limiter.release()
+        await waiter
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_live_waiter_served_before_backfill(self):
+        limiter = AdaptiveConcurrency(max_limit=1, initial=1)
+        await limiter.acquire(PRIORITY_BACKFILL)
+        order = []
+
+        async def take(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        waiters = [
+            asyncio.ensure_future(take(f"bf{i}", PRIORITY_BACKFILL))
+            for i in range(3)
+        ]
+        await _real_sleep(0)
+        waiters.append(asyncio.ensure_future(take("live", PRIORITY_LIVE)))
+        await _real_sleep(0)
+        assert limiter.waiting(PRIORITY_BACKFILL) == 3
+        for _ in range(4):
+            limiter.release()
+            await _real_sleep(0)
+        await asyncio.gather(*waiters)
+        assert order == ["live", "bf0", "bf1", "bf2"]
+
+    def test_restore_clamps_to_range(self):
+        limiter = AdaptiveConcurrency(max_limit=4)
+        limiter.restore(99)
+        assert limiter.limit == 4
+
+
+class TestApiChartConcurrency:
+    """Chart requests feed the AIMD limiter; the limit is persisted."""
+
+    @pytest.mark.asyncio
+    async def test_live_chart_request_overtakes_backfill(self, api, mock_session):
+        """Backfill holds and queues for every slot; a live call goes next."""
+        api._chart_limiter = AdaptiveConcurrency(max_limit=2, initial=2)
+        api._rate_limiter = TokenBucket(rate=1000, burst=100)
+        gate = asyncio.Event()
+        finished = []
+
+        def slow_response(*_args, params=None, **_kwargs):
+            ctx = make_mock_response(200, {"response": "ok"})
+            response = ctx.__aenter__.return_value
+
+            async def json():
+                await gate.wait()
+                return {"response": params["name"]}
+
+            response.json = json
+            return ctx
+
+        mock_session.get = MagicMock(side_effect=slow_response)
+
+        async def request(name, priority):
+            with request_priority(priority):
+                await api._api_get("/resources/mchart", {"name": name})
+            finished.append(name)
+
+        tasks = [
+            asyncio.ensure_future(request(f"bf{i}", PRIORITY_BACKFILL))
+            for i in range(8)
+        ]
+        for _ in range(5):
+            await _real_sleep(0)
+        assert api.chart_limiter.in_flight == 2
+        tasks.append(asyncio.ensure_future(request("LIVE", PRIORITY_LIVE)))
+        for _ in range(5):
+            await _real_sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+        # Only the two backfills already holding a slot finish before it
+        assert finished.index("LIVE") == 2
+
+    @pytest.mark.asyncio
+    async def test_429_lowers_chart_limit(self, api, mock_session, monkeypatch):
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        api._chart_limiter = AdaptiveConcurrency(max_limit=8, initial=8)
+        api._saved_chart_limit = 8
+        mock_session.get = MagicMock(
+            side_effect=[
+                make_mock_response(429, {}),
+                make_mock_response(200, {"response": "ok"}),
+            ]
+        )
+
+        await api._api_get("/resources/mchart")
+
+        assert api.chart_limiter.limit == 4
+        assert api.chart_limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_learned_limit_restored_from_state(self, api):
+        api._state_store = MagicMock()
+        api._state_store.async_load = AsyncMock(return_value={"chart_concurrency": 5})
+
+        await api._async_restore_state()
+
+        assert api.chart_limiter.limit == min(5, api.chart_limiter.max_limit)
+        assert api.export_state()["chart_concurrency"] == api.chart_limiter.limit
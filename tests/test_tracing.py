@@ -0,0 +1,88 @@
+"""Tests for coordinator cycle tracing."""
+
+import pytest
+
+from custom_components.energa_mobile.tracing import CycleTracer
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCycleTracer:
+    """Spans are recorded per cycle and only the last cycles are kept."""
+
+    def test_spans_timeline(self):
+        clock = _Clock()
+        tracer = CycleTracer(clock=clock)
+        with tracer.cycle():
+            with tracer.span("meter_refresh"):
+                clock.now += 1.5
+            with tracer.span("hourly_fetch", meter=123):
+                clock.now += 240
+        cycle = tracer.as_dict()[0]
+        assert cycle["outcome"] == "ok"
+        assert cycle["duration_s"] == 241.5
+        assert cycle["slowest_span"] == "hourly_fetch"
+        assert cycle["spans"][1] == {
+            "name": "hourly_fetch",
+            "start_s": 1.5,
+            "duration_s": 240,
+            "meter": 123,
+        }
+
+    def test_failed_span_and_cycle(self):
+        tracer = CycleTracer(clock=_Clock())
+        with pytest.raises(TimeoutError):
+            with tracer.cycle():
+                with tracer.span("session_start"):
+                    raise TimeoutError
+        cycle = tracer.as_dict()[0]
+        assert cycle["outcome"] == "TimeoutError"
+        assert cycle["spans"][0]["error"] == "TimeoutError"
+
+    def test_late_spans_attach_to_last_cycle(self):
+        """Statistics imports run after the update returns."""
+        clock = _Clock()
+        tracer = CycleTracer(clock=clock)
+        with tracer.span("statistics_import"):
+            pass  # Before the first cycle: not recorded
+        with tracer.cycle():
+            clock.now += 2
+        clock.now += 1
+        with tracer.span("statistics_import", entity="sensor.x"):
+            clock.now += 0.5
+        cycle = tracer.as_dict()[0]
+        assert cycle["duration_s"] == 2
+        assert cycle["spans"] == [
+            {
+                "name": "statistics_import",
+                "start_s": 3,
+                "duration_s": 0.5,
+                "entity": "sensor.x",
+            }
+        ]
+
+    def test_keeps_last_cycles(self):
+        tracer = CycleTracer(max_cycles=2, clock=_Clock())
+        for _ in range(3):
+            with tracer.cycle():
+                pass
+        assert len(tracer.as_dict()) == 2
+
+    def test_span_cap(self, monkeypatch):
+        import custom_components.energa_mobile.tracing as tracing
+
+        monkeypatch.setattr(tracing, "TRACE_MAX_SPANS", 2)
+        tracer = CycleTracer(clock=_Clock())
+        with tracer.cycle():
+            for _ in range(3):
+                with tracer.span("last_stats"):
+                    pass
+        cycle = tracer.as_dict()[0]
+        assert len(cycle["spans"]) == 2
+        assert cycle["dropped_spans"] == 1
@@ -0,0 +1,53 @@
+"""Tests for the aiohttp transport profile."""
+
+import aiohttp
+import pytest
+
+from custom_components.energa_mobile.const import (
+    CONF_FETCH_CONCURRENCY,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+    HTTP_CONNECTION_HEADROOM,
+)
+from custom_components.energa_mobile.transport import (
+    TransportProfile,
+    create_client_session,
+)
+
+
+class TestTransportProfile:
+    """Profile values derived from config entry options."""
+
+    def test_defaults_from_empty_options(self):
+        profile = TransportProfile.from_options({})
+        assert profile == TransportProfile()
+        assert profile.request_timeout == DEFAULT_REQUEST_TIMEOUT
+
+    def test_pool_follows_fetch_concurrency(self):
+        profile = TransportProfile.from_options(
+            {CONF_FETCH_CONCURRENCY: 6, CONF_REQUEST_TIMEOUT: 45}
+        )
+        assert profile.limit_per_host == 6 + HTTP_CONNECTION_HEADROOM
+        assert profile.timeout().total == 45
+        assert profile.timeout().connect <= 45
+
+    def test_compression_header(self):
+        assert TransportProfile().headers() == {"Accept-Encoding": "gzip, deflate"}
+        assert TransportProfile(compression=False).headers() == {}
+
+
+class TestCreateClientSession:
+    """Sessions are built with the profile's connector and timeout."""
+
+    @pytest.mark.asyncio
+    async def test_session_uses_profile(self):
+        profile = TransportProfile(limit_per_host=4, request_timeout=20)
+        session = create_client_session(profile)
+        try:
+            assert isinstance(session.connector, aiohttp.TCPConnector)
+            assert session.connector.limit == 4
+            assert session.connector.limit_per_host == 4
+            assert session.timeout.total == 20
+            assert session.headers["Accept-Encoding"] == "gzip, deflate"
+        finally:
+            await session.close()
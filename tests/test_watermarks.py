@@ -0,0 +1,118 @@
+"""Tests for the persisted statistics watermarks."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.energa_mobile.watermarks import StatisticsWatermarks
+
+T0 = datetime(2026, 3, 10, 12, 0, tzinfo=UTC)
+STAT = "sensor.energa_1_panel_energia_zuzycie"
+
+
+class TestStatisticsWatermarks:
+    """Write-through last rows; the recorder only fills gaps."""
+
+    def test_reconcile_then_advance(self):
+        marks = StatisticsWatermarks()
+        assert marks.to_verify([STAT]) == [STAT]
+        marks.reconcile([STAT], {STAT: {"start": T0.timestamp(), "sum": 10.0}})
+        assert marks.to_verify([STAT]) == []
+
+        marks.advance(STAT, T0 + timedelta(hours=2), 11.5, 9.2)
+        assert marks.get(STAT) == {
+            "start": (T0 + timedelta(hours=2)).timestamp(),
+            "sum": 11.5,
+            "cost_sum": 9.2,
+        }
+        # An older import never moves the watermark back
+        marks.advance(STAT, T0, 3.0)
+        assert marks.get(STAT)["sum"] == 11.5
+
+    def test_invalidate(self):
+        marks = StatisticsWatermarks()
+        marks.advance(STAT, T0, 1.0)
+        marks.advance("sensor.other", T0, 2.0)
+        marks.invalidate([STAT])
+        assert marks.to_verify([STAT, "sensor.other"]) == [STAT]
+        marks.invalidate()
+        assert marks.rows == {}
+
+    def test_series_without_statistics_stays_unverified(self):
+        marks = StatisticsWatermarks()
+        marks.reconcile([STAT], {})
+        assert marks.get(STAT) is None
+        assert marks.to_verify([STAT]) == [STAT]
+
+    def test_manual_clear_rechecked_until_recorder_is_empty(self):
+        marks = StatisticsWatermarks()
+        marks.advance(STAT, T0, 10.0)
+        marks.expect_manual_clear([STAT])
+        row = {STAT: {"start": T0.timestamp(), "sum": 10.0}}
+        # Not cleared yet: the recorder's row is used, and asked again
+        marks.reconcile([STAT], row)
+        assert marks.get(STAT)["sum"] == 10.0
+        assert marks.to_verify([STAT]) == [STAT]
+        # Cleared: the watermark goes, the series is imported afresh
+        marks.reconcile([STAT], {})
+        assert marks.get(STAT) is None
+        assert marks.as_dict()["manual_clear_pending"] == []
+
+    @pytest.mark.asyncio
+    async def test_persisted_round_trip(self):
+        store = MagicMock()
+        marks = StatisticsWatermarks(store)
+        marks.advance(STAT, T0, 4.0, 3.2)
+        store.async_delay_save.assert_called_once()
+        saved = store.async_delay_save.call_args[0][0]()
+
+        store.async_load = AsyncMock(return_value=saved)
+        restored = StatisticsWatermarks(store)
+        await restored.async_load()
+        assert restored.get(STAT)["sum"] == 4.0
+        assert restored.as_dict()["marks"][STAT]["start"] == T0.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_cold_start_checks_each_loaded_mark_once(self):
+        store = MagicMock()
+        store.async_load = AsyncMock(
+            return_value={
+                "marks": {
+                    STAT: {"start": T0.timestamp(), "sum": 4.0, "cost_sum": 3.2},
+                    "sensor.cleared": {"start": T0.timestamp(), "sum": 9.0},
+                    "sensor.behind": {"start": T0.timestamp(), "sum": 7.0},
+                }
+            }
+        )
+        marks = StatisticsWatermarks(store)
+        await marks.async_load()
+        ids = [STAT, "sensor.cleared", "sensor.behind"]
+        assert marks.to_verify(ids) == ids
+
+        earlier = (T0 - timedelta(hours=5)).timestamp()
+        marks.reconcile(
+            ids,
+            {
+                STAT: {"start": T0.timestamp(), "sum": 4.0},
+                "sensor.behind": {"start": earlier, "sum": 6.0},
+            },
+        )
+        # Matching mark kept, cleared one dropped, stale one rolled back
+        assert marks.get(STAT)["cost_sum"] == 3.2
+        assert marks.get("sensor.cleared") is None
+        assert marks.get("sensor.behind") == {
+            "start": earlier,
+            "sum": 6.0,
+            "cost_sum": None,
+        }
+        assert marks.to_verify(ids) == ["sensor.cleared"]
+        assert marks.as_dict()["mismatches"] == 2
+
+    @pytest.mark.asyncio
+    async def test_load_failure_is_cold_start(self):
+        store = MagicMock()
+        store.async_load = AsyncMock(side_effect=ValueError("corrupt"))
+        marks = StatisticsWatermarks(store)
+        await marks.async_load()
+        assert marks.to_verify([STAT]) == [STAT]